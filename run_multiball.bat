@@ -27,6 +27,11 @@ if "%1"=="--dl" (
     shift
     goto parse_args
 )
+if "%1"=="--im" (
+    set target_module=src.multiball.importer
+    shift
+    goto parse_args
+)
 if "%1"=="--pl" (
     set target_module=src.multiball.plotter
     shift
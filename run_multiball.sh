@@ -20,6 +20,10 @@ while [[ $# -gt 0 ]]; do
             target_module="src.multiball.downloader"
             shift
             ;;
+        --im)
+            target_module="src.multiball.importer"
+            shift
+            ;;
         --pl)
             target_module="src.multiball.plotter"
             shift
@@ -29,11 +33,12 @@ while [[ $# -gt 0 ]]; do
             shift
             ;;
         --help|-h)
-            echo "Usage: $0 [--db|--dl|--pl|--sk] [module_arguments]"
+            echo "Usage: $0 [--db|--dl|--im|--pl|--sk] [module_arguments]"
             echo ""
             echo "Flags:"
             echo "  --db    Run database population module (default)"
             echo "  --dl    Run downloader module"
+            echo "  --im    Run statcast importer module"
             echo "  --pl    Run plotter module"
             echo "  --sk    Run skeeter module"
             echo ""
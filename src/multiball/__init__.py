@@ -12,11 +12,19 @@ from .libmb import configurator
 from .libmb import constants
 from .libmb import dbconnector
 from .libmb import func_baseball
+from .libmb import func_cache
 from .libmb import func_database
 from .libmb import func_plot
 from .libmb import func_skeet
+from .libmb import func_statcast
+from .libmb import func_video
+from .libmb import gamefeed
+from .libmb import httpclient
 from .libmb import logger
+from .libmb import plotqueue
+from .libmb import ratelimiter
 from .libmb import sqlitemgr
+from .libmb import videoqueue
 
 # Package-level variables
 __all__ = [
@@ -26,9 +34,17 @@ __all__ = [
     "constants",
     "dbconnector",
     "func_baseball",
+    "func_cache",
     "func_database",
     "func_plot",
     "func_skeet",
+    "func_statcast",
+    "func_video",
+    "gamefeed",
+    "httpclient",
     "logger",
+    "plotqueue",
+    "ratelimiter",
     "sqlitemgr",
+    "videoqueue",
 ]
@@ -11,6 +11,7 @@ import pprint
 import sys
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -22,7 +23,9 @@ from .libmb import func_database as dbmgr
 
 from .libmb.cmdparser import CmdParser
 from .libmb.configurator import ConfigReader
+from .libmb.gamefeed import GameFeed
 from .libmb.logger import PrintLogger
+from .libmb.ratelimiter import TokenBucket
 
 
 ## -------------------------------------------------------------------------- ##
@@ -35,9 +38,13 @@ config = ConfigReader(
 )
 
 #fmt: off
+all_modes      = False
+backfill       = False
 backward       = False
+concurrency    = int(config.get("client_parameters", "concurrency"))
 mode           = "hbp"
 num_days       = 1
+queue_plays    = False
 sleep_time     = float(config.get("client_parameters", "sleep_time"))
 start_date     = datetime.strftime(datetime.now() - timedelta(days=1), "%Y-%m-%d")
 test_mode      = bool(int(config.get("operations", "test_mode")))
@@ -52,11 +59,38 @@ parser = CmdParser(
 )
 parser.add_arguments_from_dict(
     {
+        ("-a", "--all-modes"): {
+            "action": "store_true",
+            "default": all_modes,
+            "help": "Populate every mode's database from a single pass over each game",
+        },
         ("-b", "--backward"): {
             "action": "store_true",
             "default": backward,
             "help": "Go backward in time instead of the default forward",
         },
+        ("-c", "--concurrency"): {
+            "type": int,
+            "default": concurrency,
+            "help": "Number of games to download at once. Defaults to '%(default)s'.",
+        },
+        "--season": {
+            "type": int,
+            "default": None,
+            "help": "Backfill a whole season (e.g. 2024). Resumable; games already ingested get skipped.",
+        },
+        "--from": {
+            "dest": "from_date",
+            "type": bsc.parse_date_string,
+            "default": None,
+            "help": "Backfill from this date ('2025-04-01' format). Resumable, like --season.",
+        },
+        "--to": {
+            "dest": "to_date",
+            "type": bsc.parse_date_string,
+            "default": None,
+            "help": "Last date of a --from backfill. Defaults to yesterday.",
+        },
         ("-d", "--num-days"): {
             "type": int,
             "default": num_days,
@@ -64,10 +98,14 @@ parser.add_arguments_from_dict(
         },
         ("-m", "--mode"): {
             "type": str,
-            "required": True,
             "choices": ["derp", "hbp", "triples"],
-            "default": mode,
-            "help": "Specify which baseball mode to populate",
+            "default": None,
+            "help": "Specify which baseball mode to populate (required unless --all-modes)",
+        },
+        ("-q", "--queue"): {
+            "action": "store_true",
+            "default": queue_plays,
+            "help": "Leave backfilled plays pending for the downloader/plotter/skeeter instead of marking them done",
         },
         ("-s", "--start-date"): {
             "type": bsc.parse_date_string,
@@ -81,12 +119,46 @@ args = parser.parse_args()
 ## Now pull config and command line action together.
 if args.get("backward"):
     backward = True
-if args.get("mode"):
+if args.get("concurrency") and args.get("concurrency") > 0:
+    concurrency = args.get("concurrency")
+if args.get("all_modes"):
+    all_modes = True
+    mode = "all"
+elif args.get("mode"):
     mode = args.get("mode")
+else:
+    parser.parser.error("one of the arguments -m/--mode -a/--all-modes is required")
+modes = list(const.MODE_EVENTS) if all_modes else [mode]
 if args.get("num_days") and num_days > 0:
     num_days = args.get("num_days")
 if args.get("start_date"):
     start_date = args.get("start_date")
+if args.get("queue"):
+    queue_plays = True
+if args.get("season") or args.get("from_date") or args.get("to_date"):
+    ## Backfills always run forward over a fixed window, and never past
+    ## yesterday since today's games aren't done yet.
+    if args.get("season") and (args.get("from_date") or args.get("to_date")):
+        parser.parser.error("argument --season: not allowed with --from/--to")
+    yesterday = datetime.strftime(datetime.now() - timedelta(days=1), "%Y-%m-%d")
+    if args.get("season"):
+        from_date = f"{args.get('season')}-{const.MLB_SEASON_FIRST_DAY}"
+        to_date = f"{args.get('season')}-{const.MLB_SEASON_LAST_DAY}"
+    elif args.get("from_date"):
+        from_date = str(args.get("from_date"))
+        to_date = str(args.get("to_date") or yesterday)
+    else:
+        parser.parser.error("argument --to: requires --from")
+    to_date = min(to_date, yesterday)
+    if to_date < from_date:
+        parser.parser.error(f"nothing to backfill between {from_date} and {to_date}")
+
+    backfill = True
+    backward = False
+    start_date = from_date
+    num_days = (
+        datetime.strptime(to_date, "%Y-%m-%d") - datetime.strptime(from_date, "%Y-%m-%d")
+    ).days + 1
 if args.get("test_mode"):
     config.set("operations", "test_mode", "1")
     test_mode = True
@@ -108,12 +180,54 @@ if not args.get("nolog"):
     )
 
 
+# -------------------------------------------------------------------------- ##
+# GAME INGESTION
+# -------------------------------------------------------------------------- ##
+
+
+def ingest_game(game: dict, rate_limiter: TokenBucket) -> tuple:
+    """
+    Downloads one game's live feed and pulls the game details and the events
+    for every mode we're populating out of it. Runs on the worker threads, so
+    it doesn't touch the database or print; main() does all the writing and
+    prints the warnings this hands back.
+
+    Returns (game_deets, events_by_mode, warnings, feed_loaded). If the
+    feed never loads, feed_loaded is False, game_deets is None and every
+    mode's event list is empty.
+    """
+    warnings = []
+
+    ## One live feed download per game, shared by both calls. A failed
+    ## download gets one more try, and that try waits for its own token too.
+    game_feed = GameFeed(game["gamePk"], double_verbose)
+    for attempt in range(2):
+        rate_limiter.acquire()
+        try:
+            game_feed.load()
+            break
+        except Exception as e:
+            warnings.append(
+                f"⚠️  Live feed for game {game['gamePk']} failed (try {attempt + 1} of 2): {e}"
+            )
+
+    if not game_feed.is_loaded():
+        return None, {event_mode: [] for event_mode in modes}, warnings, False
+
+    game_deets = bb.get_mlb_game_deets(game, double_verbose, game_feed)
+    ## Every play gets checked against every mode's events in one walk over
+    ## the feed, so --all-modes costs the same single download as one mode.
+    events_by_mode = bb.get_mlb_events_by_mode(modes, game, double_verbose, game_feed)
+    return game_deets, events_by_mode, warnings, True
+
+
 # -------------------------------------------------------------------------- ##
 # MAIN ACTION
 # -------------------------------------------------------------------------- ##
 
 
 def main(start_date: Optional[str] = None) -> int:
+    executor = None
     try:
         print()
 
@@ -130,90 +244,213 @@ def main(start_date: Optional[str] = None) -> int:
 
         ## First check if the database file already exists. If it doesn't,
         ## create it, then create the table.
-        db_create_result = False
-        db_definition = dbmgr.get_table_definition(mode, verbose)
-        if os.path.exists(bsc.sanitize_path(db_definition["filename"])):
-            print(f"💾 '{mode}' database file:  {db_definition["filename"]}")
-        else:
+        for db_mode in modes:
+            db_create_result = False
+            db_definition = dbmgr.get_table_definition(db_mode, verbose)
+            if os.path.exists(bsc.sanitize_path(db_definition["filename"])):
+                print(f"💾 '{db_mode}' database file:  {db_definition["filename"]}")
+            else:
+                print(
+                    f"‼️ No database file exists for '{db_mode}'. Creating '{db_definition["filename"]}'..."
+                )
+                db_create_result = dbmgr.create_database(db_mode, verbose)
+                if db_create_result:
+                    print(f"💾 '{db_definition["filename"]}' has been created.")
+
+            ## Always run this, even for a database that's already there; it
+            ## only adds whatever table/indexes are missing.
+            db_create_result = dbmgr.create_database(db_mode, verbose)
+
+            if db_create_result:
+                print(f"💾 '{db_mode}' database table: {db_definition["tablename"]}")
+            else:
+                raise Exception(
+                    f"❌ Database file/table is not in a condition for writing!"
+                )
+            print()
+
+        ## Now start in on parsing out baseball events based on mode.
+        ## Pull the schedule for the whole window up front instead of asking
+        ## for it one day at a time.
+        schedule_dates = bsc.get_date_window(start_date, num_days, backward)
+        ## Backfills are history for the plots, so leave out spring training
+        ## and exhibitions; "every HBP in <season>" means the real season.
+        games_by_date = bb.get_mlb_games_for_date_range(
+            schedule_dates[0],
+            schedule_dates[-1],
+            double_verbose,
+            const.MLB_SEASON_GAME_TYPES if backfill else None,
+        )
+
+        ## Same as the importer: backfilled plays are history and go in
+        ## already done, unless --queue says otherwise.
+        mark_done = backfill and not queue_plays
+        if mark_done:
+            print(f"📦 Backfilled plays will be marked as done (use --queue to leave them pending).")
+
+        ## A backfill picks up where the last one left off: a game that's in
+        ## every mode's ingest_log is finished and already stored, so skip it.
+        ingested_game_pks = set()
+        if backfill:
+            ingested_game_pks = set.intersection(
+                *[
+                    dbmgr.get_ingested_game_pks(
+                        db_mode, schedule_dates[0], schedule_dates[-1], verbose
+                    )
+                    for db_mode in modes
+                ]
+            )
             print(
-                f"‼️ No database file exists for '{mode}'. Creating '{db_definition["filename"]}'..."
+                f"📒 {len(ingested_game_pks)} game(s) in this window were ingested by an earlier run."
             )
-            db_create_result = dbmgr.create_database(mode, verbose)
-            if db_create_result:
-                print(f"💾 '{db_definition["filename"]}' has been created.")
-
-        if os.path.getsize(db_definition["filename"]) == 0:
-            db_create_result = dbmgr.create_database(mode, verbose)
-        else:
-            db_create_result = True
-
-        if db_create_result:
-            print(f"💾 '{mode}' database table: {db_definition["tablename"]}")
-        else:
-            raise Exception(
-                f"❌ Database file/table is not in a condition for writing!"
+
+        ## Games loaded by the importer have the same plays under stand-in
+        ## play_ids, so inserting them from the live feed would double them
+        ## up. Leave those games to the importer, mode by mode.
+        window_game_pks = [
+            game["gamePk"] for games in games_by_date.values() for game in games
+        ]
+        imported_game_pks = {
+            db_mode: dbmgr.get_stored_game_pks(
+                db_mode, window_game_pks, imported_only=True, verbose_bool=verbose
+            )
+            for db_mode in modes
+        }
+        fully_imported_game_pks = set.intersection(*imported_game_pks.values())
+        if fully_imported_game_pks:
+            print(
+                f"📦 {len(fully_imported_game_pks)} game(s) in this window came from a statcast import."
             )
-        print()
 
-        ## Now start in on parsing out baseball events based on mode.
+        ## Queue up every game in the window at once. The worker threads pull
+        ## the live feeds (no faster than the token bucket allows) while this
+        ## thread walks the days in order and does all the database writes.
+        print(f"🧵 Fetching live feeds with {concurrency} worker(s).")
+        rate_limiter = TokenBucket(
+            1.0 / sleep_time if sleep_time > 0 else 0, concurrency
+        )
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        game_futures = {}
+        skipped_games = {}
+        for schedule_date in schedule_dates:
+            game_futures[schedule_date] = []
+            skipped_games[schedule_date] = 0
+            for game in games_by_date.get(schedule_date, []):
+                ## Backfills leave unfinished (postponed, suspended...) games
+                ## for a later run.
+                if (
+                    game["gamePk"] in ingested_game_pks
+                    or game["gamePk"] in fully_imported_game_pks
+                    or (backfill and not bb.is_mlb_game_final(game))
+                ):
+                    skipped_games[schedule_date] = skipped_games[schedule_date] + 1
+                    continue
+                game_futures[schedule_date].append(
+                    (game, executor.submit(ingest_game, game, rate_limiter))
+                )
+
         total_events = 0
+        total_games = 0
         for xday in range(num_days):
             print(
                 f"⚾ [{xday+1}/{num_days}] Checking {start_date} for games...", end=""
             )
-            mlb_games = bb.get_mlb_games_for_date(start_date)
-            print(f"found {len(mlb_games)} game(s) that day. ⚾")
+            mlb_games = game_futures.get(str(start_date), [])
+            print(f"found {len(mlb_games)} game(s) that day. ⚾", end="")
+            if skipped_games.get(str(start_date)):
+                print(f" (skipped {skipped_games[str(start_date)]})", end="")
+            print()
 
             ## "GAME" FOR LOOP
-            ## Loops through all the games for the day.
-            event_count = 0
-            for i, game in enumerate(mlb_games):
-                game_deets = bb.get_mlb_game_deets(game, double_verbose)
-                events = bb.get_mlb_events_from_single_game(mode, game, double_verbose)
-                ## The type of event is handled by the function itself when we
-                ## pass it the mode. So we don't need to seperate out the mode
-                ## events ourselves here.
+            ## Loops through all the games for the day, gathering up each
+            ## mode's events so they can be written in one go.
+            day_events = {event_mode: [] for event_mode in modes}
+            day_ingested = {event_mode: [] for event_mode in modes}
+            for i, (game, game_future) in enumerate(mlb_games):
+                game_deets, events_by_mode, warnings, feed_loaded = game_future.result()
+                for warning in warnings:
+                    print(f"  {warning}")
+                if not feed_loaded:
+                    print(
+                        f"  ⚠️  Game {game['gamePk']} wasn't logged as ingested; the next run will try it again."
+                    )
 
                 if double_verbose:
                     print("@ --------- GAME DEETS --------- ")
                     pprint.pprint(game_deets)
                     print("@ ----------- EVENTS ----------- ")
-                    pprint.pprint(events)
+                    pprint.pprint(events_by_mode)
                     print("@ ------------ END ------------- ")
                     print()
 
-                ## "EVENT" FOR LOOP
-                ## Loops through all the HBP events.
-                for j, event in enumerate(events):
-                    try:
-                        dbinsert_result = dbmgr.insert_row(mode, game_deets, event)
-                        event_count = event_count + 1
-
-                        if dbinsert_result:
-                            print(
-                                f"  {event_count:02}. 👍 {mode.upper()} {event['play_id']} added to database."
-                            )
-                        else:
-                            print(
-                                f"  {event_count:02}. 🦋 {mode.upper()} {event['play_id']} is already in the database.",
-                                end="",
-                            )
-                            if dbmgr.has_been_downloaded(
-                                mode, event["play_id"], verbose
-                            ):
-                                print(f" (dl)", end="")
-                            if dbmgr.has_been_analyzed(mode, event["play_id"], verbose):
-                                print(f" (nz)", end="")
-                            if dbmgr.has_been_skeeted(mode, event["play_id"], verbose):
-                                print(f" (sk)", end="")
-                            print()
-                    except KeyboardInterrupt:
-                        dbmgr.delete_row(mode, event["play_id"])
-
-                time.sleep(sleep_time)
-            print(f"💥 There were {event_count} total {mode} events for this day. 💥")
+                for event_mode, events in events_by_mode.items():
+                    if game["gamePk"] in imported_game_pks[event_mode]:
+                        continue
+                    for event in events:
+                        day_events[event_mode].append((game_deets, event))
+                    ## Only finished games whose feed actually loaded count
+                    ## as done; anything else could still have events we
+                    ## haven't seen.
+                    if feed_loaded and bb.is_mlb_game_final(game):
+                        day_ingested[event_mode].append(
+                            (game["gamePk"], str(start_date), len(events))
+                        )
+
+            ## "EVENT" FOR LOOP
+            ## One transaction per mode per day. A batch either lands whole
+            ## or not at all, so an interrupt can't leave half-written rows.
+            event_count = 0
+            for event_mode, game_events in day_events.items():
+                dbinsert_results = dbmgr.insert_rows(
+                    event_mode, game_events, verbose, mark_done
+                )
+                dbmgr.log_ingested_games(event_mode, day_ingested[event_mode], verbose)
+                ## Look up the flags for every play that was already there in
+                ## one go rather than three queries apiece.
+                play_statuses = dbmgr.get_play_statuses(
+                    event_mode,
+                    [
+                        event["play_id"]
+                        for (game_deets, event), dbinsert_result in zip(
+                            game_events, dbinsert_results
+                        )
+                        if not dbinsert_result
+                    ],
+                    verbose,
+                )
+                for (game_deets, event), dbinsert_result in zip(
+                    game_events, dbinsert_results
+                ):
+                    event_count = event_count + 1
+
+                    if dbinsert_result:
+                        print(
+                            f"  {event_count:02}. 👍 {event_mode.upper()} {event['play_id']} added to database."
+                        )
+                    else:
+                        print(
+                            f"  {event_count:02}. 🦋 {event_mode.upper()} {event['play_id']} is already in the database.",
+                            end="",
+                        )
+                        play_status = play_statuses[event["play_id"]]
+                        if play_status["downloaded"]:
+                            print(f" (dl)", end="")
+                        if play_status["analyzed"]:
+                            print(f" (nz)", end="")
+                        if play_status["skeeted"]:
+                            print(f" (sk)", end="")
+                        print()
+            if all_modes:
+                mode_counts = ", ".join(
+                    f"{len(game_events)} {event_mode}"
+                    for event_mode, game_events in day_events.items()
+                )
+                print(f"💥 There were {event_count} total events for this day ({mode_counts}). 💥")
+            else:
+                print(f"💥 There were {event_count} total {mode} events for this day. 💥")
             print()
             total_events = total_events + event_count
+            total_games = total_games + len(mlb_games)
 
             if backward:
                 start_date = bsc.subtract_one_day_from_date(start_date)
@@ -225,6 +462,9 @@ def main(start_date: Optional[str] = None) -> int:
         print()
         end_time = time.time()
         elapsed = end_time - start_time
+        print(
+            f"🏎️  Ingested {total_games} game(s) at {total_games / elapsed:.2f} games/sec."
+        )
         print("=" * 80)
         print(f"Completed in {elapsed:.2f} seconds")
         print("=" * 80)
@@ -235,6 +475,12 @@ def main(start_date: Optional[str] = None) -> int:
         print(f"Unexpected error: {e}")
         return 1
 
+    finally:
+        ## Don't leave queued feed downloads running after we're done (or
+        ## after something blew up).
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 
 if __name__ == "__main__":
     sys.exit(main(start_date))
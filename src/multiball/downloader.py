@@ -6,7 +6,6 @@
 ## the appropriate database for the plotter/skeet scripts.
 ## -------------------------------------------------------------------------- ##
 
-import os
 import pprint
 import sys
 import time
@@ -23,7 +22,9 @@ from .libmb import func_skeet as sk
 
 from .libmb.cmdparser import CmdParser
 from .libmb.configurator import ConfigReader
+from .libmb.gamefeed import GameFeed
 from .libmb.logger import PrintLogger
+from .libmb.videoqueue import VideoDownloadQueue
 
 
 ## -------------------------------------------------------------------------- ##
@@ -36,16 +37,19 @@ config = ConfigReader(
 )
 
 #fmt: off
-backward       = False
-get_latest     = False
-mode           = "hbp"
-num_days       = 1
-skip_video_dl  = False
-sleep_time     = float(config.get("client_parameters", "sleep_time"))
-start_date     = datetime.strftime(datetime.now() - timedelta(days=1), "%Y-%m-%d")
-test_mode      = bool(int(config.get("operations", "test_mode")))
-verbose        = bool(int(config.get("operations", "verbose_output")))
-double_verbose = bool(int(config.get("operations", "double_verbose")))
+backward          = False
+get_latest        = False
+mode              = "hbp"
+num_days          = 1
+skip_video_dl     = False
+sleep_time        = float(config.get("client_parameters", "sleep_time"))
+start_date        = datetime.strftime(datetime.now() - timedelta(days=1), "%Y-%m-%d")
+test_mode         = bool(int(config.get("operations", "test_mode")))
+verify_videos     = False
+video_workers     = int(config.get("client_parameters", "video_workers"))
+transcode_workers = int(config.get("client_parameters", "transcode_workers"))
+verbose           = bool(int(config.get("operations", "verbose_output")))
+double_verbose    = bool(int(config.get("operations", "double_verbose")))
 #fmt: on
 
 
@@ -87,6 +91,16 @@ parser.add_arguments_from_dict(
             "default": skip_video_dl,
             "help": "Skips video download for each event",
         },
+        ("--verify-videos"): {
+            "action": "store_true",
+            "default": verify_videos,
+            "help": "Only sweep the video directory for partial/truncated videos and re-fetch them",
+        },
+        ("-w", "--video-workers"): {
+            "type": int,
+            "default": video_workers,
+            "help": "Number of videos to download at once. Defaults to '%(default)s'.",
+        },
     }
 )
 args = parser.parse_args()
@@ -104,6 +118,10 @@ if args.get("skip_video_dl"):
     skip_video_dl = True
 if args.get("start_date"):
     start_date = args.get("start_date")
+if args.get("verify_videos"):
+    verify_videos = True
+if args.get("video_workers") and args.get("video_workers") > 0:
+    video_workers = args.get("video_workers")
 if args.get("test_mode"):
     config.set("operations", "test_mode", "1")
     test_mode = True
@@ -131,6 +149,7 @@ if not args.get("nolog"):
 
 
 def main(start_date: Optional[str] = None) -> int:
+    video_queue = None
     try:
         print()
 
@@ -145,16 +164,38 @@ def main(start_date: Optional[str] = None) -> int:
         print("=" * 80)
         start_time = time.time()
 
+        if verify_videos:
+            return verify_video_downloads(start_time)
+
         if get_latest:
             start_date = dbmgr.get_latest_date_that_hasnt_been_downloaded(
                 mode, double_verbose
             )
+            if start_date is None:
+                print(f"🤷 Every {mode} play in the database has been downloaded. Nothing to do.")
+                print()
+                return 0
+
+        ## Pull the schedule for the whole window up front instead of asking
+        ## for it one day at a time.
+        schedule_dates = bsc.get_date_window(start_date, num_days, backward)
+        games_by_date = bb.get_mlb_games_for_date_range(
+            schedule_dates[0], schedule_dates[-1], double_verbose
+        )
+
+        ## Videos stream in on their own worker threads while this loop keeps
+        ## going with the game details and skeet text.
+        if not test_mode and not skip_video_dl:
+            print(f"🧵 Downloading videos with {video_workers} worker(s).")
+            video_queue = VideoDownloadQueue(
+                mode, video_workers, verbose, transcode_workers
+            )
 
         total_mode_events = 0
         for xday in range(num_days):
             print("--->")
             print(f"⚾ Checking {start_date} for games...", end="")
-            mlb_games = bb.get_mlb_games_for_date(start_date)
+            mlb_games = games_by_date.get(str(start_date), [])
             print(f"found {len(mlb_games)} game(s) that day. ⚾")
             print()
 
@@ -162,9 +203,11 @@ def main(start_date: Optional[str] = None) -> int:
             ## Loops through all the games for the day.
             mode_event_count = 0
             for i, game in enumerate(mlb_games):
-                game_deets = bb.get_mlb_game_deets(game, double_verbose)
+                ## One live feed download per game, shared by both calls.
+                game_feed = GameFeed(game["gamePk"], double_verbose)
+                game_deets = bb.get_mlb_game_deets(game, double_verbose, game_feed)
                 mode_events = bb.get_mlb_events_from_single_game(
-                    mode, game, double_verbose
+                    mode, game, double_verbose, game_feed
                 )
 
                 if double_verbose:
@@ -227,13 +270,8 @@ def main(start_date: Optional[str] = None) -> int:
                         elif skip_video_dl:
                             pass
                         else:
-                            video_filename = bb.download_baseball_savant_play(
-                                mode, game["gamePk"], event["play_id"], verbose
-                            )
-                            print(f"VIDEO: {video_filename}")
-
-                            if os.path.exists(video_filename):
-                                dbmgr.set_download_flag(mode, event["play_id"])
+                            video_queue.submit(game["gamePk"], event["play_id"])
+                            print(f"📥 Video queued.")
 
                     print()
             print(
@@ -249,6 +287,9 @@ def main(start_date: Optional[str] = None) -> int:
 
         print(f"⚾💥 Captured {total_mode_events} during this run.")
 
+        if video_queue is not None:
+            print_video_summary(video_queue)
+
         print()
         end_time = time.time()
         elapsed = end_time - start_time
@@ -262,6 +303,54 @@ def main(start_date: Optional[str] = None) -> int:
         print(f"Unexpected error: {e}")
         return 1
 
+    finally:
+        ## Don't start any more downloads after something blew up.
+        if video_queue is not None:
+            video_queue.cancel()
+
+
+def verify_video_downloads(start_time: float) -> int:
+    """
+    The --verify-videos sweep: finds partial or truncated videos in the
+    mode's video directory and resumes each one on the download queue.
+    """
+    video_queue = None
+    try:
+        ## In test mode, only report what would be re-fetched.
+        partial_videos = bb.find_partial_videos(mode, verbose, test_mode)
+        print(f"🔍 Found {len(partial_videos)} partial video(s).")
+        if partial_videos and not test_mode:
+            print(f"🧵 Re-fetching with {video_workers} worker(s).")
+            video_queue = VideoDownloadQueue(
+                mode, video_workers, verbose, transcode_workers
+            )
+            for game_pk, play_id in partial_videos:
+                video_queue.submit(game_pk, play_id)
+            print_video_summary(video_queue)
+
+        print()
+        end_time = time.time()
+        elapsed = end_time - start_time
+        print("=" * 80)
+        print(f"Completed in {elapsed:.2f} seconds")
+        print("=" * 80)
+        print()
+        return 0
+
+    finally:
+        if video_queue is not None:
+            video_queue.cancel()
+
+
+def print_video_summary(video_queue: VideoDownloadQueue) -> None:
+    print(f"⏳ Waiting on the video downloads...")
+    video_summary = video_queue.wait()
+    print(
+        f"🎥 Downloaded {video_summary['videos']} video(s), "
+        f"{video_summary['bytes'] / 1e6:.1f} MB at {video_summary['bytes_per_sec'] / 1e6:.2f} MB/sec "
+        f"({video_summary['transcoded']} transcoded, {video_summary['failed']} failed)."
+    )
+
 
 if __name__ == "__main__":
     sys.exit(main(start_date))
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+## -------------------------------------------------------------------------- ##
+## Multiball Statcast Importer
+## Bulk loads the mode databases from a local statcast export (a Baseball
+## Savant CSV, or a Parquet file saved from pybaseball) instead of crawling
+## live feeds game by game.
+## -------------------------------------------------------------------------- ##
+
+import os
+import sys
+import time
+
+# Import application modules
+from .libmb import basic as bsc
+from .libmb import constants as const
+from .libmb import func_database as dbmgr
+from .libmb import func_statcast as sc
+
+from .libmb.cmdparser import CmdParser
+from .libmb.configurator import ConfigReader
+from .libmb.logger import PrintLogger
+
+
+## -------------------------------------------------------------------------- ##
+## SETUP
+## -------------------------------------------------------------------------- ##
+
+## Read and update configuration
+config = ConfigReader(
+    bsc.verify_file_path(bsc.sanitize_path(const.DEFAULT_CONFIG_INI_FILE))
+)
+
+#fmt: off
+chunk_rows     = const.STATCAST_CHUNK_ROWS
+mark_ingested  = False
+modes          = list(const.MODE_EVENTS)
+queue_plays    = False
+test_mode      = bool(int(config.get("operations", "test_mode")))
+verbose        = bool(int(config.get("operations", "verbose_output")))
+double_verbose = bool(int(config.get("operations", "double_verbose")))
+#fmt: on
+
+
+## Create parser and add arguments
+parser = CmdParser(
+    description="Bulk loads the mode databases from a statcast CSV/Parquet export."
+)
+parser.add_arguments_from_dict(
+    {
+        ("-c", "--chunk-rows"): {
+            "type": int,
+            "default": chunk_rows,
+            "help": "Rows of the export to read per pass. Defaults to '%(default)s'.",
+        },
+        ("-f", "--file"): {
+            "type": str,
+            "required": True,
+            "help": "Statcast export to import (.csv, .csv.gz, .parquet)",
+        },
+        ("-i", "--mark-ingested"): {
+            "action": "store_true",
+            "default": mark_ingested,
+            "help": "Log every game in the export in ingest_log so dbpop backfills skip them. Only use this with unfiltered exports.",
+        },
+        ("-m", "--mode"): {
+            "type": str,
+            "choices": ["derp", "hbp", "triples"],
+            "default": None,
+            "help": "Only import this mode. Defaults to all of them.",
+        },
+        ("-q", "--queue"): {
+            "action": "store_true",
+            "default": queue_plays,
+            "help": "Leave imported plays pending for the downloader/plotter/skeeter instead of marking them done",
+        },
+    }
+)
+args = parser.parse_args()
+
+## Now pull config and command line action together.
+if args.get("chunk_rows") and args.get("chunk_rows") > 0:
+    chunk_rows = args.get("chunk_rows")
+statcast_file = bsc.sanitize_path(args.get("file"))
+if args.get("mark_ingested"):
+    mark_ingested = True
+if args.get("mode"):
+    modes = [args.get("mode")]
+if args.get("queue"):
+    queue_plays = True
+if args.get("test_mode"):
+    config.set("operations", "test_mode", "1")
+    test_mode = True
+if args.get("verbose"):
+    config.set("operations", "verbose_output", "1")
+    verbose = True
+if args.get("double_verbose"):
+    config.set("operations", "verbose_output", "1")
+    config.set("operations", "double_verbose", "1")
+    verbose = True
+    double_verbose = True
+
+## Set up logging
+if not args.get("nolog"):
+    prefix_val = config.get("logging_prefixes", "statcast_prefix")
+    sys.stdout = PrintLogger(
+        config.get("paths", "log_dir"),
+        f"{modes[0] if len(modes) == 1 else 'all'}_{prefix_val}",
+    )
+
+
+# -------------------------------------------------------------------------- ##
+# MAIN ACTION
+# -------------------------------------------------------------------------- ##
+
+
+def main() -> int:
+    try:
+        print()
+
+        if verbose:
+            print(config.get_all())
+            print()
+
+        print("=" * 80)
+        print(f" ⚾ {config.get('app', 'name')} ⚾ ~~> 📦 Statcast Importer")
+        print("=" * 80)
+        start_time = time.time()
+
+        if not os.path.isfile(statcast_file):
+            raise FileNotFoundError(f"❌ No statcast export at '{statcast_file}'!")
+        print(f"📦 Importing {statcast_file}, {chunk_rows} rows at a time.")
+
+        for db_mode in modes:
+            db_definition = dbmgr.get_table_definition(db_mode, verbose)
+            bsc.verify_directory_path(os.path.dirname(db_definition["filename"]))
+            if not dbmgr.create_database(db_mode, verbose):
+                raise Exception(
+                    f"❌ Database file/table is not in a condition for writing!"
+                )
+            print(f"💾 '{db_mode}' database file:  {db_definition["filename"]}")
+        print()
+
+        ## Each pass reads one chunk, filters and reshapes it with pandas,
+        ## then writes each mode's rows in a single transaction.
+        num_rows = 0
+        num_found = {db_mode: 0 for db_mode in modes}
+        num_inserted = {db_mode: 0 for db_mode in modes}
+        ## Games this run has written, and games skipped because dbpop (or an
+        ## earlier import) already stored them under other play_ids.
+        imported_game_pks = {db_mode: set() for db_mode in modes}
+        skipped_game_pks = {db_mode: set() for db_mode in modes}
+        game_logs = {db_mode: {} for db_mode in modes}
+        for i, chunk in enumerate(sc.read_statcast_export(statcast_file, chunk_rows)):
+            num_rows = num_rows + len(chunk)
+            events = sc.add_play_ids(sc.filter_statcast_events(chunk, modes))
+
+            for db_mode in modes:
+                mode_rows = sc.build_mode_rows(events, db_mode, not queue_plays)
+                num_found[db_mode] = num_found[db_mode] + len(mode_rows)
+
+                ## Statcast exports and live feeds don't share play_ids, so a
+                ## game that's already in the table can't be deduped row by
+                ## row. Leave the whole game alone instead.
+                new_game_pks = [
+                    row["game_pk"]
+                    for row in mode_rows
+                    if row["game_pk"] not in imported_game_pks[db_mode]
+                ]
+                stored_game_pks = dbmgr.get_stored_game_pks(
+                    db_mode, new_game_pks, verbose_bool=verbose
+                )
+                if stored_game_pks:
+                    skipped_game_pks[db_mode].update(stored_game_pks)
+                    mode_rows = [
+                        row for row in mode_rows if row["game_pk"] not in stored_game_pks
+                    ]
+                imported_game_pks[db_mode].update(row["game_pk"] for row in mode_rows)
+                if mode_rows and not test_mode:
+                    num_inserted[db_mode] = num_inserted[db_mode] + dbmgr.bulk_insert_rows(
+                        db_mode, mode_rows, verbose
+                    )
+
+                if mark_ingested:
+                    ## Games can straddle chunks, so tally them up and log
+                    ## them once at the end.
+                    mode_counts = events.loc[events["mode"] == db_mode, "game_pk"].value_counts()
+                    for game_pk, game_date in (
+                        chunk[["game_pk", "game_date"]].drop_duplicates("game_pk").itertuples(index=False)
+                    ):
+                        game_log = game_logs[db_mode].setdefault(
+                            int(game_pk), [str(game_date)[:10], 0]
+                        )
+                        game_log[1] = game_log[1] + int(mode_counts.get(game_pk, 0))
+
+            print(
+                f"  {i + 1:02}. 📄 {num_rows} rows read, "
+                + ", ".join([f"{db_mode} {num_found[db_mode]}" for db_mode in modes])
+                + " event(s) found."
+            )
+        print()
+
+        for db_mode in modes:
+            print(
+                f"💥 {db_mode.upper()}: {num_inserted[db_mode]} of {num_found[db_mode]} event(s) added to the database."
+            )
+            if skipped_game_pks[db_mode]:
+                print(
+                    f"⏭️  {db_mode.upper()}: skipped {len(skipped_game_pks[db_mode])} game(s) that were already in the database."
+                )
+            if mark_ingested and not test_mode:
+                num_logged = dbmgr.log_ingested_games(
+                    db_mode,
+                    [
+                        (game_pk, game_date, game_events)
+                        for game_pk, (game_date, game_events) in game_logs[db_mode].items()
+                    ],
+                    verbose,
+                )
+                print(f"📒 {db_mode.upper()}: {num_logged} game(s) logged as ingested.")
+
+        print()
+        end_time = time.time()
+        elapsed = end_time - start_time
+        print("=" * 80)
+        print(f"Completed in {elapsed:.2f} seconds ({num_rows / elapsed:.0f} rows/sec)")
+        print("=" * 80)
+        print()
+        return 0
+
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,6 +50,26 @@ def transcend_time_and_space(direction: str, date_str: Optional[str] = None):
     return return_date
 
 
+def get_date_window(start_date, num_days: int, backward: Optional[bool] = False) -> list:
+    """
+    Lists every 'YYYY-MM-DD' date a num_days run starting at start_date will
+    visit, in the order it'll visit them.
+
+    Args:
+        start_date (str|date): The first day of the run.
+        num_days (int): How many days the run covers.
+        backward (bool): Whether the run walks backward in time.
+
+    Returns:
+        list: Date strings, starting with start_date.
+    """
+    direction = "backward" if backward else "forward"
+    dates = [str(start_date)]
+    for _ in range(num_days - 1):
+        dates.append(transcend_time_and_space(direction, dates[-1]))
+    return dates
+
+
 ## -------------------------------------------------------------------------- ##
 ## FILE PATHS AND SUCH
 ## -------------------------------------------------------------------------- ##
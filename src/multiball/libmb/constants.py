@@ -18,6 +18,16 @@ config = ConfigReader(
 
 SKEETS_CHAR_LIMIT = 300
 SKEETS_VIDEO_LIMIT = 50000000  ## bytes
+VIDEO_DOWNLOAD_CHUNK_SIZE = 1048576  ## bytes
+
+## Tried in order until a transcode comes in under SKEETS_VIDEO_LIMIT:
+## (output height in pixels, video bitrate for ffmpeg).
+VIDEO_TRANSCODE_LADDER = [
+    (720, "2500k"),
+    (540, "1500k"),
+    (360, "800k"),
+    (270, "400k"),
+]
 
 
 ## ---------------------------------------------------------------------------->
@@ -28,10 +38,17 @@ SKEETS_VIDEO_LIMIT = 50000000  ## bytes
 BASEBALL_SAVANT_PLAY_VIDEO_URL = "https://baseballsavant.mlb.com/sporty-videos"
 MLB_STATS_BASE_URL             = "https://statsapi.mlb.com"
 MLB_STATS_SCHEDULE_STUB        = "/api/v1/schedule"
+MLB_STATS_SCHEDULE_MAX_DAYS    = 92
+MLB_STATS_SCHEDULE_HYDRATE     = "team,linescore"
 MLB_STATS_GAME_STUB            = "/api/v1/game/<<GAME_PK>>/content"
 MLB_STATS_LIVE_FEED_STUB       = "/api/v1.1/game/<<GAME_PK>>/feed/live"
 MLB_STATS_PLAYER_STUB          = "/api/v1/people/<<PLAYER_ID>>"
+MLB_STATS_PEOPLE_STUB          = "/api/v1/people"
+MLB_STATS_PEOPLE_MAX_IDS       = 100
 MLB_STATS_TEAM_STUB            = "/api/v1/teams/<<TEAM_ID>>"
+MLB_SEASON_FIRST_DAY           = "03-01"  ## MM-DD; what --season backfills from
+MLB_SEASON_LAST_DAY            = "11-30"  ## MM-DD; ...and to
+MLB_SEASON_GAME_TYPES          = "R,F,D,L,W"  ## regular season and postseason
 #fmt: on
 
 
@@ -50,11 +67,56 @@ DERP_EVENTS = [
 ]
 HBP_EVENTS = ["Hit By Pitch"]
 TRIPLES_EVENTS = ["Triple", "Triple Play"]
+MODE_EVENTS = {
+    "derp": DERP_EVENTS,
+    "hbp": HBP_EVENTS,
+    "triples": TRIPLES_EVENTS,
+}
+
+## Statcast exports (Baseball Savant CSVs, pybaseball frames) spell the same
+## events in snake_case. Maps their 'events' values onto the names above.
+#fmt: off
+STATCAST_EVENTS = {
+    "balk"               : "Balk",
+    "batter_interference": "Batter Interference",
+    "catcher_interf"     : "Catcher Interference",
+    "field_error"        : "Field Error",
+    "hit_by_pitch"       : "Hit By Pitch",
+    "triple"             : "Triple",
+    "triple_play"        : "Triple Play",
+}
+STATCAST_CHUNK_ROWS = 100000
+#fmt: on
 
 ## ---------------------------------------------------------------------------->
 ## Database Creation Statements
 ## ---------------------------------------------------------------------------->
 
+#fmt: off
+DATABASE_PRAGMAS = {
+    "journal_mode": config.get("database", "journal_mode"),
+    "synchronous" : config.get("database", "synchronous"),
+    "cache_size"  : -int(config.get("database", "cache_size_kb")),  ## negative = KiB
+    "busy_timeout": int(config.get("database", "busy_timeout_ms")),
+}
+#fmt: on
+
+## Secondary indexes shared by every mode table. Keys become part of the index
+## name; values are what follows 'ON <table>'. The partial indexes keep the
+## work-queue lookups on the downloaded/analyzed/skeeted flags cheap.
+MODE_TABLE_INDEXES = {
+    "batter_id"       : "(batter_id)",
+    "pitcher_id"      : "(pitcher_id)",
+    "game_date"       : "(game_date)",
+    "game_pk"         : "(game_pk)",
+    "pending_download": "(game_date) WHERE downloaded = 0",
+    "pending_analysis": "(game_pk, play_id) WHERE analyzed = 0",
+    "pending_skeet"   : "(game_pk, play_id) WHERE skeeted = 0",
+}
+
+## Rows per page when the plotter and skeeter walk their work queues.
+WORK_QUEUE_BATCH_SIZE = 100
+
 DERP_TABLE = {
     "filename": os.path.join(
         config.get("paths", "bsky_data_dir"),
@@ -74,6 +136,7 @@ DERP_TABLE = {
         "analyzed"   : "INTEGER NOT NULL DEFAULT 0",
         "skeeted"    : "INTEGER NOT NULL DEFAULT 0",
     },
+    "indexes": MODE_TABLE_INDEXES,
 }
 
 HBP_TABLE = {
@@ -96,6 +159,7 @@ HBP_TABLE = {
         "analyzed"  : "INTEGER NOT NULL DEFAULT 0",
         "skeeted"   : "INTEGER NOT NULL DEFAULT 0",
     },
+    "indexes": MODE_TABLE_INDEXES,
 }
 
 TRIPLES_TABLE = {
@@ -115,6 +179,72 @@ TRIPLES_TABLE = {
         "analyzed"  : "INTEGER NOT NULL DEFAULT 0",
         "skeeted"   : "INTEGER NOT NULL DEFAULT 0",
     },
+    "indexes": MODE_TABLE_INDEXES,
+}
+
+## Which finished games dbpop has already been through. Lives alongside the
+## mode table in each mode's database, so it has no filename of its own.
+INGEST_LOG_TABLE = {
+    "tablename": "ingest_log",
+    "columns": {
+        "game_pk"    : "INTEGER PRIMARY KEY",
+        "game_date"  : "DATE NOT NULL",
+        "num_events" : "INTEGER NOT NULL DEFAULT 0",
+        "ingested_at": "INTEGER NOT NULL",
+    },
+    "indexes": {
+        "game_date": "(game_date)",
+    },
+}
+
+
+## ---------------------------------------------------------------------------->
+## Metadata Cache Statements
+## ---------------------------------------------------------------------------->
+
+CACHE_DB_FILENAME = os.path.join(
+    config.get("paths", "bsky_data_dir"),
+    config.get("cache", "db_filename"),
+)
+
+PLOT_CACHE_DIR = os.path.join(
+    config.get("paths", "bsky_data_dir"),
+    config.get("cache", "plot_cache_dir"),
+)
+
+TEAMS_CACHE_TABLE = {
+    "filename": CACHE_DB_FILENAME,
+    "tablename": "teams",
+    "columns": {
+        "team_id"   : "INTEGER NOT NULL",
+        "season"    : "INTEGER NOT NULL",
+        "details"   : "TEXT NOT NULL",
+        "fetched_at": "INTEGER NOT NULL",
+    },
+    "primary_key": ["team_id", "season"],
+}
+
+PLAYERS_CACHE_TABLE = {
+    "filename": CACHE_DB_FILENAME,
+    "tablename": "players",
+    "columns": {
+        "player_id" : "INTEGER NOT NULL",
+        "details"   : "TEXT NOT NULL",
+        "fetched_at": "INTEGER NOT NULL",
+    },
+    "primary_key": ["player_id"],
+}
+
+## play_id -> Savant mp4 URL, so we only ever scrape a play's page once.
+VIDEO_URLS_CACHE_TABLE = {
+    "filename": CACHE_DB_FILENAME,
+    "tablename": "video_urls",
+    "columns": {
+        "play_id"   : "TEXT NOT NULL",
+        "details"   : "TEXT NOT NULL",
+        "fetched_at": "INTEGER NOT NULL",
+    },
+    "primary_key": ["play_id"],
 }
 
 
@@ -122,6 +252,12 @@ TRIPLES_TABLE = {
 ## Filesystem Paths
 ## ---------------------------------------------------------------------------->
 
+## Content-addressed video store shared by every mode: '<play_id>.mp4'.
+VIDEO_STORE_DIR = os.path.join(
+    config.get("paths", "bsky_data_dir"),
+    config.get("paths", "video_store_dir"),
+)
+
 DERP_PATHS = {
     "root": os.path.join(
         config.get("paths", "bsky_data_dir"),
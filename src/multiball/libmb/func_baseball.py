@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
 
+import hashlib
+import html
 import os
 import pprint
-import requests
+import re
+import shutil
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from datetime import datetime, timedelta
 from tqdm import tqdm
 from typing import Optional
 
 from . import constants as const
+from . import func_cache as cache
+from . import func_database as dbmgr
+from . import httpclient as httpc
+from .gamefeed import GameFeed
+
+
+## Quick-scan patterns for the video on a Savant sporty-videos page.
+SAVANT_VIDEO_SOURCE_RE = re.compile(r"<source\b[^>]*\btype=[\"']video/mp4[\"'][^>]*>", re.I)
+SAVANT_VIDEO_SRC_RE = re.compile(r"\bsrc=[\"']([^\"']+)[\"']", re.I)
 
 
 ## -------------------------------------------------------------------------- ##
@@ -64,14 +77,23 @@ def build_mlb_player_display_string(
 
 def get_mlb_game_deets(
     game: list,
-    verbose_bool: Optional[bool] = False
+    verbose_bool: Optional[bool] = False,
+    game_feed: Optional[GameFeed] = None,
 ) -> list:
-    home_team_deets = get_mlb_team_details(
-        game["teams"]["home"]["team"]["id"], verbose_bool
-    )
-    away_team_deets = get_mlb_team_details(
-        game["teams"]["away"]["team"]["id"], verbose_bool
-    )
+    ## Share the live feed with whoever else needs it (see
+    ## get_mlb_events_from_single_game) so it only gets downloaded once.
+    if game_feed is None:
+        game_feed = GameFeed(game["gamePk"], verbose_bool)
+
+    ## A hydrated schedule entry (see get_mlb_games_for_date_range) already
+    ## carries the team names and the linescore. Only go looking elsewhere
+    ## when they're missing.
+    home_team_deets = get_mlb_game_team_details(game, "home", verbose_bool)
+    away_team_deets = get_mlb_game_team_details(game, "away", verbose_bool)
+
+    innings = game.get("linescore", {}).get("currentInning")
+    if innings is None:
+        innings = get_mlb_game_total_innings(game["gamePk"], verbose_bool, game_feed)
 
     #fmt: off
     game_deets = {
@@ -95,7 +117,7 @@ def get_mlb_game_deets(
         },
         "description": game["seriesDescription"],
         "date"       : game["officialDate"],
-        "innings"    : get_mlb_game_total_innings(game["gamePk"], verbose_bool),
+        "innings"    : innings,
         "game_pk"    : game["gamePk"],
     }
     #fmt: on
@@ -108,40 +130,104 @@ def get_mlb_game_deets(
     return game_deets
 
 
+def get_mlb_game_team_details(
+    game: list,
+    side: str,
+    verbose_bool: Optional[bool] = False
+) -> list:
+    """
+    Gets the 'home' or 'away' team's details for a schedule entry. Uses the
+    hydrated team object when the schedule has one, otherwise falls back to
+    the team cache (and, on a miss, the teams endpoint).
+    """
+    team = game["teams"][side]["team"]
+    if is_full_mlb_team(team):
+        return build_mlb_team_details(team)
+
+    season = game.get("season", game["officialDate"][:4])
+    return get_cached_mlb_team_details(team["id"], season, verbose_bool)
+
+
 def get_mlb_games_for_date(
     date_str: str,
     verbose_bool: Optional[bool] = False
 ) -> list:
+    return get_mlb_games_for_date_range(date_str, date_str, verbose_bool).get(
+        str(date_str), []
+    )
+
+
+def get_mlb_games_for_date_range(
+    start_date_str: str,
+    end_date_str: str,
+    verbose_bool: Optional[bool] = False,
+    game_types: Optional[str] = None,
+) -> dict:
+    """
+    Pulls the schedule for a whole window of days (a backfill, or even a full
+    season) using the schedule endpoint's startDate/endDate parameters. Long
+    windows get split into a few requests of MLB_STATS_SCHEDULE_MAX_DAYS.
+
+    The games come back hydrated with their teams and linescores, which is
+    enough for get_mlb_game_deets to skip the per-game team and innings
+    lookups.
+
+    game_types, if given, is the schedule's comma-separated gameType
+    filter (e.g. const.MLB_SEASON_GAME_TYPES).
+
+    Returns a dict of 'YYYY-MM-DD' -> list of games for every date in the
+    window that had games, in date order. The dates can be given in either
+    order.
+    """
     #fmt: off
-    url      = const.MLB_STATS_BASE_URL + const.MLB_STATS_SCHEDULE_STUB
-    params   = {"sportId": 1, "date": date_str}
-    response = requests.get(url, params=params, timeout=10)
-    response.raise_for_status()
-    data  = response.json()
-    games = []
+    url        = const.MLB_STATS_BASE_URL + const.MLB_STATS_SCHEDULE_STUB
+    date_strs  = sorted([str(start_date_str), str(end_date_str)])
+    first_day  = datetime.strptime(date_strs[0], "%Y-%m-%d").date()
+    last_day   = datetime.strptime(date_strs[1], "%Y-%m-%d").date()
+    games      = {}
     #fmt: on
 
-    for date_block in data.get("dates", []):
-        games.extend(date_block.get("games", []))
-    return games
+    chunk_start = first_day
+    while chunk_start <= last_day:
+        chunk_end = min(
+            chunk_start + timedelta(days=const.MLB_STATS_SCHEDULE_MAX_DAYS - 1), last_day
+        )
+        params = {
+            "sportId": 1,
+            "startDate": chunk_start.strftime("%Y-%m-%d"),
+            "endDate": chunk_end.strftime("%Y-%m-%d"),
+            "hydrate": const.MLB_STATS_SCHEDULE_HYDRATE,
+        }
+        if game_types:
+            params["gameType"] = game_types
+        response = httpc.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        if verbose_bool:
+            pprint.pprint(data)
+
+        for date_block in data.get("dates", []):
+            games.setdefault(date_block["date"], []).extend(date_block.get("games", []))
+
+        chunk_start = chunk_end + timedelta(days=1)
+
+    return dict(sorted(games.items()))
+
+
+def is_mlb_game_final(game: dict) -> bool:
+    """Whether a schedule entry's game is over (and so won't gain any more events)."""
+    return game.get("status", {}).get("abstractGameState") == "Final"
 
 
 def get_mlb_game_total_innings(
     game_pk: str,
-    verbose_bool: Optional[bool] = False
+    verbose_bool: Optional[bool] = False,
+    game_feed: Optional[GameFeed] = None,
 ) -> int:
-    live_feed_url = const.MLB_STATS_BASE_URL + const.MLB_STATS_LIVE_FEED_STUB.replace(
-        "<<GAME_PK>>", str(game_pk)
-    )
-    response = requests.get(live_feed_url, timeout=10)
-    response.raise_for_status()
-    data = response.json()
-
-    if verbose_bool:
-        pprint.pprint(data)
-
-    all_plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
-    return all_plays[-1]["about"]["inning"]
+    if game_feed is None:
+        game_feed = GameFeed(game_pk, verbose_bool)
+    return game_feed.total_innings
 
 
 def get_mlb_player_details(
@@ -151,32 +237,107 @@ def get_mlb_player_details(
     player_details_url = const.MLB_STATS_BASE_URL + const.MLB_STATS_PLAYER_STUB.replace(
         "<<PLAYER_ID>>", str(player_id)
     )
-    response = requests.get(player_details_url, timeout=10)
+    response = httpc.get(player_details_url)
     response.raise_for_status()
     data = response.json()
 
     if verbose_bool:
         pprint.pprint(data)
 
+    return build_mlb_player_details(data["people"][0])
+
+
+def build_mlb_player_details(person: dict) -> dict:
+    """Turns one entry of a people endpoint's 'people' list into our dict."""
     #fmt: off
     player_details = {
-        "id"              : data["people"][0]["id"],
-        "link"            : data["people"][0]["link"],
-        "name"            : data["people"][0]["fullName"],
-        "birthdate"       : data["people"][0]["birthDate"],
-        "height"          : data["people"][0]["height"],
-        "jersey_number"   : data["people"][0]["primaryNumber"] if "primaryNumber" in data["people"][0] else None,
-        "primary_position": data["people"][0]["primaryPosition"]["abbreviation"],
-        "pitches"         : data["people"][0]["pitchHand"]["code"],
-        "hits"            : data["people"][0]["batSide"]["code"],
-        "strike_zone_top" : data["people"][0]["strikeZoneTop"],
-        "strike_zone_bot" : data["people"][0]["strikeZoneBottom"],
+        "id"              : person["id"],
+        "link"            : person["link"],
+        "name"            : person["fullName"],
+        "birthdate"       : person["birthDate"],
+        "height"          : person["height"],
+        "jersey_number"   : person["primaryNumber"] if "primaryNumber" in person else None,
+        "primary_position": person["primaryPosition"]["abbreviation"],
+        "pitches"         : person["pitchHand"]["code"],
+        "hits"            : person["batSide"]["code"],
+        "strike_zone_top" : person["strikeZoneTop"],
+        "strike_zone_bot" : person["strikeZoneBottom"],
     }
     #fmt: on
 
     return player_details
 
 
+def get_mlb_players_details(
+    player_ids: list,
+    verbose_bool: Optional[bool] = False
+) -> dict:
+    """
+    Fetches many players at once through the people endpoint's 'personIds'
+    query. Returns a dict of player_id -> player details.
+    """
+    players_details = {}
+    player_ids = sorted(set(int(player_id) for player_id in player_ids))
+    url = const.MLB_STATS_BASE_URL + const.MLB_STATS_PEOPLE_STUB
+
+    for i in range(0, len(player_ids), const.MLB_STATS_PEOPLE_MAX_IDS):
+        chunk = player_ids[i : i + const.MLB_STATS_PEOPLE_MAX_IDS]
+        response = httpc.get(
+            url, params={"personIds": ",".join(str(player_id) for player_id in chunk)}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if verbose_bool:
+            pprint.pprint(data)
+
+        for person in data.get("people", []):
+            players_details[person["id"]] = build_mlb_player_details(person)
+
+    return players_details
+
+
+def get_cached_mlb_player_details(
+    player_id: int,
+    verbose_bool: Optional[bool] = False
+) -> list:
+    player_details = cache.get_cached_player_details(player_id, verbose_bool)
+    if player_details is None:
+        player_details = get_mlb_player_details(player_id, verbose_bool)
+        cache.store_players_details({player_id: player_details}, verbose_bool)
+    return player_details
+
+
+def prefetch_mlb_player_details(
+    player_ids: list,
+    verbose_bool: Optional[bool] = False
+) -> int:
+    """
+    Makes sure every player in player_ids is in the metadata cache, pulling
+    the missing ones in bulk. Returns the number of players fetched.
+    """
+    cached_players = cache.get_cached_players_details(player_ids, verbose_bool)
+    missing_ids = set(int(player_id) for player_id in player_ids) - set(cached_players)
+    if not missing_ids:
+        return 0
+
+    players_details = get_mlb_players_details(list(missing_ids), verbose_bool)
+    cache.store_players_details(players_details, verbose_bool)
+    return len(players_details)
+
+
+def get_cached_mlb_team_details(
+    team_id: int,
+    season: int,
+    verbose_bool: Optional[bool] = False
+) -> list:
+    team_details = cache.get_cached_team_details(team_id, season, verbose_bool)
+    if team_details is None:
+        team_details = get_mlb_team_details(team_id, verbose_bool)
+        cache.store_team_details(team_id, season, team_details, verbose_bool)
+    return team_details
+
+
 def get_mlb_team_details(
     team_id: int,
     verbose_bool: Optional[bool] = False
@@ -184,24 +345,46 @@ def get_mlb_team_details(
     team_details_url = const.MLB_STATS_BASE_URL + const.MLB_STATS_TEAM_STUB.replace(
         "<<TEAM_ID>>", str(team_id)
     )
-    response = requests.get(team_details_url, timeout=10)
+    response = httpc.get(team_details_url)
     response.raise_for_status()
     data = response.json()
 
     if verbose_bool:
         pprint.pprint(data)
 
+    return build_mlb_team_details(data["teams"][0])
+
+
+def is_full_mlb_team(team: dict) -> bool:
+    """
+    Whether a team object has every field build_mlb_team_details() reads. A
+    partly hydrated schedule team would otherwise get stored with holes.
+    """
+    team_keys = [
+        "id", "link", "clubName", "franchiseName", "locationName", "name",
+        "shortName", "teamName",
+    ]
+    if any(team.get(key) is None for key in team_keys):
+        return False
+    return (team.get("venue") or {}).get("name") is not None
+
+
+def build_mlb_team_details(team: dict) -> dict:
+    """
+    Turns a full team object (from the teams endpoint or a hydrated schedule)
+    into our dict.
+    """
     #fmt: off
     team_details = {
-        "id"            : data["teams"][0]["id"],
-        "link"          : data["teams"][0]["link"],
-        "club_name"     : data["teams"][0]["clubName"],
-        "franchise_name": data["teams"][0]["franchiseName"],
-        "location_name" : data["teams"][0]["locationName"],
-        "name"          : data["teams"][0]["name"],
-        "short_name"    : data["teams"][0]["shortName"],
-        "team_name"     : data["teams"][0]["teamName"],
-        "venue"         : data["teams"][0]["venue"]["name"],
+        "id"            : team["id"],
+        "link"          : team["link"],
+        "club_name"     : team["clubName"],
+        "franchise_name": team.get("franchiseName"),
+        "location_name" : team["locationName"],
+        "name"          : team["name"],
+        "short_name"    : team.get("shortName"),
+        "team_name"     : team.get("teamName"),
+        "venue"         : team.get("venue", {}).get("name"),
     }
     #fmt: on
 
@@ -216,43 +399,45 @@ def get_mlb_team_details(
 def get_mlb_events_from_single_game(
     mode: str,
     game: list,
-    verbose_bool: Optional[bool] = False
+    verbose_bool: Optional[bool] = False,
+    game_feed: Optional[GameFeed] = None,
 ) -> list:
-    events = []
+    return get_mlb_events_by_mode([mode], game, verbose_bool, game_feed)[mode]
+
+
+def get_mlb_events_by_mode(
+    modes: list,
+    game: list,
+    verbose_bool: Optional[bool] = False,
+    game_feed: Optional[GameFeed] = None,
+) -> dict:
+    """
+    Walks a game's plays once and sorts every play that matters into each mode
+    whose event list (const.MODE_EVENTS) it shows up in. Returns a dict of
+    mode -> list of events, with an entry (maybe empty) for every mode asked
+    for.
+    """
+    events = {mode: [] for mode in modes}
     all_plays = []
 
+    if game_feed is None:
+        game_feed = GameFeed(game["gamePk"], verbose_bool)
+
     try:
-        live_feed_url = const.MLB_STATS_BASE_URL + game["link"]
         if verbose_bool:
-            print(f"Live feed URL: {live_feed_url}")
-        # print(f"Live feed URL: {live_feed_url}")
+            print(f"Live feed URL: {game_feed.url}")
 
-        response = requests.get(live_feed_url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        all_plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
+        all_plays = game_feed.all_plays
     except Exception as e:
-        print(f"[ERROR] '{live_feed_url}' failed: {e}")
+        print(f"[ERROR] '{game_feed.url}' failed: {e}")
 
     # Identify events at the play-result level (most reliable)
     for play in all_plays:
-        triggering_event = None
-        if (
-            (
-                mode == "derp"
-                and play.get("result", {}).get("event") in const.DERP_EVENTS
-            )
-            or (
-                mode == "hbp"
-                and play.get("result", {}).get("event") in const.HBP_EVENTS
-            )
-            or (
-                mode == "triples"
-                and play.get("result", {}).get("event") in const.TRIPLES_EVENTS
-            )
-        ):
-            triggering_event = play.get("result", {}).get("event")
-        else:
+        triggering_event = play.get("result", {}).get("event")
+        play_modes = [
+            mode for mode in modes if triggering_event in const.MODE_EVENTS.get(mode, [])
+        ]
+        if not play_modes:
             continue
 
         # Find the final pitch event to extract play_id
@@ -268,43 +453,44 @@ def get_mlb_events_from_single_game(
             print("@@--  End  --@@")
 
         #fmt: off
-        events.append(
-            {
-                "description": play["result"]["description"],
-                "event"      : triggering_event,
-                "game_pk"    : game["gamePk"],
-                "mode"       : mode,
-                "play_id"    : play_id,
-                "batter" : {
-                    "id"  : play["matchup"]["batter"]["id"],
-                    "name": play["matchup"]["batter"]["fullName"],
-                    "hand": play["matchup"]["batSide"]["code"],
-                    "team": game["teams"]["away"]["team"]["name"] if play["about"]["halfInning"] == "top" else game["teams"]["home"]["team"]["name"],
-                },
-                "pitcher": {
-                    "id"  : play["matchup"]["pitcher"]["id"],
-                    "name": play["matchup"]["pitcher"]["fullName"],
-                    "hand": play["matchup"]["pitchHand"]["code"],
-                    "team": game["teams"]["away"]["team"]["name"] if play["about"]["halfInning"] == "bottom" else game["teams"]["home"]["team"]["name"],
-                },
-                "at_bat": {
-                    "home_score"  : play["result"]["homeScore"],
-                    "away_score"  : play["result"]["awayScore"],
-                    "balls"       : play["playEvents"][-1]["count"]["balls"],
-                    "strikes"     : play["playEvents"][-1]["count"]["strikes"],
-                    "outs_when_up": play["playEvents"][-1]["count"]["outs"],
-                    "inning"      : play["about"]["inning"],
-                    "half_inning" : play["about"]["halfInning"],
-                    "start_speed" : play["playEvents"][-1]["pitchData"]["startSpeed"] if "pitchData" in play["playEvents"][-1] and "startSpeed" in play["playEvents"][-1]["pitchData"] else None,
-                    "end_speed"   : play["playEvents"][-1]["pitchData"]["endSpeed"] if "pitchData" in play["playEvents"][-1] and "endSpeed" in play["playEvents"][-1]["pitchData"] else None,
-                    "plate_x"     : play["playEvents"][-1]["pitchData"]["coordinates"]["pX"] if "pitchData" in play["playEvents"][-1] and "pX" in play["playEvents"][-1]["pitchData"]["coordinates"] else None,     ## in feet!
-                    "plate_z"     : play["playEvents"][-1]["pitchData"]["coordinates"]["pZ"] if "pitchData" in play["playEvents"][-1] and "pZ" in play["playEvents"][-1]["pitchData"]["coordinates"] else None,     ## in feet!
-                    "pitch_name"  : play["playEvents"][-1]["details"]["type"]["description"] if "type" in play["playEvents"][-1]["details"]and play["playEvents"][-1]["details"]["type"] != "no_pitch" else None,
-                },
-            }
-        )
+        event = {
+            "description": play["result"]["description"],
+            "event"      : triggering_event,
+            "game_pk"    : game["gamePk"],
+            "mode"       : None,
+            "play_id"    : play_id,
+            "batter" : {
+                "id"  : play["matchup"]["batter"]["id"],
+                "name": play["matchup"]["batter"]["fullName"],
+                "hand": play["matchup"]["batSide"]["code"],
+                "team": game["teams"]["away"]["team"]["name"] if play["about"]["halfInning"] == "top" else game["teams"]["home"]["team"]["name"],
+            },
+            "pitcher": {
+                "id"  : play["matchup"]["pitcher"]["id"],
+                "name": play["matchup"]["pitcher"]["fullName"],
+                "hand": play["matchup"]["pitchHand"]["code"],
+                "team": game["teams"]["away"]["team"]["name"] if play["about"]["halfInning"] == "bottom" else game["teams"]["home"]["team"]["name"],
+            },
+            "at_bat": {
+                "home_score"  : play["result"]["homeScore"],
+                "away_score"  : play["result"]["awayScore"],
+                "balls"       : play["playEvents"][-1]["count"]["balls"],
+                "strikes"     : play["playEvents"][-1]["count"]["strikes"],
+                "outs_when_up": play["playEvents"][-1]["count"]["outs"],
+                "inning"      : play["about"]["inning"],
+                "half_inning" : play["about"]["halfInning"],
+                "start_speed" : play["playEvents"][-1]["pitchData"]["startSpeed"] if "pitchData" in play["playEvents"][-1] and "startSpeed" in play["playEvents"][-1]["pitchData"] else None,
+                "end_speed"   : play["playEvents"][-1]["pitchData"]["endSpeed"] if "pitchData" in play["playEvents"][-1] and "endSpeed" in play["playEvents"][-1]["pitchData"] else None,
+                "plate_x"     : play["playEvents"][-1]["pitchData"]["coordinates"]["pX"] if "pitchData" in play["playEvents"][-1] and "pX" in play["playEvents"][-1]["pitchData"]["coordinates"] else None,     ## in feet!
+                "plate_z"     : play["playEvents"][-1]["pitchData"]["coordinates"]["pZ"] if "pitchData" in play["playEvents"][-1] and "pZ" in play["playEvents"][-1]["pitchData"]["coordinates"] else None,     ## in feet!
+                "pitch_name"  : play["playEvents"][-1]["details"]["type"]["description"] if "type" in play["playEvents"][-1]["details"]and play["playEvents"][-1]["details"]["type"] != "no_pitch" else None,
+            },
+        }
         #fmt: on
 
+        for mode in play_modes:
+            events[mode].append(dict(event, mode=mode))
+
     return events
 
 
@@ -313,53 +499,470 @@ def get_mlb_events_from_single_game(
 ## -------------------------------------------------------------------------- ##
 
 
+def get_video_dir(mode: str) -> str:
+    video_dir = const.HBP_PATHS["video_dir_fullpath"]
+    if mode == "derp":
+        video_dir = const.DERP_PATHS["video_dir_fullpath"]
+    elif mode == "triples":
+        video_dir = const.TRIPLES_PATHS["video_dir_fullpath"]
+    return video_dir
+
+
+def get_video_path(mode: str, game_pk: int, play_id: str) -> str:
+    """Where a play's video lives (or will live) in the mode's video dir."""
+    return os.path.join(get_video_dir(mode), f"{game_pk}_{play_id}.mp4")
+
+
+def get_shared_video_path(play_id: str) -> str:
+    """Where the one shared copy of a play's video lives, whichever modes post it."""
+    return os.path.join(const.VIDEO_STORE_DIR, f"{play_id}.mp4")
+
+
+def link_shared_video(mode: str, game_pk: int, play_id: str) -> str:
+    """
+    Points the mode's '<game_pk>_<play_id>.mp4' at the shared copy with a
+    hard link, so the mode's file and the store are the same bytes on disk.
+    Falls back to a plain copy on filesystems that can't hard link. The link
+    is made beside the target and renamed over it, so the mode path is never
+    half there.
+    """
+    shared_video_path = get_shared_video_path(play_id)
+    video_file_path = get_video_path(mode, game_pk, play_id)
+    link_path = video_file_path + ".link"
+    if os.path.lexists(link_path):
+        os.remove(link_path)
+    try:
+        os.link(shared_video_path, link_path)
+    except OSError:
+        shutil.copy2(shared_video_path, link_path)
+    os.replace(link_path, video_file_path)
+    return video_file_path
+
+
+def relink_shared_video(
+    game_pk: int,
+    play_id: str,
+    old_stat: os.stat_result,
+    verbose_bool: Optional[bool] = False,
+) -> list:
+    """
+    Called after the shared copy has been swapped for a new file (say, by a
+    transcode). Every mode's link that still points at the old file (same
+    inode as old_stat) gets pointed at the new one, so no mode is left with
+    the old bytes. Returns the modes that were relinked.
+    """
+    relinked_modes = []
+    for link_mode in const.MODE_EVENTS:
+        video_file_path = get_video_path(link_mode, game_pk, play_id)
+        try:
+            link_stat = os.stat(video_file_path)
+        except FileNotFoundError:
+            continue
+        if not os.path.samestat(link_stat, old_stat):
+            continue
+        link_shared_video(link_mode, game_pk, play_id)
+        relinked_modes.append(link_mode)
+        if verbose_bool:
+            print(f"Relinked {video_file_path} to the new shared copy.")
+    return relinked_modes
+
+
+def release_shared_video(
+    mode: str,
+    play_id: str,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    """
+    Called once a mode is done with a play's video (and has removed its own
+    link). Deletes the shared copy only if nothing else needs it: no other
+    mode directory still links to it (the file's hard link count is the
+    reference count), and no other mode has the play in its database still
+    waiting to be skeeted, since that mode may not have downloaded it yet.
+
+    Returns True if the shared copy was deleted.
+    """
+    shared_video_path = get_shared_video_path(play_id)
+    if not os.path.isfile(shared_video_path):
+        return False
+
+    if os.stat(shared_video_path).st_nlink > 1:
+        if verbose_bool:
+            print(f"Keeping {shared_video_path}: another mode still links to it.")
+        return False
+
+    for other_mode in const.MODE_EVENTS:
+        if other_mode == mode:
+            continue
+        ## Don't go creating databases for modes that have never been run.
+        db_file = dbmgr.get_table_definition(other_mode)["filename"]
+        if not os.path.isfile(db_file) or os.path.getsize(db_file) == 0:
+            continue
+        if dbmgr.get_event_play_data(other_mode, play_id) and not dbmgr.get_play_status(
+            other_mode, play_id
+        )["skeeted"]:
+            if verbose_bool:
+                print(f"Keeping {shared_video_path}: '{other_mode}' hasn't skeeted it yet.")
+            return False
+
+    os.remove(shared_video_path)
+    return True
+
+
 def download_baseball_savant_play(
     mode: str,
     game_pk: str,
     play_id: str,
     verbose_bool: Optional[bool] = False,
+    progress_bar_bool: Optional[bool] = True,
 ) -> str:
-    page_url = f"{const.BASEBALL_SAVANT_PLAY_VIDEO_URL}?playId={play_id}"
+    """
+    Makes sure the mode has the play's video, downloading it into the shared
+    video store only if no mode has fetched it yet, then linking it into the
+    mode's video dir. Returns the mode's video path, or None if Savant has
+    no video for the play.
+    """
+    video_file_path = get_video_path(mode, game_pk, play_id)
+
+    ## Only finished, verified downloads ever get renamed to this path, so if
+    ## it's there, we're done; no need to even look at the Savant page.
+    if os.path.exists(video_file_path):
+        return video_file_path
+
+    shared_video_path = get_shared_video_path(play_id)
+    try:
+        ## Another mode may have already pulled this one down.
+        if not os.path.exists(shared_video_path):
+            os.makedirs(const.VIDEO_STORE_DIR, exist_ok=True)
+            video_url = get_savant_video_url(play_id, verbose_bool)
+
+            ## Download that sucker!
+            if video_url:
+                try:
+                    stream_video_to_file(video_url, shared_video_path, progress_bar_bool)
+                except RuntimeError:
+                    ## Came up short or failed verification; nothing a fresh
+                    ## URL would fix.
+                    raise
+                except Exception as e:
+                    ## The cached URL may have gone stale. Look it up fresh
+                    ## and give it one more go.
+                    if verbose_bool:
+                        print(f"Retrying {play_id} with a fresh video URL: {e}")
+                    video_url = get_savant_video_url(play_id, verbose_bool, refresh=True)
+                    stream_video_to_file(video_url, shared_video_path, progress_bar_bool)
+            else:
+                return None
+        elif verbose_bool:
+            print(f"Reusing {shared_video_path} from the shared video store.")
+
+        link_shared_video(mode, game_pk, play_id)
+
+    except Exception as e:
+        print(f"Error fetching video for play {play_id}: {e}.")
+
+    return video_file_path
+
+
+def get_savant_video_url(
+    play_id: str,
+    verbose_bool: Optional[bool] = False,
+    refresh: Optional[bool] = False,
+) -> Optional[str]:
+    """
+    Returns the mp4 URL for a play, from the metadata cache if we've looked it
+    up before, otherwise from the play's Savant page. With refresh, always
+    goes back to the page. Returns None if the page has no video.
+    """
     video_url = None
-    video_file_path = None
+    if not refresh:
+        video_url = cache.get_cached_video_url(play_id, verbose_bool)
+
+    if video_url is None:
+        video_url = fetch_savant_video_url(play_id, verbose_bool)
+        if video_url:
+            cache.store_video_url(play_id, video_url, verbose_bool)
+
+    return video_url
 
-    ## Build filename
-    video_dir = const.HBP_PATHS["video_dir_fullpath"]
-    if mode == "derp":
-        video_dir = const.DERP_PATHS["video_dir_fullpath"]
-    elif mode == "triples":
-        video_dir = const.TRIPLES_PATHS["video_dir_fullpath"]
 
+def fetch_savant_video_url(
+    play_id: str,
+    verbose_bool: Optional[bool] = False
+) -> Optional[str]:
+    """
+    Pulls the mp4 URL out of a play's sporty-videos page. Streams the page and
+    scans it for the first <source type="video/mp4"> after the video-box,
+    then hangs up without reading (or parsing) the rest. Falls back to a
+    BeautifulSoup parse of just the video-box if the quick scan misses.
+    """
+    page_url = f"{const.BASEBALL_SAVANT_PLAY_VIDEO_URL}?playId={play_id}"
+    response = httpc.get(page_url, stream=True)
+    response.raise_for_status()
+    if response.encoding is None:
+        response.encoding = "utf-8"
+
+    page_text = ""
     try:
-        response = requests.get(page_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
-        video_container = soup.find("div", class_="video-box")
-
-        ## Download that sucker!
-        if video_container:
-            video_url = video_container.find("video").find("source", type="video/mp4")[
-                "src"
-            ]
-            video_file_path = os.path.join(video_dir, f"{game_pk}_{play_id}.mp4")
-
-            if not os.path.exists(video_file_path):
-                video_res = requests.get(video_url, stream=True)
-                video_res.raise_for_status()
-
-                ## https://stackoverflow.com/a/37573701
-                total_size = int(video_res.headers.get("content-length", 0))
-                chunk_size = 1024  # 1 KB chunks
-                with tqdm(total=total_size, unit="B", unit_scale=True) as progress_bar:
-                    with open(video_file_path, "wb") as file:
-                        for data in video_res.iter_content(chunk_size):
-                            progress_bar.update(len(data))
-                            file.write(data)
-
-                if total_size != 0 and progress_bar.n != total_size:
-                    raise RuntimeError("Could not download file")
+        for text in response.iter_content(chunk_size=16384, decode_unicode=True):
+            page_text = page_text + text
+            video_box_pos = page_text.find("video-box")
+            if video_box_pos == -1:
+                continue
+            source_match = SAVANT_VIDEO_SOURCE_RE.search(page_text, video_box_pos)
+            if source_match:
+                src_match = SAVANT_VIDEO_SRC_RE.search(source_match.group(0))
+                if src_match:
+                    return html.unescape(src_match.group(1))
+    finally:
+        response.close()
 
-    except Exception as e:
-        print(f"Error fetching video URL from {page_url}: {e}.")
+    if verbose_bool:
+        print(f"Quick scan missed the video on {page_url}; parsing the page.")
+    soup = BeautifulSoup(
+        page_text, "lxml", parse_only=SoupStrainer("div", class_="video-box")
+    )
+    video_source = soup.find("source", type="video/mp4")
+    return video_source["src"] if video_source else None
 
-    return video_file_path
+
+def stream_video_to_file(
+    video_url: str,
+    video_file_path: str,
+    progress_bar_bool: Optional[bool] = True,
+) -> int:
+    """
+    Streams a video into '<video_file_path>.part' in VIDEO_DOWNLOAD_CHUNK_SIZE
+    chunks. If an earlier attempt left a partial file, it asks for the rest
+    with an HTTP Range request instead of starting over. The finished file
+    has to match the advertised length (and the MD5, when the server's ETag
+    is one) and look like a whole MP4 before it gets renamed into place. A
+    file at video_file_path is therefore always complete.
+
+    Returns the number of bytes fetched this time. Raises RuntimeError if the
+    download comes up short; the .part file stays behind for the next try.
+    """
+    part_path = video_file_path + ".part"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    ## Ask for the raw bytes; a compressed response would throw the offsets
+    ## and lengths off.
+    headers = {"Accept-Encoding": "identity"}
+    if offset > 0:
+        headers["Range"] = f"bytes={offset}-"
+    video_res = httpc.get(video_url, stream=True, headers=headers)
+    if video_res.status_code == 416:
+        ## Our partial file doesn't line up with what's on the server.
+        video_res.close()
+        offset = 0
+        video_res = httpc.get(
+            video_url, stream=True, headers={"Accept-Encoding": "identity"}
+        )
+    video_res.raise_for_status()
+    if video_res.status_code != 206:
+        ## Server ignored the Range header and is sending the whole thing.
+        offset = 0
+
+    total_size = 0
+    content_range = video_res.headers.get("content-range", "")
+    if video_res.status_code == 206 and content_range.rsplit("/", 1)[-1].isdigit():
+        total_size = int(content_range.rsplit("/", 1)[-1])
+    elif video_res.headers.get("content-length", "").isdigit():
+        total_size = offset + int(video_res.headers["content-length"])
+
+    if total_size > const.SKEETS_VIDEO_LIMIT:
+        print(
+            f"🐘 {os.path.basename(video_file_path)} is {total_size / 1e6:.1f} MB, "
+            f"over the {const.SKEETS_VIDEO_LIMIT / 1e6:.0f} MB limit; it'll get transcoded."
+        )
+
+    ## Seed the checksum with whatever we already have on disk.
+    md5 = hashlib.md5()
+    if offset > 0:
+        with open(part_path, "rb") as file:
+            for data in iter(lambda: file.read(const.VIDEO_DOWNLOAD_CHUNK_SIZE), b""):
+                md5.update(data)
+
+    num_bytes = 0
+    ## Several bars drawing at once just make a mess, so the download queue
+    ## turns them off when it runs in parallel.
+    with tqdm(
+        total=total_size,
+        initial=offset,
+        unit="B",
+        unit_scale=True,
+        disable=not progress_bar_bool,
+    ) as progress_bar:
+        with open(
+            part_path, "ab" if offset > 0 else "wb", buffering=const.VIDEO_DOWNLOAD_CHUNK_SIZE
+        ) as file:
+            for data in video_res.iter_content(const.VIDEO_DOWNLOAD_CHUNK_SIZE):
+                file.write(data)
+                md5.update(data)
+                progress_bar.update(len(data))
+                num_bytes = num_bytes + len(data)
+
+    file_size = os.path.getsize(part_path)
+    if total_size != 0 and file_size != total_size:
+        raise RuntimeError(
+            f"Only got {file_size} of {total_size} bytes; will resume next time"
+        )
+
+    etag = video_res.headers.get("etag", "").strip('"').lower()
+    if re.fullmatch(r"[0-9a-f]{32}", etag) and md5.hexdigest() != etag:
+        os.remove(part_path)
+        raise RuntimeError(f"Checksum mismatch for {video_file_path}")
+    if not is_complete_mp4(part_path):
+        os.remove(part_path)
+        raise RuntimeError(f"{video_file_path} isn't a complete MP4")
+
+    os.replace(part_path, video_file_path)
+    return num_bytes
+
+
+def is_complete_mp4(video_file_path: str) -> bool:
+    """
+    Cheap local check that an MP4 wasn't cut short: walks the top-level
+    boxes and makes sure their sizes add up to exactly the file size and
+    that the 'moov' box made it. Only reads the box headers.
+    """
+    file_size = os.path.getsize(video_file_path)
+    box_types = set()
+    position = 0
+    with open(video_file_path, "rb") as file:
+        while position < file_size:
+            file.seek(position)
+            header = file.read(8)
+            if len(header) < 8:
+                return False
+
+            box_size = int.from_bytes(header[:4], "big")
+            if box_size == 1:
+                ## 64-bit size follows the type.
+                large_size = file.read(8)
+                if len(large_size) < 8:
+                    return False
+                box_size = int.from_bytes(large_size, "big")
+            elif box_size == 0:
+                ## Box runs to the end of the file.
+                box_size = file_size - position
+            if box_size < 8:
+                return False
+
+            box_types.add(header[4:8])
+            position = position + box_size
+
+    return position == file_size and b"moov" in box_types
+
+
+def find_partial_videos(
+    mode: str,
+    verbose_bool: Optional[bool] = False,
+    dry_run: Optional[bool] = False,
+) -> list:
+    """
+    Sweeps for this mode's downloads that need another go: leftover '.part'
+    files and '.mp4' files that fail is_complete_mp4() (say, from before
+    downloads were verified) in the mode's own video directory, plus bad
+    '.mp4' files and '.part' files in the shared video store for plays in
+    the mode's database.
+
+    A bad mode file is relinked to the store's copy when that copy is
+    complete. Otherwise the bad store copy is retired (see
+    retire_shared_video()) and the mode file moves into the store as the
+    play's '.part', so its good prefix can be resumed. With dry_run, nothing
+    on disk is touched; the sweep only reports what it would re-fetch.
+
+    Returns a list of (game_pk, play_id) tuples.
+    """
+    video_dir = get_video_dir(mode)
+    partial_videos = []
+    found_play_ids = set()
+    video_files = sorted(os.listdir(video_dir)) if os.path.isdir(video_dir) else []
+    for video_file in video_files:
+        video_file_path = os.path.join(video_dir, video_file)
+        if video_file.endswith(".mp4.part"):
+            video_root = video_file[: -len(".mp4.part")]
+        elif video_file.endswith(".mp4"):
+            video_root = video_file[: -len(".mp4")]
+        else:
+            continue
+
+        game_pk, _, play_id = video_root.partition("_")
+        if not game_pk.isdecimal() or not play_id:
+            print(f"⚠️  Skipping {video_file_path}: not a '<game_pk>_<play_id>' video.")
+            continue
+        if video_file.endswith(".mp4") and is_complete_mp4(video_file_path):
+            continue
+
+        shared_video_path = get_shared_video_path(play_id)
+        if os.path.exists(shared_video_path) and is_complete_mp4(shared_video_path):
+            ## The store has a good copy; this mode just lost track of it.
+            if verbose_bool:
+                print(f"Relinking {video_file} to {shared_video_path}.")
+            if not dry_run:
+                link_shared_video(mode, int(game_pk), play_id)
+                if video_file_path.endswith(".part"):
+                    os.remove(video_file_path)
+            continue
+
+        if verbose_bool:
+            print(f"Partial video: {video_file}")
+        if not dry_run:
+            retire_shared_video(play_id)
+            ## A hard linked mode file is the same bytes as the store copy
+            ## that was just retired, so it can go too.
+            shared_part_path = shared_video_path + ".part"
+            if os.path.exists(shared_part_path):
+                os.remove(video_file_path)
+            else:
+                os.makedirs(const.VIDEO_STORE_DIR, exist_ok=True)
+                os.replace(video_file_path, shared_part_path)
+        if play_id not in found_play_ids:
+            found_play_ids.add(play_id)
+            partial_videos.append((int(game_pk), play_id))
+
+    if os.path.isdir(const.VIDEO_STORE_DIR):
+        for video_file in sorted(os.listdir(const.VIDEO_STORE_DIR)):
+            video_file_path = os.path.join(const.VIDEO_STORE_DIR, video_file)
+            if video_file.endswith(".mp4.part"):
+                play_id = video_file[: -len(".mp4.part")]
+            elif video_file.endswith(".mp4") and not is_complete_mp4(video_file_path):
+                play_id = video_file[: -len(".mp4")]
+            else:
+                continue
+            if play_id in found_play_ids:
+                continue
+            play_data = dbmgr.get_event_play_data(mode, play_id)
+            if not play_data:
+                ## Some other mode's download.
+                continue
+
+            game_pk = int(play_data[0][1])
+            if verbose_bool:
+                print(f"Partial video: {video_file}")
+            if not dry_run:
+                retire_shared_video(play_id)
+                ## The mode's link (if any) is the same bad file.
+                video_file_path = get_video_path(mode, game_pk, play_id)
+                if os.path.exists(video_file_path):
+                    os.remove(video_file_path)
+            found_play_ids.add(play_id)
+            partial_videos.append((game_pk, play_id))
+
+    return partial_videos
+
+
+def retire_shared_video(play_id: str) -> None:
+    """
+    Takes a bad '<play_id>.mp4' out of the shared video store, so the next
+    download fetches it again instead of relinking it. It becomes the
+    play's '.part' to resume from, unless there already is one; the store
+    never holds both for one play.
+    """
+    shared_video_path = get_shared_video_path(play_id)
+    if not os.path.exists(shared_video_path):
+        return
+    if os.path.exists(shared_video_path + ".part"):
+        os.remove(shared_video_path)
+    else:
+        os.replace(shared_video_path, shared_video_path + ".part")
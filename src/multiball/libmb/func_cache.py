@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Optional
+
+from . import basic as bsc
+from . import constants as const
+from .configurator import ConfigReader
+from .sqlitemgr import get_shared_manager
+
+
+## -------------------------------------------------------------------------- ##
+## CACHE CONFIG
+## -------------------------------------------------------------------------- ##
+
+config = ConfigReader(
+    bsc.verify_file_path(bsc.sanitize_path(const.DEFAULT_CONFIG_INI_FILE))
+)
+
+#fmt: off
+cache_settings = {
+    "memory_max_items"  : int(config.get("cache", "memory_max_items")),
+    "team_ttl_seconds"  : float(config.get("cache", "team_ttl_hours")) * 3600,
+    "player_ttl_seconds": float(config.get("cache", "player_ttl_hours")) * 3600,
+    "video_url_ttl_seconds": float(config.get("cache", "video_url_ttl_hours")) * 3600,
+}
+#fmt: on
+
+## In-process LRUs, one per cache table. These sit in front of the on-disk
+## store so repeat lookups during a run don't even touch sqlite.
+_memory_caches = {}
+_memory_lock = threading.Lock()
+_tables_created = set()
+
+
+## -------------------------------------------------------------------------- ##
+## TEAM CACHE FUNCTIONS
+## -------------------------------------------------------------------------- ##
+
+
+def get_cached_team_details(
+    team_id: int,
+    season: int,
+    verbose_bool: Optional[bool] = False
+) -> Optional[dict]:
+    """
+    Looks up a team's details for a season, first in memory and then in the
+    on-disk store. Returns None on a miss or if the stored copy has outlived
+    its TTL, in which case the caller should fetch it and store it.
+    """
+    key = (int(team_id), int(season))
+    team_details = _memory_get(const.TEAMS_CACHE_TABLE, key)
+    if team_details is not None:
+        return team_details
+
+    row = _store_get(
+        const.TEAMS_CACHE_TABLE,
+        key,
+        cache_settings["team_ttl_seconds"],
+    )
+    if row is not None:
+        team_details = json.loads(row)
+        _memory_put(const.TEAMS_CACHE_TABLE, key, team_details)
+        if verbose_bool:
+            print(f"Team {team_id} ({season}) found in the metadata cache.")
+
+    return team_details
+
+
+def store_team_details(
+    team_id: int,
+    season: int,
+    team_details: dict,
+    verbose_bool: Optional[bool] = False
+) -> None:
+    key = (int(team_id), int(season))
+    _memory_put(const.TEAMS_CACHE_TABLE, key, team_details)
+    _store_put(const.TEAMS_CACHE_TABLE, key, json.dumps(team_details))
+
+
+## -------------------------------------------------------------------------- ##
+## PLAYER CACHE FUNCTIONS
+## -------------------------------------------------------------------------- ##
+
+
+def get_cached_player_details(
+    player_id: int,
+    verbose_bool: Optional[bool] = False
+) -> Optional[dict]:
+    """
+    Looks up a player's details, first in memory and then in the on-disk
+    store. Returns None on a miss or if the stored copy is stale.
+    """
+    return get_cached_players_details([player_id], verbose_bool).get(int(player_id))
+
+
+def get_cached_players_details(
+    player_ids: list,
+    verbose_bool: Optional[bool] = False
+) -> dict:
+    """
+    Bulk version of get_cached_player_details(). Returns a dict of
+    player_id -> details for every id that's cached and still fresh; ids
+    that are missing or stale are simply left out.
+    """
+    players_details = {}
+    store_ids = []
+    for player_id in set(int(player_id) for player_id in player_ids):
+        player_details = _memory_get(const.PLAYERS_CACHE_TABLE, (player_id,))
+        if player_details is None:
+            store_ids.append(player_id)
+        else:
+            players_details[player_id] = player_details
+
+    rows = _store_get_many(
+        const.PLAYERS_CACHE_TABLE,
+        store_ids,
+        cache_settings["player_ttl_seconds"],
+    )
+    for player_id, details in rows.items():
+        player_details = json.loads(details)
+        _memory_put(const.PLAYERS_CACHE_TABLE, (player_id,), player_details)
+        players_details[player_id] = player_details
+
+    if verbose_bool:
+        print(
+            f"{len(players_details)} of {len(set(player_ids))} player(s) found in the metadata cache."
+        )
+
+    return players_details
+
+
+def store_players_details(
+    players_details: dict,
+    verbose_bool: Optional[bool] = False
+) -> None:
+    """Stores a dict of player_id -> details in one transaction."""
+    rows = []
+    for player_id, player_details in players_details.items():
+        _memory_put(const.PLAYERS_CACHE_TABLE, (int(player_id),), player_details)
+        rows.append(((int(player_id),), json.dumps(player_details)))
+    _store_put_many(const.PLAYERS_CACHE_TABLE, rows)
+
+
+## -------------------------------------------------------------------------- ##
+## VIDEO URL CACHE FUNCTIONS
+## -------------------------------------------------------------------------- ##
+
+
+def get_cached_video_url(
+    play_id: str,
+    verbose_bool: Optional[bool] = False
+) -> Optional[str]:
+    """
+    Looks up the mp4 URL a play's Savant page pointed at last time. Returns
+    None on a miss or if it's past its TTL.
+    """
+    key = (str(play_id),)
+    video_url = _memory_get(const.VIDEO_URLS_CACHE_TABLE, key)
+    if video_url is not None:
+        return video_url
+
+    row = _store_get(
+        const.VIDEO_URLS_CACHE_TABLE,
+        key,
+        cache_settings["video_url_ttl_seconds"],
+    )
+    if row is not None:
+        video_url = json.loads(row)
+        _memory_put(const.VIDEO_URLS_CACHE_TABLE, key, video_url)
+        if verbose_bool:
+            print(f"Video URL for {play_id} found in the metadata cache.")
+
+    return video_url
+
+
+def store_video_url(
+    play_id: str,
+    video_url: str,
+    verbose_bool: Optional[bool] = False
+) -> None:
+    key = (str(play_id),)
+    _memory_put(const.VIDEO_URLS_CACHE_TABLE, key, video_url)
+    _store_put(const.VIDEO_URLS_CACHE_TABLE, key, json.dumps(video_url))
+
+
+## -------------------------------------------------------------------------- ##
+## CACHE PLUMBING
+## -------------------------------------------------------------------------- ##
+
+
+def _memory_get(table_definition: dict, key: tuple) -> Optional[dict]:
+    with _memory_lock:
+        cache = _memory_caches.setdefault(table_definition["tablename"], OrderedDict())
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def _memory_put(table_definition: dict, key: tuple, value: dict) -> None:
+    with _memory_lock:
+        cache = _memory_caches.setdefault(table_definition["tablename"], OrderedDict())
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > cache_settings["memory_max_items"]:
+            cache.popitem(last=False)
+
+
+def _store_get(table_definition: dict, key: tuple, ttl_seconds: float) -> Optional[str]:
+    _create_cache_table(table_definition)
+
+    #fmt: off
+    key_columns = table_definition["primary_key"]
+    where_str   = " AND ".join([f"{column} = ?" for column in key_columns])
+    #fmt: on
+
+    with get_shared_manager(table_definition["filename"]) as db:
+        select_data = db.query_data(
+            f"SELECT details, fetched_at FROM {table_definition['tablename']} WHERE {where_str}",
+            list(key),
+        )
+
+    if len(select_data) == 0:
+        return None
+    details, fetched_at = select_data[0]
+    if time.time() - fetched_at > ttl_seconds:
+        return None
+    return details
+
+
+def _store_get_many(
+    table_definition: dict,
+    ids: list,
+    ttl_seconds: float
+) -> dict:
+    """Single-column-key lookup of many rows at once. Returns id -> details."""
+    if not ids:
+        return {}
+    _create_cache_table(table_definition)
+
+    rows = {}
+    key_column = table_definition["primary_key"][0]
+    oldest_allowed = time.time() - ttl_seconds
+    with get_shared_manager(table_definition["filename"]) as db:
+        ## Stay well under sqlite's limit on bound parameters.
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            select_data = db.query_data(
+                f"SELECT {key_column}, details, fetched_at FROM {table_definition['tablename']} "
+                f"WHERE {key_column} IN ({', '.join(['?'] * len(chunk))})",
+                chunk,
+            )
+            for key_value, details, fetched_at in select_data:
+                if fetched_at >= oldest_allowed:
+                    rows[key_value] = details
+    return rows
+
+
+def _store_put(table_definition: dict, key: tuple, details: str) -> None:
+    _store_put_many(table_definition, [(key, details)])
+
+
+def _store_put_many(table_definition: dict, rows: list) -> None:
+    """Writes a list of (key, details) pairs in a single transaction."""
+    if not rows:
+        return
+    _create_cache_table(table_definition)
+
+    #fmt: off
+    key_columns  = table_definition["primary_key"]
+    columns      = ", ".join(key_columns + ["details", "fetched_at"])
+    placeholders = ", ".join(["?"] * (len(key_columns) + 2))
+    fetched_at   = int(time.time())
+    #fmt: on
+
+    with get_shared_manager(table_definition["filename"]) as db:
+        db.update_many(
+            f"INSERT OR REPLACE INTO {table_definition['tablename']} ({columns}) VALUES ({placeholders})",
+            [list(key) + [details, fetched_at] for key, details in rows],
+        )
+
+
+def _create_cache_table(table_definition: dict) -> None:
+    """Creates the cache table the first time this process touches it."""
+    if table_definition["tablename"] in _tables_created:
+        return
+
+    column_definitions = []
+    for column_name, column_def in table_definition["columns"].items():
+        column_definitions.append(f"{column_name} {column_def}")
+    column_definitions.append(
+        f"PRIMARY KEY ({', '.join(table_definition['primary_key'])})"
+    )
+
+    create_statement = (
+        f"CREATE TABLE IF NOT EXISTS {table_definition['tablename']} (\n    "
+        + ",\n    ".join(column_definitions)
+        + "\n)"
+    )
+    with get_shared_manager(table_definition["filename"]) as db:
+        db.create_table(create_statement)
+    _tables_created.add(table_definition["tablename"])
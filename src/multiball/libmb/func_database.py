@@ -2,13 +2,14 @@
 
 import os
 import pprint
+import time
 
 from . import basic as bsc
 from . import constants as const
 from .configurator import ConfigReader
-from .sqlitemgr import SQLiteManager
+from .sqlitemgr import get_shared_manager
 
-from typing import Optional
+from typing import Iterator, Optional
 
 
 ## -------------------------------------------------------------------------- ##
@@ -19,6 +20,14 @@ config = ConfigReader(
     bsc.verify_file_path(bsc.sanitize_path(const.DEFAULT_CONFIG_INI_FILE))
 )
 
+## Every wrapper below goes through get_shared_manager(), so each mode's
+## database is opened once per process and that connection gets reused until
+## exit, instead of a connect/close for every single query.
+
+## What puts a play in the plotter's and the skeeter's work queues.
+ANALYZE_QUEUE_WHERE = "analyzed = 0 AND skeeted = 0"
+SKEET_QUEUE_WHERE = "skeeted = 0"
+
 
 ## -------------------------------------------------------------------------- ##
 ## DATABASE WRAPPER FUNCTIONS
@@ -54,7 +63,7 @@ def get_all_player_data(
     if player_type not in player_types:
         return player_data
 
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         player_data = db.query_data(
             f"SELECT * FROM {table_definition['tablename']} WHERE {player_type}_id = ?",
             [player_id],
@@ -68,7 +77,7 @@ def get_earliest_date(
 ) -> str:
     select_data = None
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         select_data = db.query_data(
             f"SELECT MIN(game_date) FROM {table_definition['tablename']}", []
         )
@@ -82,7 +91,7 @@ def get_event_play_data(
 ) -> list:
     select_data = []
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         select_data = db.query_data(
             f"SELECT * FROM {table_definition['tablename']} WHERE play_id = ?",
             [play_id],
@@ -90,6 +99,88 @@ def get_event_play_data(
     return select_data
 
 
+def get_ingested_game_pks(
+    mode: str,
+    start_date_str: str,
+    end_date_str: str,
+    verbose_bool: Optional[bool] = False
+) -> set:
+    """
+    Returns the game_pks in the ingest_log for games played between the two
+    dates (inclusive, either order). Those games are finished and already in
+    the mode's table, so a backfill can skip them.
+    """
+    table_definition = get_table_definition(mode, verbose_bool)
+    date_strs = sorted([str(start_date_str), str(end_date_str)])
+    with get_shared_manager(table_definition["filename"]) as db:
+        select_data = db.query_data(
+            f"SELECT game_pk FROM {const.INGEST_LOG_TABLE['tablename']} "
+            f"WHERE game_date BETWEEN ? AND ?",
+            date_strs,
+        )
+    return set(row[0] for row in select_data)
+
+
+def get_stored_game_pks(
+    mode: str,
+    game_pks: list,
+    imported_only: Optional[bool] = False,
+    verbose_bool: Optional[bool] = False
+) -> set:
+    """
+    Returns which of game_pks already have plays in the mode's table. With
+    imported_only, only games whose plays came from a statcast import (the
+    '<game_pk>-<at_bat_number>-<pitch_number>' stand-in ids from
+    func_statcast.add_play_ids(), never a 36 character Savant id) count.
+
+    The importer and dbpop give the same pitch different play_ids, so they
+    use this to leave each other's games alone instead of storing them twice.
+    """
+    stored_game_pks = set()
+    unique_game_pks = list(set(int(game_pk) for game_pk in game_pks))
+    if not unique_game_pks:
+        return stored_game_pks
+
+    where_str = "game_pk IN ({})"
+    if imported_only:
+        where_str = where_str + " AND play_id LIKE game_pk || '-%' AND length(play_id) < 36"
+
+    table_definition = get_table_definition(mode, verbose_bool)
+    with get_shared_manager(table_definition["filename"]) as db:
+        ## Stay well under sqlite's limit on bound parameters.
+        for i in range(0, len(unique_game_pks), 500):
+            chunk = unique_game_pks[i : i + 500]
+            select_data = db.query_data(
+                f"SELECT DISTINCT game_pk FROM {table_definition['tablename']} "
+                f"WHERE {where_str.format(', '.join(['?'] * len(chunk)))}",
+                chunk,
+            )
+            stored_game_pks.update(row[0] for row in select_data)
+    return stored_game_pks
+
+
+def log_ingested_games(
+    mode: str,
+    ingested_games: list,
+    verbose_bool: Optional[bool] = False
+) -> int:
+    """
+    Records a batch of (game_pk, game_date, num_events) tuples in the mode's
+    ingest_log in one transaction. Re-logging a game just refreshes its row.
+    """
+    if not ingested_games:
+        return 0
+    table_definition = get_table_definition(mode, verbose_bool)
+    ingested_at = int(time.time())
+    with get_shared_manager(table_definition["filename"]) as db:
+        num_logged = db.update_many(
+            f"INSERT OR REPLACE INTO {const.INGEST_LOG_TABLE['tablename']} "
+            f"(game_pk, game_date, num_events, ingested_at) VALUES (?, ?, ?, ?)",
+            [list(ingested_game) + [ingested_at] for ingested_game in ingested_games],
+        )
+    return num_logged
+
+
 def get_latest_date(
     mode: str,
     verbose_bool: Optional[bool] = False
@@ -97,7 +188,7 @@ def get_latest_date(
     select_data = None
 
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         select_data = db.query_data(
             f"SELECT MAX(game_date) FROM {table_definition['tablename']}", []
         )
@@ -111,7 +202,7 @@ def get_latest_date_that_hasnt_been_downloaded(
 ) -> str:
     select_data = None
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         select_data = db.query_data(
             f"SELECT MAX(game_date) FROM {table_definition['tablename']} WHERE downloaded = 0",
             [],
@@ -119,6 +210,22 @@ def get_latest_date_that_hasnt_been_downloaded(
     return select_data[0][0]
 
 
+def get_pending_player_ids(
+    mode: str,
+    verbose_bool: Optional[bool] = False
+) -> list:
+    """Every pitcher and batter id referenced by a play that hasn't been skeeted."""
+    select_data = []
+    table_definition = get_table_definition(mode, verbose_bool)
+    with get_shared_manager(table_definition["filename"]) as db:
+        select_data = db.query_data(
+            f"SELECT pitcher_id FROM {table_definition['tablename']} WHERE skeeted = 0 "
+            f"UNION SELECT batter_id FROM {table_definition['tablename']} WHERE skeeted = 0",
+            [],
+        )
+    return [row[0] for row in select_data]
+
+
 def get_season_data(
     mode: str,
     season: int,
@@ -129,7 +236,7 @@ def get_season_data(
     season_end = f"{season}-12-31"
 
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         season_data = db.query_data(
             f"SELECT * FROM {table_definition['tablename']} WHERE game_date BETWEEN ? AND ?",
             [season_start, season_end],
@@ -191,23 +298,172 @@ def has_been_done(
     flag: str,
     verbose_bool: Optional[bool] = False
 ) -> bool:
-    flag_status = False
-
     ## Validate the flag
     valid_flags = ["downloaded", "analyzed", "skeeted"]
     if flag not in valid_flags:
         raise ValueError(f"Invalid flag '{flag}'. Must be one of: {valid_flags}")
 
+    return get_play_status(mode, play_id, verbose_bool)[flag]
+
+
+def get_play_status(
+    mode: str,
+    play_id: str,
+    verbose_bool: Optional[bool] = False
+) -> dict:
+    """
+    Returns all three workflow flags for a play from a single row fetch, as
+    {"downloaded": bool, "analyzed": bool, "skeeted": bool}. A play that
+    isn't in the database comes back with every flag False.
+    """
+    return get_play_statuses(mode, [play_id], verbose_bool)[play_id]
+
+
+def get_play_statuses(
+    mode: str,
+    play_ids: list,
+    verbose_bool: Optional[bool] = False
+) -> dict:
+    """
+    Bulk version of get_play_status(). Returns a dict of play_id -> flags
+    for every id asked about, resolved with one IN (...) query per chunk.
+    """
+    flags = ["downloaded", "analyzed", "skeeted"]
+    play_statuses = {
+        play_id: {flag: False for flag in flags} for play_id in play_ids
+    }
+    unique_ids = list(play_statuses)
+
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
+        ## Stay well under sqlite's limit on bound parameters.
+        for i in range(0, len(unique_ids), 500):
+            chunk = unique_ids[i : i + 500]
+            select_data = db.query_data(
+                f"SELECT play_id, {', '.join(flags)} FROM {table_definition['tablename']} "
+                f"WHERE play_id IN ({', '.join(['?'] * len(chunk))})",
+                chunk,
+            )
+            for row in select_data:
+                play_statuses[row[0]] = {
+                    flag: value == 1 for flag, value in zip(flags, row[1:])
+                }
+
+    return play_statuses
+
+
+def next_plays_to_analyze(
+    mode: str,
+    limit: Optional[int] = None,
+    verbose_bool: Optional[bool] = False,
+    after: Optional[tuple] = None,
+) -> list:
+    """
+    The plotter's work queue: plays that haven't been analyzed or skeeted
+    yet, oldest game first. See get_work_queue().
+    """
+    return get_work_queue(mode, ANALYZE_QUEUE_WHERE, limit, verbose_bool, after)
+
+
+def next_plays_to_skeet(
+    mode: str,
+    limit: Optional[int] = None,
+    verbose_bool: Optional[bool] = False,
+    after: Optional[tuple] = None,
+) -> list:
+    """
+    The skeeter's work queue: plays that haven't been skeeted yet, oldest
+    game first. See get_work_queue().
+    """
+    return get_work_queue(mode, SKEET_QUEUE_WHERE, limit, verbose_bool, after)
+
+
+def iter_plays_to_analyze(
+    mode: str,
+    verbose_bool: Optional[bool] = False
+) -> Iterator[dict]:
+    """Pages through next_plays_to_analyze(). See iter_work_queue()."""
+    return iter_work_queue(mode, ANALYZE_QUEUE_WHERE, verbose_bool=verbose_bool)
+
+
+def iter_plays_to_skeet(
+    mode: str,
+    verbose_bool: Optional[bool] = False
+) -> Iterator[dict]:
+    """Pages through next_plays_to_skeet(). See iter_work_queue()."""
+    return iter_work_queue(mode, SKEET_QUEUE_WHERE, verbose_bool=verbose_bool)
+
+
+def count_work_queue(
+    mode: str,
+    where_str: str,
+    verbose_bool: Optional[bool] = False
+) -> int:
+    table_definition = get_table_definition(mode, verbose_bool)
+    with get_shared_manager(table_definition["filename"]) as db:
         select_data = db.query_data(
-            f"SELECT {flag} FROM {table_definition['tablename']} WHERE play_id = ?",
-            [play_id],
+            f"SELECT COUNT(*) FROM {table_definition['tablename']} WHERE {where_str}",
+            [],
         )
-        if len(select_data) == 1 and select_data[0][0] == 1:
-            flag_status = True
+    return select_data[0][0]
 
-    return flag_status
+
+def get_work_queue(
+    mode: str,
+    where_str: str,
+    limit: Optional[int] = None,
+    verbose_bool: Optional[bool] = False,
+    after: Optional[tuple] = None,
+) -> list:
+    """
+    Returns the rows matching where_str, ordered by game_pk and play_id, as a
+    list of dicts keyed by column name so callers get the ids, date and flags
+    for each play without going back to the database. With after, a
+    (game_pk, play_id) pair, only rows past it come back. The partial
+    pending_* indexes cover these lookups.
+    """
+    table_definition = get_table_definition(mode, verbose_bool)
+    columns = list(table_definition["columns"])
+
+    query = f"SELECT {', '.join(columns)} FROM {table_definition['tablename']} WHERE {where_str}"
+    args = []
+    if after is not None:
+        query = query + " AND (game_pk, play_id) > (?, ?)"
+        args.extend(after)
+    query = query + " ORDER BY game_pk, play_id"
+    if limit is not None:
+        query = query + " LIMIT ?"
+        args.append(limit)
+
+    with get_shared_manager(table_definition["filename"]) as db:
+        select_data = db.query_data(query, args)
+
+    if verbose_bool:
+        print(f"{len(select_data)} {mode} play(s) matching '{where_str}'.")
+
+    return [dict(zip(columns, row)) for row in select_data]
+
+
+def iter_work_queue(
+    mode: str,
+    where_str: str,
+    batch_size: Optional[int] = const.WORK_QUEUE_BATCH_SIZE,
+    verbose_bool: Optional[bool] = False
+) -> Iterator[dict]:
+    """
+    Yields get_work_queue() rows batch_size at a time, fetching the next page
+    only when the caller gets to it. Pages are keyed on the last
+    (game_pk, play_id) seen rather than an offset, so plays that leave the
+    queue (or get skipped and stay in it) while the caller works don't shift
+    the pages.
+    """
+    after = None
+    while True:
+        batch = get_work_queue(mode, where_str, batch_size, verbose_bool, after)
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        after = (batch[-1]["game_pk"], batch[-1]["play_id"])
 
 
 def set_download_flag(
@@ -247,7 +503,7 @@ def set_hbp_flag(
         return flag_status
 
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         update_data = db.update_data(
             f"UPDATE {table_definition['tablename']} SET {flag} = 1 WHERE play_id = ?",
             [play_id],
@@ -307,6 +563,12 @@ def create_database(
     1. The database directory exists (creates it if necessary)
     2. The database file exists (creates an empty file if necessary)
     3. The appropriate table is created in the database
+    4. The table's secondary indexes exist
+    5. The ingest_log table dbpop uses to pick up where it left off exists
+
+    Every statement is 'IF NOT EXISTS', so it's safe to run against a
+    database that's already there; that's how older databases pick up
+    indexes added since they were created.
 
     Args:
         mode (str): The type of database to create. Must be one of: "derp", "hbp", or "triples".
@@ -328,36 +590,27 @@ def create_database(
     """
     db_was_created = False
 
-    # Generate SQL CREATE TABLE statement from the dictionary
+    # Generate SQL CREATE TABLE/INDEX statements from the dictionaries
     table_definition = get_table_definition(mode, verbose_bool)
     filename = table_definition["filename"]
     tablename = table_definition["tablename"]
-    columns = table_definition["columns"]
-
-    # Build the column definitions
-    column_definitions = []
-    for column_name, column_def in columns.items():
-        column_definitions.append(f"{column_name} {column_def}")
-
-    # Create the full SQL statement
-    create_statement = (
-        f"CREATE TABLE IF NOT EXISTS {tablename} (\n    "
-        + ",\n    ".join(column_definitions)
-        + "\n)"
-    )
+    create_statements = build_create_statements(
+        table_definition
+    ) + build_create_statements(const.INGEST_LOG_TABLE)
 
     if verbose_bool:
         print(f"Creating database table for mode: {mode}")
         print(f"Database file: {filename}")
         print(f"Table name: {tablename}")
         print(
-            f"Using SQL statement: {create_statement[:100]}..."
+            f"Using SQL statement: {create_statements[0][:100]}..."
         )  # Show first 100 chars
 
-    # Create SQLiteManager instance and create the table
+    # Use the mode's shared SQLiteManager to create the table
     try:
-        with SQLiteManager(filename) as db_manager:
-            db_manager.create_table(create_statement)
+        with get_shared_manager(filename) as db_manager:
+            for create_statement in create_statements:
+                db_manager.create_table(create_statement)
             db_was_created = True
 
         if verbose_bool:
@@ -370,59 +623,164 @@ def create_database(
     return db_was_created
 
 
+def build_create_statements(table_definition: dict) -> list:
+    """
+    Turns a table definition from constants into its CREATE TABLE statement
+    followed by a CREATE INDEX statement for each of its indexes.
+    """
+    tablename = table_definition["tablename"]
+
+    # Build the column definitions
+    column_definitions = []
+    for column_name, column_def in table_definition["columns"].items():
+        column_definitions.append(f"{column_name} {column_def}")
+
+    # Create the full SQL statement
+    create_statements = [
+        f"CREATE TABLE IF NOT EXISTS {tablename} (\n    "
+        + ",\n    ".join(column_definitions)
+        + "\n)"
+    ]
+
+    # Build the secondary index statements
+    for index_name, index_def in table_definition.get("indexes", {}).items():
+        create_statements.append(
+            f"CREATE INDEX IF NOT EXISTS idx_{tablename}_{index_name} ON {tablename} {index_def}"
+        )
+
+    return create_statements
+
+
 def insert_row(
     mode: str,
     game: list,
     event: list,
     verbose_bool: Optional[bool] = False
 ) -> bool:
-    row_inserted = False
+    return insert_rows(mode, [(game, event)], verbose_bool)[0]
+
+
+def insert_rows(
+    mode: str,
+    game_events: list,
+    verbose_bool: Optional[bool] = False,
+    mark_done: Optional[bool] = False,
+) -> list:
+    """
+    Writes a batch of (game, event) pairs to the mode's table in a single
+    transaction. Plays that are already in the table are left alone. With
+    mark_done, new rows go in already flagged as downloaded/analyzed/skeeted
+    so they don't land in the downloader, plotter and skeeter queues.
+
+    Returns a list of bools lined up with game_events: True if that play was
+    newly inserted, False if it was already there (or showed up earlier in
+    the same batch).
+    """
+    if not game_events:
+        return []
     table_definition = get_table_definition(mode, verbose_bool)
 
+    insert_data = [build_row_data(mode, game, event) for game, event in game_events]
+    if mark_done:
+        for row in insert_data:
+            row.update({"downloaded": 1, "analyzed": 1, "skeeted": 1})
+    play_ids = [row["play_id"] for row in insert_data]
+
+    with get_shared_manager(table_definition["filename"]) as db:
+        ## Holding the manager's lock, so nothing can sneak in between the
+        ## lookup and the insert.
+        existing_ids = set()
+        unique_ids = list(set(play_ids))
+        for i in range(0, len(unique_ids), 500):
+            chunk = unique_ids[i : i + 500]
+            select_data = db.query_data(
+                f"SELECT play_id FROM {table_definition['tablename']} "
+                f"WHERE play_id IN ({', '.join(['?'] * len(chunk))})",
+                chunk,
+            )
+            existing_ids.update(row[0] for row in select_data)
+
+        num_inserted = db.insert_many(
+            table_definition["tablename"], insert_data, "play_id"
+        )
+
+    insert_results = []
+    for play_id in play_ids:
+        insert_results.append(play_id not in existing_ids)
+        existing_ids.add(play_id)
+
+    if verbose_bool:
+        print(f"Inserted {num_inserted} of {len(insert_data)} {mode} row(s).")
+
+    return insert_results
+
+
+def bulk_insert_rows(
+    mode: str,
+    insert_data: list,
+    verbose_bool: Optional[bool] = False
+) -> int:
+    """
+    Writes a list of ready-made row dicts (column -> value, all with the same
+    columns) to the mode's table in one transaction, skipping play_ids that
+    are already there. Returns how many rows went in. This is for bulk loads
+    that don't need insert_rows()' per-row status.
+    """
+    table_definition = get_table_definition(mode, verbose_bool)
+    with get_shared_manager(table_definition["filename"]) as db:
+        num_inserted = db.insert_many(
+            table_definition["tablename"], insert_data, "play_id"
+        )
+
+    if verbose_bool:
+        print(f"Inserted {num_inserted} of {len(insert_data)} {mode} row(s).")
+
+    return num_inserted
+
+
+def build_row_data(mode: str, game: list, event: list) -> dict:
+    """Maps a game's details and one of its events onto a row for the mode's table."""
     #fmt: off
-    select_data = get_event_play_data(mode, event["play_id"], verbose_bool)
-    if len(select_data) == 0:
-        if mode == "derp":
-            insert_data = {
-                "play_id"    : event["play_id"],
-                "game_pk"    : game["game_pk"],
-                "game_date"  : game["date"],
-                "pitcher_id" : event["pitcher"]["id"],
-                "batter_id"  : event["batter"]["id"],
-                "event"      : event["event"],
-                "description": event["description"],
-            }
-        elif mode == "hbp":
-            insert_data = {
-                "play_id"   : event["play_id"],
-                "game_pk"   : game["game_pk"],
-                "game_date" : game["date"],
-                "pitcher_id": event["pitcher"]["id"],
-                "batter_id" : event["batter"]["id"],
-                "end_speed" : event["at_bat"]["end_speed"],
-                "x_pos"     : event["at_bat"]["plate_x"],
-                "z_pos"     : event["at_bat"]["plate_z"],
-            }
-        elif mode == "triples":
-            insert_data = {
-                "play_id"   : event["play_id"],
-                "game_pk"   : game["game_pk"],
-                "game_date" : game["date"],
-                "pitcher_id": event["pitcher"]["id"],
-                "batter_id" : event["batter"]["id"],
-            }
-
-        with SQLiteManager(table_definition["filename"]) as db:
-            row_inserted = db.insert_data(table_definition["tablename"], insert_data)
+    if mode == "derp":
+        insert_data = {
+            "play_id"    : event["play_id"],
+            "game_pk"    : game["game_pk"],
+            "game_date"  : game["date"],
+            "pitcher_id" : event["pitcher"]["id"],
+            "batter_id"  : event["batter"]["id"],
+            "event"      : event["event"],
+            "description": event["description"],
+        }
+    elif mode == "hbp":
+        insert_data = {
+            "play_id"   : event["play_id"],
+            "game_pk"   : game["game_pk"],
+            "game_date" : game["date"],
+            "pitcher_id": event["pitcher"]["id"],
+            "batter_id" : event["batter"]["id"],
+            "end_speed" : event["at_bat"]["end_speed"],
+            "x_pos"     : event["at_bat"]["plate_x"],
+            "z_pos"     : event["at_bat"]["plate_z"],
+        }
+    elif mode == "triples":
+        insert_data = {
+            "play_id"   : event["play_id"],
+            "game_pk"   : game["game_pk"],
+            "game_date" : game["date"],
+            "pitcher_id": event["pitcher"]["id"],
+            "batter_id" : event["batter"]["id"],
+        }
+    else:
+        raise ValueError(f"Invalid mode '{mode}'.")
     #fmt: on
 
-    return row_inserted
+    return insert_data
 
 
 def delete_row(mode: str, play_id: str, verbose_bool: Optional[bool] = False) -> bool:
     deleted = False
     table_definition = get_table_definition(mode, verbose_bool)
-    with SQLiteManager(table_definition["filename"]) as db:
+    with get_shared_manager(table_definition["filename"]) as db:
         delete_data = db.update_data(
             f"DELETE FROM {table_definition['tablename']} WHERE play_id = ?", [play_id]
         )
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
+import hashlib
 import os
 import pprint
+import shutil
 
+import matplotlib
 import matplotlib.pyplot as plt
 
 # import matplotlib.colors as mcolors
@@ -10,6 +13,8 @@ import matplotlib.pyplot as plt
 # import matplotlib.image as mpimg
 import numpy as np
 
+from numpy.lib import recfunctions as rfn
+
 from typing import Optional
 
 from . import basic as bsc
@@ -32,108 +37,368 @@ plot_dimensions = {
     "y_max": float(config.get("plotting", "plot_max_y")),
 }
 
+plot_cache_max_bytes = int(float(config.get("cache", "plot_cache_max_mb")) * 1e6)
+
+## Part of every plot cache key. Bump it whenever a change to the drawing code
+## changes what a plot looks like, so old PNGs stop matching.
+PLOT_CACHE_VERSION = 1
+
 
 ## -------------------------------------------------------------------------- ##
-## PLOTTING FUNCTIONS
+## PLOT DATA
 ## -------------------------------------------------------------------------- ##
 
+## One HBP row as the scatter plots see it. Pulled out of the raw database rows
+## (play_id is column 0, end_speed 5, x_pos 6, z_pos 7) in a single pass.
+HBP_PLOT_FIELDS = [
+    ("end_speed", np.float64),
+    ("x_pos", np.float64),
+    ("z_pos", np.float64),
+]
+HBP_PLOT_COLUMNS = [0, 5, 6, 7]
+
+
+def extract_hbp_plot_data(cumulative_data: list) -> np.ndarray:
+    """
+    Converts HBP table rows into a structured array of play_id plus the
+    HBP_PLOT_FIELDS, dropping any row whose end_speed, x_pos, or z_pos is
+    null/empty.
+    """
+    if not cumulative_data:
+        return np.empty(0, dtype=[("play_id", "U1")] + HBP_PLOT_FIELDS)
+
+    raw = np.array(cumulative_data, dtype=object)[:, HBP_PLOT_COLUMNS]
+    values = raw[:, 1:]
+    keep = ~((values == None) | (values == "")).any(axis=1)
+
+    play_ids = raw[keep, 0].astype(str)
+    plot_data = np.empty(len(play_ids), dtype=[("play_id", play_ids.dtype)] + HBP_PLOT_FIELDS)
+    plot_data["play_id"] = play_ids
+    plot_data["end_speed"] = values[keep, 0].astype(np.float64)
+    plot_data["x_pos"] = values[keep, 1].astype(np.float64)
+    plot_data["z_pos"] = values[keep, 2].astype(np.float64)
+    return plot_data
+
+
+def speed_gradient_colors(
+    end_speeds: np.ndarray,
+    min_speed: float,
+    max_speed: float,
+) -> np.ndarray:
+    """
+    Maps pitch speeds onto the plots' blue -> green -> red gradient: blue at
+    min_speed, green halfway, red at max_speed. Returns an (N, 3) RGB array.
+    Everything is green if there's no spread in speeds.
+    """
+    end_speeds = np.asarray(end_speeds, dtype=np.float64)
+    colors = np.zeros((len(end_speeds), 3))
+    speed_range = max_speed - min_speed
+    if speed_range == 0:  # All speeds are the same
+        colors[:, 1] = 1
+        return colors
 
-def plot_hbp_batter_play_against_career(
-    current_play: list,
-    cumulative_data: list,
-    player_info: list,
-    verbose_bool: Optional[bool] = False,
-) -> bool:
+    # Position in the range (0 = min, 1 = max), then a 0 -> 1 ratio within
+    # whichever half it falls in.
+    position = (end_speeds - min_speed) / speed_range
+    lower_half = position <= 0.5
+    ratio = np.where(lower_half, position * 2, (position - 0.5) * 2)
+
+    # RGB: blue (0,0,1) to green (0,1,0), then green (0,1,0) to red (1,0,0)
+    colors[:, 0] = np.where(lower_half, 0, ratio)
+    colors[:, 1] = np.where(lower_half, ratio, 1 - ratio)
+    colors[:, 2] = np.where(lower_half, 1 - ratio, 0)
+    return colors
+
+
+## -------------------------------------------------------------------------- ##
+## PLOT JOBS
+## -------------------------------------------------------------------------- ##
+## A plot job is a plain dict of render_hbp_plot() keyword arguments, with the
+## data already boiled down to a structured array, so it can be handed to a
+## worker process as-is.
+
+
+def build_strike_zone_corners(player_info: dict) -> list:
     # Plot strike zone box (if batter info contains strike zone data)
-    strikezone = [
+    return [
         (-0.708, player_info.get("strike_zone_bot", 1.5)),
         (-0.708, player_info.get("strike_zone_top", 3.5)),
         (0.708, player_info.get("strike_zone_top", 3.5)),
         (0.708, player_info.get("strike_zone_bot", 1.5)),
     ]
 
+
+def build_hbp_plot_job(
+    current_play: list,
+    cumulative_data: list,
+    strike_zone_corners: list,
+    title: str,
+    season: str,
+    plot_fullpath: str,
+) -> dict:
+    """
+    Boils the rows down for render_hbp_plot(). The current play is looked up
+    by play_id here, so only the float fields and its row index go along.
+    """
+    plot_data = extract_hbp_plot_data(cumulative_data)
+    current_rows = np.flatnonzero(plot_data["play_id"] == current_play[0][0])
+
+    return {
+        "plot_data": rfn.repack_fields(plot_data[[field for field, _ in HBP_PLOT_FIELDS]]),
+        "current_index": int(current_rows[0]) if len(current_rows) else None,
+        "current_speed_label": current_play[0][5],
+        "strike_zone_corners": strike_zone_corners,
+        "title": title,
+        "season": season,
+        "plot_fullpath": plot_fullpath,
+    }
+
+
+def build_hbp_batter_plot_job(
+    current_play: list,
+    cumulative_data: list,
+    player_info: dict,
+) -> dict:
     title = f"All the times {player_info['name']} (bats {player_info['hits']}) has been hit by pitches"
 
     plot_filename = f"{current_play[0][1]}_{current_play[0][0]}_batter.png"
     plot_fullpath = os.path.join(const.HBP_PATHS["plot_dir_fullpath"], plot_filename)
 
-    return plot_hbp_single_play_against_cumulative_data(
+    return build_hbp_plot_job(
         current_play,
         cumulative_data,
-        strikezone,
-        player_info["height"],
-        player_info["hits"],
+        build_strike_zone_corners(player_info),
         title,
         None,
         plot_fullpath,
-        verbose_bool,
     )
 
 
-def plot_hbp_pitcher_play_against_career(
+def build_hbp_pitcher_plot_job(
     current_play: list,
     cumulative_data: list,
-    player_info: list,
-    verbose_bool: Optional[bool] = False,
-) -> bool:
-    # Plot strike zone box (if batter info contains strike zone data)
-    strikezone = [
-        (-0.708, player_info.get("strike_zone_bot", 1.5)),
-        (-0.708, player_info.get("strike_zone_top", 3.5)),
-        (0.708, player_info.get("strike_zone_top", 3.5)),
-        (0.708, player_info.get("strike_zone_bot", 1.5)),
-    ]
-
+    player_info: dict,
+) -> dict:
     title = f"All the times {player_info['name']} (throws {player_info['pitches']}) has hit batters"
 
     plot_filename = f"{current_play[0][1]}_{current_play[0][0]}_pitcher.png"
     plot_fullpath = os.path.join(const.HBP_PATHS["plot_dir_fullpath"], plot_filename)
 
-    return plot_hbp_single_play_against_cumulative_data(
+    return build_hbp_plot_job(
         current_play,
         cumulative_data,
-        strikezone,
-        None,
-        None,
+        build_strike_zone_corners(player_info),
         title,
         None,
         plot_fullpath,
-        verbose_bool,
     )
 
 
-def plot_hbp_current_play_against_season(
+def build_hbp_season_plot_job(
     current_play: list,
     cumulative_data: list,
-    pitcher_info: list,
-    batter_info: list,
-    verbose_bool: Optional[bool] = False,
-) -> bool:
+    pitcher_info: dict,
+    batter_info: dict,
+) -> dict:
     game_date = current_play[0][2]
     season, month, day = game_date.split("-")
 
-    # Plot strike zone box (if batter info contains strike zone data)
-    strikezone = [
-        (-0.708, batter_info.get("strike_zone_bot", 1.5)),
-        (-0.708, batter_info.get("strike_zone_top", 3.5)),
-        (0.708, batter_info.get("strike_zone_top", 3.5)),
-        (0.708, batter_info.get("strike_zone_bot", 1.5)),
-    ]
-
     title = f"{pitcher_info['name']} (throws {pitcher_info['pitches']}) vs {batter_info['name']} (bats {batter_info['hits']}), {game_date}"
     title = title + f"\nplotted with every HBP in {season}"
     plot_filename = f"{current_play[0][1]}_{current_play[0][0]}_{season}.png"
     plot_fullpath = os.path.join(const.HBP_PATHS["plot_dir_fullpath"], plot_filename)
 
-    return plot_hbp_single_play_against_cumulative_data(
+    return build_hbp_plot_job(
         current_play,
         cumulative_data,
-        strikezone,
-        batter_info["height"],
-        batter_info["hits"],
+        build_strike_zone_corners(batter_info),
         title,
         season,
         plot_fullpath,
+    )
+
+
+def init_plot_worker() -> None:
+    """
+    ProcessPoolExecutor initializer for plot workers: switch to the Agg
+    backend (no display in a worker) and build the plot template up front.
+    """
+    plt.switch_backend("Agg")
+    get_hbp_plot_template()
+
+
+def run_hbp_plot_job(job: dict, verbose_bool: Optional[bool] = False) -> bool:
+    """
+    Renders a plot job, or copies the PNG out of the plot cache if this exact
+    plot has been drawn before.
+    """
+    if plot_cache_max_bytes <= 0:
+        return render_hbp_plot(**job, verbose_bool=verbose_bool)
+
+    cache_key = build_plot_cache_key(job)
+    if get_cached_plot(cache_key, job["plot_fullpath"], verbose_bool):
+        print(f"   🗃️  {job['plot_fullpath']} (cached)")
+        return True
+
+    plot_result = render_hbp_plot(**job, verbose_bool=verbose_bool)
+    if plot_result:
+        ## The plot itself is fine at this point, so a cache that can't be
+        ## written to (full disk, permissions...) shouldn't fail the play.
+        try:
+            store_cached_plot(cache_key, job["plot_fullpath"], verbose_bool)
+        except OSError as e:
+            print(f"   ⚠️  Couldn't store {job['plot_fullpath']} in the plot cache: {e}")
+    return plot_result
+
+
+## -------------------------------------------------------------------------- ##
+## PLOT CACHE
+## -------------------------------------------------------------------------- ##
+## Finished PNGs live in PLOT_CACHE_DIR as '<sha256>.png', outside the mode
+## plot dirs that cleanup_after_skeet() empties. A file's mtime is when it
+## was last used, and eviction goes oldest first.
+
+
+def build_plot_cache_key(job: dict) -> str:
+    """
+    Hashes everything that decides what a plot job's PNG looks like: the
+    points, the highlighted row and its label, the strike zone, title,
+    season, the plot settings, and the matplotlib and cache versions. The
+    output path isn't part of it.
+
+    Since the highlighted play is part of the key, a career or season plot
+    is only reused when that same play gets plotted again (a re-run after a
+    failed skeet, or a rebuilt queue), not by the next play in the season.
+    """
+    plot_data = job["plot_data"]
+    digest = hashlib.sha256()
+    digest.update(str(plot_data.dtype).encode())
+    digest.update(np.ascontiguousarray(plot_data).tobytes())
+    digest.update(
+        repr(
+            (
+                PLOT_CACHE_VERSION,
+                matplotlib.__version__,
+                sorted(plot_dimensions.items()),
+                job["current_index"],
+                str(job["current_speed_label"]),
+                [tuple(map(float, corner)) for corner in job["strike_zone_corners"]],
+                job["title"],
+                job["season"],
+            )
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def get_cached_plot(
+    cache_key: str,
+    plot_fullpath: str,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    """Copies a cached plot to plot_fullpath. Returns False on a miss."""
+    cached_path = os.path.join(const.PLOT_CACHE_DIR, f"{cache_key}.png")
+    try:
+        shutil.copyfile(cached_path, plot_fullpath)
+        os.utime(cached_path)
+    except FileNotFoundError:
+        ## Never drawn, or evicted out from under us by another worker.
+        return False
+
+    if verbose_bool:
+        print(f"Plot {cache_key} found in the plot cache.")
+    return True
+
+
+def store_cached_plot(
+    cache_key: str,
+    plot_fullpath: str,
+    verbose_bool: Optional[bool] = False,
+) -> None:
+    """Copies a freshly rendered plot into the cache, then trims the cache."""
+    os.makedirs(const.PLOT_CACHE_DIR, exist_ok=True)
+    cached_path = os.path.join(const.PLOT_CACHE_DIR, f"{cache_key}.png")
+
+    ## Copy beside it and rename, so other workers never see half a PNG.
+    temp_path = f"{cached_path}.{os.getpid()}.tmp"
+    shutil.copyfile(plot_fullpath, temp_path)
+    os.replace(temp_path, cached_path)
+
+    num_evicted = evict_plot_cache(plot_cache_max_bytes)
+    if verbose_bool:
+        print(f"Plot {cache_key} stored in the plot cache ({num_evicted} evicted).")
+
+
+def evict_plot_cache(max_bytes: int) -> int:
+    """
+    Deletes least recently used PNGs until the cache fits in max_bytes.
+    Returns how many were deleted.
+    """
+    cached_plots = []
+    total_bytes = 0
+    for entry in os.scandir(const.PLOT_CACHE_DIR):
+        if not entry.name.endswith(".png"):
+            continue
+        try:
+            entry_stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        cached_plots.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+        total_bytes = total_bytes + entry_stat.st_size
+
+    num_evicted = 0
+    for _, size, path in sorted(cached_plots):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            num_evicted = num_evicted + 1
+        except FileNotFoundError:
+            pass
+        total_bytes = total_bytes - size
+    return num_evicted
+
+
+## -------------------------------------------------------------------------- ##
+## PLOTTING FUNCTIONS
+## -------------------------------------------------------------------------- ##
+
+
+def plot_hbp_batter_play_against_career(
+    current_play: list,
+    cumulative_data: list,
+    player_info: list,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    return run_hbp_plot_job(
+        build_hbp_batter_plot_job(current_play, cumulative_data, player_info),
+        verbose_bool,
+    )
+
+
+def plot_hbp_pitcher_play_against_career(
+    current_play: list,
+    cumulative_data: list,
+    player_info: list,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    return run_hbp_plot_job(
+        build_hbp_pitcher_plot_job(current_play, cumulative_data, player_info),
+        verbose_bool,
+    )
+
+
+def plot_hbp_current_play_against_season(
+    current_play: list,
+    cumulative_data: list,
+    pitcher_info: list,
+    batter_info: list,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    return run_hbp_plot_job(
+        build_hbp_season_plot_job(
+            current_play, cumulative_data, pitcher_info, batter_info
+        ),
         verbose_bool,
     )
 
@@ -149,35 +414,204 @@ def plot_hbp_single_play_against_cumulative_data(
     plot_fullpath: str,
     verbose_bool: Optional[bool] = False,
 ) -> bool:
-    # Extract data for plotting with validation
-    x_positions = []
-    z_positions = []
-    end_speeds = []
-
-    null_warnings = []
-    for i, item in enumerate(cumulative_data):
-        # Check for None or empty values
-        if item[6] is None or item[6] == "":
-            null_warnings.append(f"Row {i+1}: x_pos is null/empty")
-            continue
-        if item[7] is None or item[7] == "":
-            null_warnings.append(f"Row {i+1}: z_pos is null/empty")
-            continue
-        if item[5] is None or item[5] == "":
-            null_warnings.append(f"Row {i+1}: end_speed is null/empty")
-            continue
+    return run_hbp_plot_job(
+        build_hbp_plot_job(
+            current_play,
+            cumulative_data,
+            strike_zone_corners,
+            title,
+            season,
+            plot_fullpath,
+        ),
+        verbose_bool,
+    )
 
-        x_positions.append(float(item[6]))  # x_pos (column 6)
-        z_positions.append(float(item[7]))  # z_pos (column 7)
-        end_speeds.append(float(item[5]))  # end_speed (column 5)
+
+def render_hbp_plot(
+    plot_data: np.ndarray,
+    current_index: int,
+    current_speed_label: str,
+    strike_zone_corners: list,
+    title: str,
+    season: str,
+    plot_fullpath: str,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    """
+    Draws one HBP scatter plot from the HBP_PLOT_FIELDS of
+    extract_hbp_plot_data(), with the row at current_index highlighted, and
+    saves it to plot_fullpath. Returns False without saving anything if
+    there's nothing to plot or the current play isn't in the data
+    (current_index is None).
+    """
+    x_positions = plot_data["x_pos"]
+    z_positions = plot_data["z_pos"]
+    end_speeds = plot_data["end_speed"]
 
     # Check if we have any valid data to plot
-    if not x_positions or not z_positions or not end_speeds:
+    if len(plot_data) == 0:
         print(
             f"   ❌ No valid data available for plotting after filtering null/empty fields."
         )
         return False
 
+    # Highlight current play if it's in this data. build_hbp_plot_job()
+    # found it by play_id, instead of by matching speed and position.
+    if current_index is None:
+        print(f"   ⚠️  Current play isn't in the plot data (or has null/empty fields), skipping highlight")
+        return False
+    current_row = plot_data[current_index]
+    current_x = current_row["x_pos"]
+    current_z = current_row["z_pos"]
+    current_speed = current_row["end_speed"]
+
+    # Home plate, the dirt note, axes and colorbar are already on the
+    # template; everything drawn below is removed again once it's saved.
+    template = get_hbp_plot_template()
+    fig = template["fig"]
+    ax = template["ax"]
+    plot_artists = []
+
+    try:
+        # Create strike zone box with no fill (outline only)
+        strike_zone_box = plt.Polygon(
+            strike_zone_corners,
+            closed=True,
+            fill=False,  # No fill as requested
+            edgecolor="black",
+            linewidth=1.0,
+            zorder=1,
+        )  # Draw underneath scatter points
+        plot_artists.append(ax.add_patch(strike_zone_box))
+
+        # Define color gradient: blue at min speed, green at average speed, red at max speed
+        min_speed = end_speeds.min()
+        max_speed = end_speeds.max()
+        colors = speed_gradient_colors(end_speeds, min_speed, max_speed)
+
+        # Create scatter plot
+        scatter = ax.scatter(
+            x_positions,
+            z_positions,
+            c=colors,
+            s=50,
+            alpha=0.7,
+            edgecolors="black",
+            linewidths=0.5,
+        )
+        plot_artists.append(scatter)
+
+        # Point the colorbar at this plot's speed range
+        template["speed_mappable"].set_clim(min_speed, max_speed)
+
+        # Determine color based on current play speed, same gradient as the rest
+        current_color = tuple(
+            speed_gradient_colors([current_speed], min_speed, max_speed)[0]
+        )
+
+        plot_artists.append(
+            ax.scatter(
+                [current_x],
+                [current_z],
+                c=[current_color],
+                s=150,  # Twice as big as regular points (50 -> 100)
+                alpha=1.0,
+                edgecolors="yellow",  # Changed to thick yellow border as requested
+                linewidths=3.0,  # Thick border as requested
+                marker="s",  # Square marker as requested
+            )
+        )
+
+        # Add title.
+        ax.set_title(title, fontsize=14, pad=20)
+
+        # Create legend with data point count.
+        legend_elements = [
+            plt.Line2D(
+                [0],
+                [0],
+                marker="s",
+                color="w",
+                label=f"Current Play, {current_speed_label} mph",
+                markerfacecolor=current_color,
+                markersize=10,
+                markeredgecolor="yellow",
+                markeredgewidth=3.0,
+            )
+        ]
+
+        # Add data point count to legend.
+        data_point_count = len(x_positions)
+        legend_label = f"{data_point_count} HBP for career"
+        if season:
+            legend_label = f"{data_point_count} HBP in {season}"
+        legend_elements.append(
+            plt.Line2D(
+                [0],
+                [0],
+                marker="o",
+                color="w",
+                label=legend_label,
+                markerfacecolor="gray",
+                markersize=8,
+                markeredgecolor="black",
+                markeredgewidth=0.5,
+            )
+        )
+
+        # Add legend to plot with bbox_to_anchor to ensure it fits within layout.
+        plot_artists.append(
+            ax.legend(
+                handles=legend_elements,
+                fontsize=10,
+                loc="upper right",
+                bbox_to_anchor=(1.0, 1.0),
+            )
+        )
+
+        # Save the plot. The template's layout and crop are fixed, so
+        # there's no tight_layout/tight bbox pass here.
+        fig.savefig(plot_fullpath, bbox_inches=template["bbox_inches"])
+        print(f"   🖼️  {plot_fullpath}")
+
+    finally:
+        # Strip this plot's layers back off the template for the next one
+        for artist in plot_artists:
+            artist.remove()
+        ax.set_title("")
+
+    return True
+
+
+## -------------------------------------------------------------------------- ##
+## PLOT TEMPLATE
+## -------------------------------------------------------------------------- ##
+
+## The static parts of an HBP plot, built on first use and reused for every
+## plot this process draws. See get_hbp_plot_template().
+_hbp_plot_template = None
+
+
+def get_hbp_plot_template() -> dict:
+    """
+    Returns this process's HBP plot template, building it the first time:
+    {"fig": Figure, "ax": Axes, "speed_mappable": ScalarMappable,
+    "bbox_inches": Bbox}. The colorbar follows speed_mappable, so set_clim()
+    on it per plot, and save with the template's bbox_inches.
+    """
+    global _hbp_plot_template
+    if _hbp_plot_template is None:
+        _hbp_plot_template = build_hbp_plot_template()
+    return _hbp_plot_template
+
+
+def build_hbp_plot_template() -> dict:
+    """
+    Draws everything every HBP plot shares (home plate, ground line, dirt
+    note, grid, labels, fixed axis limits and the speed colorbar) and lays
+    the figure out once, with room for a two-line title. Plots drawn on it
+    skip tight_layout entirely.
+    """
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 8))
 
@@ -237,197 +671,35 @@ def plot_hbp_single_play_against_cumulative_data(
         ),
     )
 
-    # Create strike zone box with no fill (outline only)
-    strike_zone_box = plt.Polygon(
-        strike_zone_corners,
-        closed=True,
-        fill=False,  # No fill as requested
-        edgecolor="black",
-        linewidth=1.0,
-        zorder=1,
-    )  # Draw underneath scatter points
-    ax.add_patch(strike_zone_box)
-
-    # Define color gradient: blue at min speed, green at average speed, red at max speed
-    min_speed = min(end_speeds)
-    max_speed = max(end_speeds)
-    speed_range = max_speed - min_speed
-
-    # Create color array based on speed gradient (blue -> green -> red)
-    colors = []
-    for speed in end_speeds:
-        if speed_range == 0:  # All speeds are the same
-            # Use green for all points if no variation
-            colors.append((0, 1, 0))  # RGB: green
-        else:
-            # Calculate position in the range (0 = min, 1 = max)
-            position = (speed - min_speed) / speed_range
-
-            # Blue to green to red gradient
-            if position <= 0.5:  # Blue to green (min to average)
-                # Ratio from 0 to 1 in the first half
-                ratio = position * 2
-                # RGB: blue (0,0,1) to green (0,1,0)
-                colors.append((0, ratio, 1 - ratio))
-            else:  # Green to red (average to max)
-                # Ratio from 0 to 1 in the second half
-                ratio = (position - 0.5) * 2
-                # RGB: green (0,1,0) to red (1,0,0)
-                colors.append((ratio, 1 - ratio, 0))
-
-    # Create scatter plot
-    scatter = ax.scatter(
-        x_positions,
-        z_positions,
-        c=colors,
-        s=50,
-        alpha=0.7,
-        edgecolors="black",
-        linewidths=0.5,
-    )
-
     # Add colorbar with adjusted size and positioning
-    sm = plt.cm.ScalarMappable(
-        cmap=plt.cm.jet, norm=plt.Normalize(vmin=min(end_speeds), vmax=max(end_speeds))
-    )
-    sm.set_array([])
-    cbar = plt.colorbar(sm, ax=ax, fraction=0.046, pad=0.04)
+    speed_mappable = plt.cm.ScalarMappable(cmap=plt.cm.jet, norm=plt.Normalize(vmin=0, vmax=1))
+    speed_mappable.set_array([])
+    cbar = plt.colorbar(speed_mappable, ax=ax, fraction=0.046, pad=0.04)
     cbar.set_label("Pitch Speed (mph)", rotation=270, labelpad=10)
 
-    # Highlight current play if it's in the season data
-    try:
-        # Validate current play data
-        if (
-            current_play[0][6] is None
-            or current_play[0][6] == ""
-            or current_play[0][7] is None
-            or current_play[0][7] == ""
-            or current_play[0][5] is None
-            or current_play[0][5] == ""
-        ):
-            print(f"   ⚠️  Current play has null/empty fields, skipping highlight")
-            current_in_season = False
-        else:
-            current_x = float(current_play[0][6])
-            current_z = float(current_play[0][7])
-            current_speed = float(current_play[0][5])
-    except (ValueError, TypeError, IndexError) as e:
-        print(f"   ⚠️  Error processing current play data: {e}, skipping highlight")
-        current_in_season = False
-
-    # Check if current play is in this season's data
-    def is_current_play_match(item):
-        try:
-            if item[6] is None or item[7] is None or item[5] is None:
-                return False
-            return (
-                abs(float(item[6]) - current_x) < 0.01
-                and abs(float(item[7]) - current_z) < 0.01
-                and abs(float(item[5]) - current_speed) < 0.01
-            )
-        except (ValueError, TypeError):
-            return False
-
-    current_in_season = any(is_current_play_match(item) for item in cumulative_data)
-
-    if current_in_season:
-        # Determine color based on current play speed
-        # Calculate current play color using the same gradient logic
-        if speed_range == 0:  # All speeds are the same
-            current_color = (0, 1, 0)  # RGB: green
-        else:
-            # Calculate position in the range (0 = min, 1 = max)
-            position = (current_speed - min_speed) / speed_range
-
-            # Blue to green to red gradient
-            if position <= 0.5:  # Blue to green (min to average)
-                # Ratio from 0 to 1 in the first half
-                ratio = position * 2
-                # RGB: blue (0,0,1) to green (0,1,0)
-                current_color = (0, ratio, 1 - ratio)
-            else:  # Green to red (average to max)
-                # Ratio from 0 to 1 in the second half
-                ratio = (position - 0.5) * 2
-                # RGB: green (0,1,0) to red (1,0,0)
-                current_color = (ratio, 1 - ratio, 0)
-
-        ax.scatter(
-            [current_x],
-            [current_z],
-            c=[current_color],
-            s=150,  # Twice as big as regular points (50 -> 100)
-            alpha=1.0,
-            edgecolors="yellow",  # Changed to thick yellow border as requested
-            linewidths=3.0,  # Thick border as requested
-            marker="s",  # Square marker as requested
-        )
-    else:
-        return False
-
-    # Add title and labels.
-    ax.set_title(title, fontsize=14, pad=20)
+    # Add labels and grid.
     ax.set_xlabel("Feet from center of home plate", fontsize=12)
     ax.set_ylabel("Feet from ground", fontsize=12)
-
-    # Add grid and legend.
     ax.grid(True, alpha=0.3)
 
-    # Create legend with data point count.
-    legend_elements = []
-    if current_in_season:
-        legend_elements.append(
-            plt.Line2D(
-                [0],
-                [0],
-                marker="s",
-                color="w",
-                label=f"Current Play, {current_play[0][5]} mph",
-                markerfacecolor=current_color,
-                markersize=10,
-                markeredgecolor="yellow",
-                markeredgewidth=3.0,
-            )
-        )
-
-    # Add data point count to legend.
-    data_point_count = len(x_positions)
-    legend_label = f"{data_point_count} HBP for career"
-    if season:
-        legend_label = f"{data_point_count} HBP in {season}"
-    legend_elements.append(
-        plt.Line2D(
-            [0],
-            [0],
-            marker="o",
-            color="w",
-            label=legend_label,
-            markerfacecolor="gray",
-            markersize=8,
-            markeredgecolor="black",
-            markeredgewidth=0.5,
-        )
-    )
-
-    # Add legend to plot with bbox_to_anchor to ensure it fits within layout.
-    ax.legend(
-        handles=legend_elements,
-        fontsize=10,
-        loc="upper right",
-        bbox_to_anchor=(1.0, 1.0),
-    )
-
-    # Adjust layout with padding to accommodate batter silhouette and other decorations
-    # Use tight_layout with adjusted parameters to ensure proper spacing for colorbar and legend
-    plt.tight_layout(pad=1.05, rect=[0.05, 0.05, 0.95, 0.95])
-
     # Set fixed axis limits.
     ax.set_xlim(plot_dimensions["x_min"], plot_dimensions["x_max"])
     ax.set_ylim(plot_dimensions["y_min"], plot_dimensions["y_max"])
 
-    # Save the plot
-    plt.savefig(plot_fullpath, bbox_inches="tight")
-    print(f"   🖼️  {plot_fullpath}")
-
-    plt.close(fig)
-
-    return True
+    # Lay out once around a stand-in two-line title (the season plots' title
+    # is two lines), then freeze it.
+    ax.set_title("Title\nTitle", fontsize=14, pad=20)
+    fig.tight_layout(pad=1.05, rect=[0.05, 0.05, 0.95, 0.95])
+
+    # Work out the tight crop (what savefig's bbox_inches="tight" does) once,
+    # too, so saves can reuse it instead of measuring every figure again.
+    fig.canvas.draw()
+    bbox_inches = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    ax.set_title("")
+
+    return {
+        "fig": fig,
+        "ax": ax,
+        "speed_mappable": speed_mappable,
+        "bbox_inches": bbox_inches,
+    }
@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 
 from . import constants as const
 from . import func_baseball as bb
+from . import func_database as dbmgr
 
 
 ## -------------------------------------------------------------------------- ##
@@ -55,6 +56,50 @@ def cleanup_after_skeet(
         os.remove(video_filepath)
         files_removed.append(video_filepath)
 
+    ## Then the shared copy, if this was the last mode that needed it.
+    if bb.release_shared_video(mode, play_id, verbose_bool):
+        files_removed.append(bb.get_shared_video_path(play_id))
+
+    return files_removed
+
+
+def sweep_skeeted_leftovers(
+    mode: str,
+    verbose_bool: Optional[bool] = False,
+) -> list:
+    """
+    Finds plays that still have skeet, plot or video files lying around
+    even though the database says they've been skeeted (say, the skeeter
+    died between set_skeeted_flag() and cleanup_after_skeet()), and cleans
+    them up. Returns every file removed.
+    """
+    mode_paths = const.HBP_PATHS
+    if mode == "derp":
+        mode_paths = const.DERP_PATHS
+    elif mode == "triples":
+        mode_paths = const.TRIPLES_PATHS
+
+    leftover_plays = set()
+    for dir_key in ["skeet_dir_fullpath", "plot_dir_fullpath", "video_dir_fullpath"]:
+        if not os.path.isdir(mode_paths[dir_key]):
+            continue
+        for filename in os.listdir(mode_paths[dir_key]):
+            ## '<game_pk>_<play_id>_desc.txt', '<game_pk>_<play_id>_batter.png',
+            ## '<game_pk>_<play_id>.mp4' and so on.
+            file_parts = filename.split(".", 1)[0].split("_")
+            if len(file_parts) >= 2 and file_parts[0].isdigit():
+                leftover_plays.add((int(file_parts[0]), file_parts[1]))
+
+    play_statuses = dbmgr.get_play_statuses(
+        mode, sorted({play_id for _, play_id in leftover_plays}), verbose_bool
+    )
+
+    files_removed = []
+    for game_pk, play_id in sorted(leftover_plays):
+        if play_statuses[play_id]["skeeted"]:
+            if verbose_bool:
+                print(f"  🤨 {play_id} has already been skeeted! Cleaning up after it.")
+            files_removed.extend(cleanup_after_skeet(mode, game_pk, play_id, verbose_bool))
     return files_removed
 
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from typing import Iterator, Optional
+
+from . import constants as const
+
+
+## Statcast columns the importer reads. Anything else in the export is left on
+## disk. 'play_id' is optional; see add_play_ids().
+STATCAST_COLUMNS = [
+    "game_pk",
+    "game_date",
+    "pitcher",
+    "batter",
+    "events",
+    "des",
+    "at_bat_number",
+    "pitch_number",
+    "plate_x",
+    "plate_z",
+    "vx0",
+    "vy0",
+    "vz0",
+    "ax",
+    "ay",
+    "az",
+    "play_id",
+]
+
+## Statcast measures pitch trajectories from y = 50 ft and calls the front of
+## home plate y = 17/12 ft, which is where the live feed's endSpeed is taken.
+STATCAST_Y0 = 50.0
+STATCAST_PLATE_Y = 17.0 / 12.0
+FT_PER_SEC_TO_MPH = 3600.0 / 5280.0
+
+
+## -------------------------------------------------------------------------- ##
+## READING EXPORTS
+## -------------------------------------------------------------------------- ##
+
+
+def read_statcast_export(
+    filepath: str,
+    chunk_rows: Optional[int] = const.STATCAST_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads a statcast-format export (Baseball Savant CSV, or a Parquet file
+    saved from a pybaseball frame) chunk_rows rows at a time, keeping only the
+    columns in STATCAST_COLUMNS. A multi-season export never has to fit in
+    memory all at once.
+
+    Parquet files are read a batch at a time with pyarrow, which has to be
+    installed for them.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(filepath)
+        columns = [
+            column for column in STATCAST_COLUMNS if column in parquet_file.schema_arrow.names
+        ]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(
+            filepath,
+            chunksize=chunk_rows,
+            usecols=lambda column: column in STATCAST_COLUMNS,
+            low_memory=False,
+        )
+
+
+## -------------------------------------------------------------------------- ##
+## VECTORIZED TRANSFORMS
+## -------------------------------------------------------------------------- ##
+
+
+def filter_statcast_events(chunk: pd.DataFrame, modes: list) -> pd.DataFrame:
+    """
+    Keeps the rows whose 'events' value belongs to one of the modes, and
+    adds an 'event' column (the live feed's name for it) and a 'mode' column.
+    """
+    event_modes = {}
+    for mode in modes:
+        for event in const.MODE_EVENTS[mode]:
+            event_modes[event] = mode
+
+    events = chunk["events"].map(const.STATCAST_EVENTS)
+    keep = events.isin(list(event_modes))
+    filtered = chunk.loc[keep].copy()
+    filtered["event"] = events[keep]
+    filtered["mode"] = filtered["event"].map(event_modes)
+    return filtered
+
+
+def add_play_ids(events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fills in 'play_id'. Exports that carry Savant's play ids keep them.
+    Everything else gets a stable '<game_pk>-<at_bat_number>-<pitch_number>'
+    stand-in. It's good enough for history and plots, but Savant won't find
+    a video for it.
+    """
+    surrogate_ids = (
+        events["game_pk"].astype("int64").astype(str)
+        + "-"
+        + events["at_bat_number"].astype("int64").astype(str)
+        + "-"
+        + events["pitch_number"].astype("int64").astype(str)
+    )
+    if "play_id" in events.columns:
+        events["play_id"] = events["play_id"].where(events["play_id"].notna(), surrogate_ids)
+    else:
+        events["play_id"] = surrogate_ids
+    return events
+
+
+def compute_end_speed(events: pd.DataFrame) -> pd.Series:
+    """
+    Works out each pitch's speed (mph) as it crosses the front of the plate
+    from the statcast trajectory fit (vx0/vy0/vz0, ax/ay/az), the same number
+    the live feed reports as 'endSpeed'. Rows missing trajectory data get NaN.
+    """
+    if not {"vx0", "vy0", "vz0", "ax", "ay", "az"}.issubset(events.columns):
+        return pd.Series(np.nan, index=events.index)
+
+    #fmt: off
+    vy_f = -np.sqrt(events["vy0"] ** 2 - 2.0 * events["ay"] * (STATCAST_Y0 - STATCAST_PLATE_Y))
+    t    = (vy_f - events["vy0"]) / events["ay"]
+    vx_f = events["vx0"] + events["ax"] * t
+    vz_f = events["vz0"] + events["az"] * t
+    #fmt: on
+    return (np.sqrt(vx_f**2 + vy_f**2 + vz_f**2) * FT_PER_SEC_TO_MPH).round(1)
+
+
+def build_mode_rows(
+    events: pd.DataFrame,
+    mode: str,
+    mark_done: Optional[bool] = True,
+) -> list:
+    """
+    Shapes one mode's events into row dicts for that mode's table, the same
+    columns func_database.build_row_data() fills from the live feed. With
+    mark_done, rows go in already flagged as downloaded/analyzed/skeeted so
+    imported history doesn't flood the downloader and skeeter queues.
+    """
+    mode_events = events.loc[events["mode"] == mode]
+
+    #fmt: off
+    rows = pd.DataFrame({
+        "play_id"   : mode_events["play_id"].astype(str),
+        "game_pk"   : mode_events["game_pk"].astype("int64"),
+        "game_date" : pd.to_datetime(mode_events["game_date"]).dt.strftime("%Y-%m-%d"),
+        "pitcher_id": mode_events["pitcher"].astype("int64"),
+        "batter_id" : mode_events["batter"].astype("int64"),
+    })
+    if mode == "derp":
+        rows["event"]       = mode_events["event"]
+        rows["description"] = mode_events["des"] if "des" in mode_events.columns else None
+    elif mode == "hbp":
+        rows["end_speed"]   = compute_end_speed(mode_events)
+        rows["x_pos"]       = mode_events["plate_x"] if "plate_x" in mode_events.columns else np.nan
+        rows["z_pos"]       = mode_events["plate_z"] if "plate_z" in mode_events.columns else np.nan
+    if mark_done:
+        rows["downloaded"]  = 1
+        rows["analyzed"]    = 1
+        rows["skeeted"]     = 1
+    #fmt: on
+
+    ## sqlite wants None, not NaN, for missing values.
+    rows = rows.astype(object).where(rows.notna(), None)
+    return rows.to_dict("records")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import subprocess
+
+from typing import Optional
+
+from . import basic as bsc
+from . import constants as const
+from .configurator import ConfigReader
+
+
+## -------------------------------------------------------------------------- ##
+## VIDEO CONFIG
+## -------------------------------------------------------------------------- ##
+
+config = ConfigReader(
+    bsc.verify_file_path(bsc.sanitize_path(const.DEFAULT_CONFIG_INI_FILE))
+)
+
+ffmpeg_path = config.get("client_parameters", "ffmpeg_path")
+
+
+## -------------------------------------------------------------------------- ##
+## SIZE CHECKS AND TRANSCODING
+## -------------------------------------------------------------------------- ##
+
+
+def fits_upload_limit(
+    video_file_path: str,
+    limit_bytes: Optional[int] = const.SKEETS_VIDEO_LIMIT
+) -> bool:
+    """Whether a video is small enough for Bluesky to take it."""
+    return os.path.getsize(video_file_path) <= limit_bytes
+
+
+def transcode_video_to_fit(
+    video_file_path: str,
+    limit_bytes: Optional[int] = const.SKEETS_VIDEO_LIMIT,
+    verbose_bool: Optional[bool] = False,
+) -> bool:
+    """
+    Shrinks a video in place until it fits under limit_bytes. Walks down
+    VIDEO_TRANSCODE_LADDER (smaller resolution, lower bitrate each step),
+    re-encoding the original with ffmpeg until one comes in under the limit,
+    then swaps it in for the original.
+
+    Returns True if the video fits (including if it already did). Returns
+    False if no rung was small enough or ffmpeg isn't installed; the
+    original is left alone either way.
+
+    The shrunk file replaces the original under a new inode, so hard links
+    to the original keep the old bytes. Callers shrinking the shared store
+    copy relink the modes with func_baseball.relink_shared_video().
+    """
+    if fits_upload_limit(video_file_path, limit_bytes):
+        return True
+
+    if shutil.which(ffmpeg_path) is None:
+        print(f"⚠️  Can't shrink {video_file_path}: '{ffmpeg_path}' isn't installed.")
+        return False
+
+    transcode_path = video_file_path + ".transcode.mp4"
+    for height, bitrate in const.VIDEO_TRANSCODE_LADDER:
+        command = [
+            ffmpeg_path, "-y", "-loglevel", "error",
+            "-i", video_file_path,
+            "-vf", f"scale=-2:'min({height},ih)'",
+            "-c:v", "libx264", "-preset", "veryfast",
+            "-b:v", bitrate, "-maxrate", bitrate, "-bufsize", bitrate,
+            "-c:a", "aac", "-b:a", "96k",
+            "-movflags", "+faststart",
+            transcode_path,
+        ]
+        if verbose_bool:
+            print(" ".join(command))
+
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"⚠️  ffmpeg failed on {video_file_path}: {result.stderr.strip()}")
+            break
+        if fits_upload_limit(transcode_path, limit_bytes):
+            os.replace(transcode_path, video_file_path)
+            print(
+                f"🗜️  Shrunk {video_file_path} to {height}p @ {bitrate} "
+                f"({os.path.getsize(video_file_path) / 1e6:.1f} MB)."
+            )
+            return True
+
+    if os.path.exists(transcode_path):
+        os.remove(transcode_path)
+    return False
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import pprint
+
+from typing import Optional
+
+from . import constants as const
+from . import httpclient as httpc
+
+
+class GameFeed:
+    def __init__(self, game_pk: int, verbose_bool: Optional[bool] = False):
+        """
+        Wraps a single game's live feed so that it only gets downloaded and
+        parsed once, no matter how many functions need to pick it apart. The
+        feed is the biggest payload we pull from MLB, so pass one of these
+        around instead of letting each function fetch its own copy.
+
+        :param game_pk: The MLB game id (the schedule's 'gamePk').
+        :param verbose_bool: Whether to dump the raw feed once it's fetched.
+        """
+        self.game_pk = game_pk
+        self.url = const.MLB_STATS_BASE_URL + const.MLB_STATS_LIVE_FEED_STUB.replace(
+            "<<GAME_PK>>", str(game_pk)
+        )
+        self.verbose_bool = verbose_bool
+        self.data = None
+
+    def load(self) -> dict:
+        """
+        Downloads the live feed the first time it's asked for and hands back
+        the cached copy every time after that. A failed download isn't
+        cached, so the next call will try again.
+        """
+        if self.data is None:
+            response = httpc.get(self.url)
+            response.raise_for_status()
+            self.data = response.json()
+
+            if self.verbose_bool:
+                pprint.pprint(self.data)
+
+        return self.data
+
+    def is_loaded(self) -> bool:
+        """Whether or not the feed has already been downloaded."""
+        return self.data is not None
+
+    @property
+    def all_plays(self) -> list:
+        """Every play in the game, in order."""
+        return self.load().get("liveData", {}).get("plays", {}).get("allPlays", [])
+
+    @property
+    def total_innings(self) -> int:
+        """The inning the last play of the game happened in."""
+        return self.all_plays[-1]["about"]["inning"]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+import atexit
+import requests
+import threading
+
+from requests.adapters import HTTPAdapter
+from typing import Optional
+from urllib3.util.retry import Retry
+
+from . import basic as bsc
+from . import constants as const
+from .configurator import ConfigReader
+
+
+## -------------------------------------------------------------------------- ##
+## HTTP CONFIG
+## -------------------------------------------------------------------------- ##
+
+config = ConfigReader(
+    bsc.verify_file_path(bsc.sanitize_path(const.DEFAULT_CONFIG_INI_FILE))
+)
+
+#fmt: off
+http_settings = {
+    "connect_timeout" : float(config.get("http", "connect_timeout")),
+    "read_timeout"    : float(config.get("http", "read_timeout")),
+    "pool_connections": int(config.get("http", "pool_connections")),
+    "pool_maxsize"    : int(config.get("http", "pool_maxsize")),
+    "max_retries"     : int(config.get("http", "max_retries")),
+    "backoff_factor"  : float(config.get("http", "backoff_factor")),
+    "user_agent"      : config.get("http", "user_agent"),
+}
+#fmt: on
+
+## One session for the whole process. Every MLB Stats and Baseball Savant
+## request goes through it so that connections get reused (keep-alive)
+## instead of paying for a fresh TCP+TLS handshake on every call.
+_session = None
+_session_lock = threading.Lock()
+
+
+## -------------------------------------------------------------------------- ##
+## SESSION FUNCTIONS
+## -------------------------------------------------------------------------- ##
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared session, building it the first time it's asked for.
+
+    Each host gets its own connection pool of at most 'pool_maxsize'
+    connections. The pool blocks instead of opening extra connections, which
+    is what keeps us to a fixed number of connections per host when several
+    threads are pulling at once.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            retries = Retry(
+                total=http_settings["max_retries"],
+                backoff_factor=http_settings["backoff_factor"],
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"],
+            )
+            adapter = HTTPAdapter(
+                pool_connections=http_settings["pool_connections"],
+                pool_maxsize=http_settings["pool_maxsize"],
+                pool_block=True,
+                max_retries=retries,
+            )
+
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive",
+                    "User-Agent": http_settings["user_agent"],
+                }
+            )
+            _session = session
+
+    return _session
+
+
+def close_session() -> None:
+    """Closes the shared session and every pooled connection it holds."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get(
+    url: str,
+    params: Optional[dict] = None,
+    stream: Optional[bool] = False,
+    headers: Optional[dict] = None,
+    timeout: Optional[tuple] = None,
+) -> requests.Response:
+    """
+    Drop-in replacement for requests.get() that goes through the shared
+    session and uses the timeouts from settings.ini unless told otherwise.
+
+    :param url: URL to fetch.
+    :param params: Optional query string parameters.
+    :param stream: Whether to stream the response body instead of reading it.
+    :param headers: Optional extra headers for this request only.
+    :param timeout: Optional (connect, read) timeout tuple in seconds.
+    """
+    if timeout is None:
+        timeout = (http_settings["connect_timeout"], http_settings["read_timeout"])
+    return get_session().get(
+        url, params=params, stream=stream, headers=headers, timeout=timeout
+    )
+
+
+atexit.register(close_session)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+import multiprocessing
+import threading
+import time
+
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Optional
+
+from . import func_database as dbmgr
+from . import func_plot as plotter
+
+## The pool needs fork. Spawn (the only choice on Windows) would re-import
+## the calling script in every worker and re-run its command line setup.
+FORK_AVAILABLE = "fork" in multiprocessing.get_all_start_methods()
+
+
+class PlotRenderQueue:
+    def __init__(
+        self,
+        mode: str,
+        num_workers: Optional[int] = 1,
+        verbose_bool: Optional[bool] = False,
+    ):
+        """
+        Renders plot jobs (see func_plot.build_hbp_plot_job()) on a pool of
+        worker processes, since matplotlib is CPU bound and won't go any
+        faster on threads. Each worker sets up the Agg backend and the plot
+        template once. A play's analyzed flag is set as soon as all of its
+        plots are saved; if any of them fails, it's left for the next run.
+
+        :param mode: Which mode's database to flag plays in.
+        :param num_workers: How many plots to render at once.
+        :param verbose_bool: Whether to print what each play is doing.
+        """
+        self.mode = mode
+        self.num_workers = max(1, num_workers)
+        self.verbose_bool = verbose_bool
+
+        ## Workers are forked so they inherit the loaded modules instead of
+        ## re-running the calling script's setup on import.
+        if not FORK_AVAILABLE:
+            raise RuntimeError("PlotRenderQueue needs the 'fork' start method.")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=plotter.init_plot_worker,
+        )
+        self.futures = []
+        self.pending_plays = {}
+        self.num_plays = 0
+        self.num_failed = 0
+        self.num_plots = 0
+        self.start_time = time.time()
+        self.lock = threading.Lock()
+
+    def submit(self, play_id: str, plot_jobs: list) -> None:
+        """Queues up every plot for one play."""
+        with self.lock:
+            self.pending_plays[play_id] = {"remaining": len(plot_jobs), "ok": True}
+        for plot_job in plot_jobs:
+            future = self.executor.submit(
+                plotter.run_hbp_plot_job, plot_job, self.verbose_bool
+            )
+            future.add_done_callback(
+                lambda done, play_id=play_id: self._plot_done(play_id, done)
+            )
+            self.futures.append(future)
+
+    def wait(self) -> dict:
+        """
+        Blocks until every queued plot is done, shuts the pool down, and
+        returns a summary: plays, failed, plots and seconds.
+        """
+        wait(self.futures)
+        self.executor.shutdown(wait=True)
+        return self.summary()
+
+    def cancel(self) -> None:
+        """Drops anything that hasn't started yet. Running plots finish."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def summary(self) -> dict:
+        with self.lock:
+            return {
+                "plays": self.num_plays,
+                "failed": self.num_failed,
+                "plots": self.num_plots,
+                "seconds": time.time() - self.start_time,
+            }
+
+    def _plot_done(self, play_id: str, future: Future) -> None:
+        """Runs in the parent as each plot finishes; flags finished plays."""
+        try:
+            plot_ok = not future.cancelled() and future.result()
+        except Exception as e:
+            print(f"   ❌ Plot for {play_id} failed: {e}")
+            plot_ok = False
+
+        with self.lock:
+            if plot_ok:
+                self.num_plots = self.num_plots + 1
+            pending_play = self.pending_plays[play_id]
+            pending_play["remaining"] = pending_play["remaining"] - 1
+            pending_play["ok"] = pending_play["ok"] and plot_ok
+            if pending_play["remaining"] > 0:
+                return
+            del self.pending_plays[play_id]
+            if not pending_play["ok"]:
+                self.num_failed = self.num_failed + 1
+                return
+            self.num_plays = self.num_plays + 1
+
+        ## If we get to this point, all of the play's plots have been created.
+        dbmgr.set_analyzed_flag(self.mode, play_id, self.verbose_bool)
+        if self.verbose_bool:
+            print(f"   📊 All plots done for {play_id}.")
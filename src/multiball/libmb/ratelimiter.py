@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+import threading
+import time
+
+from typing import Optional
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        A thread-safe token bucket. Tokens drip in at 'rate' per second and
+        pile up to at most 'capacity', so callers can burst a little and then
+        settle down to the steady rate. A rate of zero (or less) means no
+        limit at all.
+
+        :param rate: Number of tokens added per second.
+        :param capacity: Most tokens that can be saved up. Defaults to 1.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else 1.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: Optional[float] = 1.0) -> float:
+        """
+        Blocks until 'tokens' tokens are available, then takes them.
+
+        :param tokens: How many tokens to take.
+        :return: Number of seconds spent waiting.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens = self.tokens - tokens
+                    return waited
+                wait_time = (tokens - self.tokens) / self.rate
+
+            ## Sleep outside the lock so other threads can refill/check too.
+            time.sleep(wait_time)
+            waited = waited + wait_time
+
+    def _refill(self) -> None:
+        """Adds whatever tokens have dripped in since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
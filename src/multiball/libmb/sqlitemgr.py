@@ -1,14 +1,33 @@
+import atexit
 import sqlite3
+import threading
+
+from . import constants as const
+
+
+## Long-lived managers, one per database file. See get_shared_manager().
+_shared_managers = {}
+_shared_managers_lock = threading.Lock()
 
 
 class SQLiteManager:
-    def __init__(self, db_file):
-        self.conn = sqlite3.connect(db_file)
+    def __init__(self, db_file, persistent=False):
+        self.db_file = db_file
+        self.persistent = persistent
+        self.conn = sqlite3.connect(db_file, check_same_thread=not persistent)
         self.cursor = self.conn.cursor()
+        self.lock = threading.RLock()
+
+    def set_pragmas(self, pragmas: dict):
+        with self.lock:
+            for pragma, value in pragmas.items():
+                self.cursor.execute(f"PRAGMA {pragma} = {value}")
+                self.cursor.fetchall()
 
     def create_table(self, create_statement):
-        self.cursor.execute(create_statement)
-        self.conn.commit()
+        with self.lock:
+            self.cursor.execute(create_statement)
+            self.conn.commit()
 
     def insert_data(self, table_name: str, insert_data: dict) -> bool:
         insert_result = False
@@ -19,44 +38,129 @@ class SQLiteManager:
             values       = tuple(insert_data.values())
             #fmt: on
 
-            self.cursor.execute(
-                f"""
-                INSERT INTO {table_name}
-                    ({columns})
-                VALUES
-                    ({placeholders})
-                """,
-                values,
-            )
-            num_inserted = self.cursor.rowcount
-            if self.cursor.rowcount > 0:
-                insert_result = True
+            with self.lock:
+                self.cursor.execute(
+                    f"""
+                    INSERT INTO {table_name}
+                        ({columns})
+                    VALUES
+                        ({placeholders})
+                    """,
+                    values,
+                )
+                num_inserted = self.cursor.rowcount
+                if self.cursor.rowcount > 0:
+                    insert_result = True
 
-            self.conn.commit()
+                self.conn.commit()
         except sqlite3.Error as e:
             print(f"An error occurred: {e}")
         return insert_result
 
+    def insert_many(
+        self, table_name: str, insert_rows: list, conflict_column: str
+    ) -> int:
+        """
+        Inserts a list of row dicts (all with the same keys) in a single
+        transaction, quietly skipping any row whose conflict_column value is
+        already in the table. Returns how many rows were actually inserted.
+        """
+        if not insert_rows:
+            return 0
+
+        #fmt: off
+        columns      = list(insert_rows[0].keys())
+        placeholders = ", ".join(["?"] * len(columns))
+        values_list  = [tuple(row[column] for column in columns) for row in insert_rows]
+        #fmt: on
+
+        with self.lock:
+            try:
+                self.cursor.executemany(
+                    f"""
+                    INSERT INTO {table_name}
+                        ({", ".join(columns)})
+                    VALUES
+                        ({placeholders})
+                    ON CONFLICT({conflict_column}) DO NOTHING
+                    """,
+                    values_list,
+                )
+                num_inserted = self.cursor.rowcount
+                self.conn.commit()
+            except BaseException:
+                ## Includes KeyboardInterrupt; don't leave half a batch
+                ## sitting in an open transaction on a shared connection.
+                self.conn.rollback()
+                raise
+        return num_inserted
+
     def query_data(self, query: str, args: list) -> list:
-        self.cursor.execute(query, args)
-        records = self.cursor.fetchall()
+        with self.lock:
+            self.cursor.execute(query, args)
+            records = self.cursor.fetchall()
         return records
 
     def get_all_data(self, table_name: str) -> list:
-        self.cursor.execute(f"SELECT * FROM {table_name}")
-        records = self.cursor.fetchall()
+        with self.lock:
+            self.cursor.execute(f"SELECT * FROM {table_name}")
+            records = self.cursor.fetchall()
         return records
 
     def update_data(self, query: str, args: list) -> list:
-        self.cursor.execute(query, args)
-        self.conn.commit()
-        return self.cursor.rowcount
+        with self.lock:
+            self.cursor.execute(query, args)
+            self.conn.commit()
+            return self.cursor.rowcount
+
+    def update_many(self, query: str, args_list: list) -> int:
+        with self.lock:
+            self.cursor.executemany(query, args_list)
+            self.conn.commit()
+            return self.cursor.rowcount
 
     def close_connection(self):
-        self.conn.close()
+        with self.lock:
+            self.conn.close()
 
     def __enter__(self):
+        ## Hold the lock for the whole 'with' block so a shared manager's
+        ## statements from other threads can't interleave with ours.
+        self.lock.acquire()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.close_connection()
+        self.lock.release()
+        if not self.persistent:
+            self.close_connection()
+
+
+def get_shared_manager(db_file, pragmas=None) -> SQLiteManager:
+    """
+    Returns a long-lived SQLiteManager for db_file, connecting the first time
+    it's asked for and reusing that connection for the rest of the process.
+    Using it in a 'with' block doesn't close it; close_shared_managers() does
+    that, and it runs automatically at exit.
+
+    The pragmas (a dict of pragma -> value) are applied once, right after
+    connecting. They default to const.DATABASE_PRAGMAS.
+    """
+    with _shared_managers_lock:
+        if db_file not in _shared_managers:
+            db_manager = SQLiteManager(db_file, persistent=True)
+            db_manager.set_pragmas(
+                const.DATABASE_PRAGMAS if pragmas is None else pragmas
+            )
+            _shared_managers[db_file] = db_manager
+        return _shared_managers[db_file]
+
+
+def close_shared_managers():
+    """Closes every shared connection. Safe to call more than once."""
+    with _shared_managers_lock:
+        for db_manager in _shared_managers.values():
+            db_manager.close_connection()
+        _shared_managers.clear()
+
+
+atexit.register(close_shared_managers)
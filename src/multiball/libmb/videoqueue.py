@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import os
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+from . import func_baseball as bb
+from . import func_database as dbmgr
+from . import func_video as vid
+
+
+class VideoDownloadQueue:
+    def __init__(
+        self,
+        mode: str,
+        num_workers: Optional[int] = 1,
+        verbose_bool: Optional[bool] = False,
+        transcode_workers: Optional[int] = 1,
+    ):
+        """
+        Downloads Savant videos on a pool of worker threads so the caller can
+        keep building skeets while they stream in. Anything over the Bluesky
+        size limit gets shrunk with ffmpeg first. Each finished video gets its
+        play's download flag set right away, from the worker thread. A video
+        that can't be made small enough isn't flagged.
+
+        Connections per host are capped by the shared HTTP session's
+        pool_maxsize, so extra workers queue up for a connection rather than
+        piling more onto Savant.
+
+        :param mode: Which mode's video directory and database to use.
+        :param num_workers: How many videos to download at once.
+        :param verbose_bool: Whether to print what each worker is doing.
+        :param transcode_workers: Most ffmpeg processes to run at once.
+        """
+        self.mode = mode
+        self.num_workers = max(1, num_workers)
+        self.verbose_bool = verbose_bool
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.num_workers, thread_name_prefix="video"
+        )
+        self.futures = []
+        self.num_bytes = 0
+        self.num_videos = 0
+        self.num_failed = 0
+        self.num_transcoded = 0
+        ## ffmpeg runs in its own process, so a semaphore around it is all
+        ## the process pool we need.
+        self.transcode_semaphore = threading.BoundedSemaphore(max(1, transcode_workers))
+        self.start_time = time.time()
+        self.lock = threading.Lock()
+
+    def submit(self, game_pk: int, play_id: str) -> Future:
+        """Queues up one play's video. Returns the future for its file path."""
+        future = self.executor.submit(self._download, game_pk, play_id)
+        self.futures.append(future)
+        return future
+
+    def wait(self) -> dict:
+        """
+        Blocks until every queued video is done, shuts the pool down, and
+        returns a summary: videos, failed, transcoded, bytes, seconds and
+        bytes_per_sec.
+        """
+        wait(self.futures)
+        self.executor.shutdown(wait=True)
+        return self.summary()
+
+    def cancel(self) -> None:
+        """Drops anything that hasn't started yet. Running downloads finish."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def summary(self) -> dict:
+        elapsed = time.time() - self.start_time
+        with self.lock:
+            return {
+                "videos": self.num_videos,
+                "failed": self.num_failed,
+                "transcoded": self.num_transcoded,
+                "bytes": self.num_bytes,
+                "seconds": elapsed,
+                "bytes_per_sec": self.num_bytes / elapsed if elapsed > 0 else 0.0,
+            }
+
+    def _download(self, game_pk: int, play_id: str) -> Optional[str]:
+        """Runs on a worker: downloads the video and flags the play."""
+        video_path = bb.get_video_path(self.mode, game_pk, play_id)
+        already_there = os.path.exists(video_path)
+
+        video_filename = bb.download_baseball_savant_play(
+            self.mode, game_pk, play_id, self.verbose_bool, self.num_workers == 1
+        )
+
+        if video_filename and os.path.exists(video_filename):
+            num_bytes = 0 if already_there else os.path.getsize(video_filename)
+            if not vid.fits_upload_limit(video_filename):
+                ## Shrink the shared copy, so every mode gets the small one.
+                ## The transcode swaps in a new file, which breaks the old
+                ## hard links, so every mode still on the old file (this one
+                ## included) gets pointed at the new one.
+                shared_video_path = bb.get_shared_video_path(play_id)
+                if not os.path.exists(shared_video_path):
+                    shared_video_path = video_filename
+                with self.transcode_semaphore:
+                    old_stat = os.stat(shared_video_path)
+                    fits = vid.transcode_video_to_fit(
+                        shared_video_path, verbose_bool=self.verbose_bool
+                    )
+                    if fits and shared_video_path != video_filename:
+                        bb.relink_shared_video(
+                            game_pk, play_id, old_stat, self.verbose_bool
+                        )
+                        ## Another mode may have shrunk it first.
+                        bb.link_shared_video(self.mode, game_pk, play_id)
+                if not fits:
+                    with self.lock:
+                        self.num_failed = self.num_failed + 1
+                    print(f"😢 Video for {play_id} is too big to skeet.")
+                    return None
+                with self.lock:
+                    self.num_transcoded = self.num_transcoded + 1
+
+            dbmgr.set_download_flag(self.mode, play_id, self.verbose_bool)
+            with self.lock:
+                self.num_videos = self.num_videos + 1
+                self.num_bytes = self.num_bytes + num_bytes
+            print(f"🎥 VIDEO: {video_filename}")
+        else:
+            with self.lock:
+                self.num_failed = self.num_failed + 1
+            print(f"😢 Video for {play_id} didn't download.")
+
+        return video_filename
@@ -5,7 +5,6 @@
 ## For certain events, we want to plot the action.
 ## -------------------------------------------------------------------------- ##
 
-import os
 import pprint
 import sys
 import time
@@ -16,7 +15,7 @@ from .libmb import constants as const
 from .libmb import func_baseball as bb
 from .libmb import func_database as dbmgr
 from .libmb import func_plot as plotter
-from .libmb import func_skeet as sk
+from .libmb.plotqueue import FORK_AVAILABLE, PlotRenderQueue
 
 from .libmb.cmdparser import CmdParser
 from .libmb.configurator import ConfigReader
@@ -34,6 +33,7 @@ config = ConfigReader(
 
 #fmt: off
 mode           = "hbp"
+plot_workers   = int(config.get("client_parameters", "plot_workers"))
 test_mode      = bool(int(config.get("operations", "test_mode")))
 verbose        = bool(int(config.get("operations", "verbose_output")))
 double_verbose = bool(int(config.get("operations", "double_verbose")))
@@ -50,6 +50,11 @@ parser.add_arguments_from_dict(
             "default": mode,
             "help": "Specify which baseball mode to populate",
         },
+        ("-w", "--workers"): {
+            "type": int,
+            "default": plot_workers,
+            "help": "Number of processes to render plots on. Defaults to '%(default)s'.",
+        },
     }
 )
 args = parser.parse_args()
@@ -57,6 +62,8 @@ args = parser.parse_args()
 ## Now pull config and command line action together.
 if args.get("mode"):
     mode = args.get("mode")
+if args.get("workers") and args.get("workers") > 0:
+    plot_workers = args.get("workers")
 if args.get("test_mode"):
     config.set("operations", "test_mode", "1")
     test_mode = True
@@ -84,6 +91,7 @@ if not args.get("nolog"):
 
 
 def main() -> int:
+    plot_queue = None
     try:
         print()
 
@@ -102,10 +110,9 @@ def main() -> int:
             raise ValueError(f"🙀 Unsupported event. Finishing...\n")
 
         ## The plan:
-        ##  1. Get a list of all current skeets in skeet_dir waiting to go.
-        ##  2. Skip any files that don't end in '_desc.txt'
-        ##  3. Check if it's already been skeeted. If so, remove all files.
-        ##  4. Query the play_id. This is 'current_play'.
+        ##  1. Ask the database for plays that haven't been analyzed or
+        ##     skeeted yet, oldest game first.
+        ##  4. Each queued play row is 'current_play'.
         ##  5. Extract the season, batter_id, and pitcher_id.
         ##  6a. Query the season. This is 'all_season_data'.
         ##  6b. Query the batter_id. This is 'batter_career_data'.
@@ -114,61 +121,56 @@ def main() -> int:
         ##  7b. Plot batter_career_data as gray, current_play color coded to end_speed.
         ##  7c. Plot pitcher_career_data as gray, current_play color coded to end_speed.
 
-        ## 1. Get a list of all current skeets in skeet_dir waiting to go.
         plot_dir = const.HBP_PATHS["plot_dir_fullpath"]
-        skeet_dir = const.HBP_PATHS["skeet_dir_fullpath"]
         if mode == "derp":
             plot_dir = const.DERP_PATHS["plot_dir_fullpath"]
-            skeet_dir = const.DERP_PATHS["skeet_dir_fullpath"]
         elif mode == "triples":
             plot_dir = const.TRIPLES_PATHS["plot_dir_fullpath"]
-            skeet_dir = const.TRIPLES_PATHS["skeet_dir_fullpath"]
-
-        skeet_dir_files = sorted(os.listdir(skeet_dir))
-        if verbose:
-            pprint.pprint(skeet_dir_files)
-
-        for skeet_file in skeet_dir_files:
-            full_skeet_filename = os.path.join(skeet_dir, skeet_file)
-            skeet_root, ext = os.path.splitext(skeet_file)
-            skeet_parts = skeet_root.split("_")
 
-            ## Not a file we want to work with
-            if not skeet_parts[0].isdigit():
-                print()
-                continue
-
-            game_pk = skeet_parts[0]
-            play_id = skeet_parts[1]
+        ## Pull every player the pending plays need into the metadata cache in
+        ## one go, instead of asking MLB about the pitcher and batter per play.
+        num_fetched = bb.prefetch_mlb_player_details(
+            dbmgr.get_pending_player_ids(mode, verbose), verbose
+        )
+        print(f"👥 Fetched {num_fetched} new player(s) into the metadata cache.\n")
+
+        ## The database knows which plays still need plots; no need to go
+        ## digging through the skeet directory for them.
+        ## 1. Get the queue of plays waiting to be analyzed.
+        ##    It's paged through a batch at a time rather than loaded whole.
+        num_pending = dbmgr.count_work_queue(mode, dbmgr.ANALYZE_QUEUE_WHERE, verbose)
+        print(f"📋 {num_pending} play(s) waiting to be analyzed.\n")
+
+        ## With more than one worker, plots are rendered in a process pool
+        ## while this loop keeps gathering data for the next play. The pool
+        ## needs fork, so anywhere without it (Windows) renders in-process.
+        num_workers = plot_workers
+        if num_workers > 1 and not FORK_AVAILABLE:
+            print(
+                f"⚠️  Worker processes need fork, which isn't available here. Rendering plots with 1 worker instead of {num_workers}.\n"
+            )
+            num_workers = 1
+        if num_workers > 1:
+            print(f"🧵 Rendering plots with {num_workers} worker process(es).\n")
+            plot_queue = PlotRenderQueue(mode, num_workers, verbose)
+
+        for pending_play in dbmgr.iter_plays_to_analyze(mode, verbose):
+            game_pk = pending_play["game_pk"]
+            play_id = pending_play["play_id"]
             print(f"⚾ Game = {game_pk}, Play ID = {play_id}")
 
-            ## 2. Skip any files that don't end in '_desc.txt'
-            if skeet_parts[1] == "clean":
-                ## We don't skeet out games where there are no HBP events.
-                print(f"  😞 Nobody got hit during this game. Skipping.\n")
-                os.remove(full_skeet_filename)
-                continue
-            elif skeet_parts[1] == "analyze":
-                print(f"  😒 Current file is analysis information. Skipping.\n")
-                continue
-
-            ## 3. Check if it's already been skeeted. If so, remove all files.
-            if dbmgr.has_been_skeeted(mode, play_id, verbose):
-                print(f"  🤨 This event has already been skeeted!\n")
-                sk.cleanup_after_skeet(mode, int(game_pk), play_id, verbose)
-                continue
-
-            ## 4. Query the play_id. This is 'current_play'.
-            current_play = dbmgr.get_event_play_data(mode, play_id, verbose)
+            ## The plot functions still take raw rows, same as
+            ## get_event_play_data() hands back. This is 'current_play'.
+            current_play = [tuple(pending_play.values())]
             if verbose:
                 pprint.pprint(current_play)
 
             ##  5. Extract the season, batter_id, and pitcher_id.
             #fmt: off
-            game_date          = current_play[0][2]
+            game_date          = pending_play["game_date"]
             season, month, day = game_date.split("-")
-            pitcher_info       = bb.get_mlb_player_details(current_play[0][3], verbose)
-            batter_info        = bb.get_mlb_player_details(current_play[0][4], verbose)
+            pitcher_info       = bb.get_cached_mlb_player_details(pending_play["pitcher_id"], verbose)
+            batter_info        = bb.get_cached_mlb_player_details(pending_play["batter_id"], verbose)
             #fmt: on
             if verbose:
                 pprint.pprint(pitcher_info)
@@ -190,7 +192,26 @@ def main() -> int:
                 f"   {batter_info['name']} ({batter_info['primary_position']}) has been hit {len(batter_career_data)} times in his career."
             )
 
-            if all_season_data and len(all_season_data) > 0:
+            if all_season_data and len(all_season_data) > 0 and plot_queue is not None:
+                ##  7. Hand all three plots to the workers as one play. The
+                ##     queue sets the analyzed flag once they're all saved.
+                print(f"   📊 Queueing season, batter, and pitcher plots...")
+                plot_queue.submit(
+                    play_id,
+                    [
+                        plotter.build_hbp_season_plot_job(
+                            current_play, all_season_data, pitcher_info, batter_info
+                        ),
+                        plotter.build_hbp_batter_plot_job(
+                            current_play, batter_career_data, batter_info
+                        ),
+                        plotter.build_hbp_pitcher_plot_job(
+                            current_play, pitcher_career_data, pitcher_info
+                        ),
+                    ],
+                )
+
+            elif all_season_data and len(all_season_data) > 0:
                 ##  7a. Plot all_season_data as gray, current_play color coded to end_speed.
                 print(
                     f"   📊 Creating scatter plot for this {mode} against all {mode} events for {season}..."
@@ -229,6 +250,15 @@ def main() -> int:
 
             print()
 
+        if plot_queue is not None:
+            print(f"⏳ Waiting on the plot workers...")
+            plot_summary = plot_queue.wait()
+            print(
+                f"📊 Plotted {plot_summary['plays']} play(s), {plot_summary['plots']} plot(s) "
+                f"in {plot_summary['seconds']:.2f} seconds ({plot_summary['failed']} failed)."
+            )
+            print()
+
         end_time = time.time()
         elapsed = end_time - start_time
         print("=" * 80)
@@ -241,6 +271,11 @@ def main() -> int:
         print(f"Unexpected error: {e}")
         return 1
 
+    finally:
+        ## Don't start any more plots after something blew up.
+        if plot_queue is not None:
+            plot_queue.cancel()
+
 
 if __name__ == "__main__":
     sys.exit(main())
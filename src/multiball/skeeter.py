@@ -7,6 +7,7 @@
 ## -------------------------------------------------------------------------- ##
 
 
+import glob
 import os
 import pprint
 import sys
@@ -18,6 +19,7 @@ from .libmb import constants as const
 from .libmb import func_baseball as bb
 from .libmb import func_database as dbmgr
 from .libmb import func_skeet as sk
+from .libmb import func_video as vid
 
 from .libmb.cmdparser import CmdParser
 from .libmb.configurator import ConfigReader
@@ -161,50 +163,66 @@ def main(num_posts: Optional[int] = 1) -> int:
             pprint.pprint(profile)
         print()
 
+        ## -----------------------
+        ## Player cache warm-up
+        ## -----------------------
+        if mode == "hbp":
+            num_fetched = bb.prefetch_mlb_player_details(
+                dbmgr.get_pending_player_ids(mode, verbose), verbose
+            )
+            print(f"👥 Fetched {num_fetched} new player(s) into the metadata cache.\n")
+
         ## -----------------------
         ## Skeet loop
         ## -----------------------
-        skeet_dir_files = sorted(os.listdir(skeet_dir))
+        ## Games with no events leave a '<game_pk>_clean.txt' marker behind.
+        ## Nothing needs them, so sweep them up.
+        for clean_file in glob.glob(os.path.join(skeet_dir, "*_clean.txt")):
+            os.remove(clean_file)
+
+        ## Plays that were skeeted but never cleaned up after (a crash
+        ## between flagging and cleanup) still have files lying around.
+        files_removed = sk.sweep_skeeted_leftovers(mode, verbose)
+        if files_removed:
+            print(f"🧹 Cleaned up {len(files_removed)} file(s) left over from earlier skeets.\n")
+
+        ## The database says which plays are still waiting to go out; the
+        ## skeet directory only has to hold their text. Page through the
+        ## queue until there are enough plays the downloader has written up.
+        ready_plays = []
+        for pending_play in dbmgr.iter_plays_to_skeet(mode, verbose):
+            if len(ready_plays) >= num_posts:
+                break
+            game_pk = pending_play["game_pk"]
+            play_id = pending_play["play_id"]
+            full_skeet_filename = os.path.join(skeet_dir, f"{game_pk}_{play_id}_desc.txt")
+            if os.path.exists(full_skeet_filename):
+                ready_plays.append(pending_play)
+            elif verbose:
+                ## The downloader hasn't written this one up yet.
+                print(f"⚾ Game = {game_pk}, Play ID = {play_id}: no skeet text yet.")
         if verbose:
-            pprint.pprint(skeet_dir_files)
-        if len(skeet_dir_files) < num_posts:
+            pprint.pprint(ready_plays)
+        if len(ready_plays) < num_posts:
             print(
                 f"‼️ Number of desired posts ({num_posts}) exceeds number of available skeets. Fixing."
             )
-            num_posts = len(skeet_dir_files)
+            num_posts = len(ready_plays)
             print(
                 f"‼️ Adjusted to {num_posts} posts. This may change during operation...."
             )
 
         skeet_counter = 0
-        for skeet_file in skeet_dir_files:
-            full_skeet_filename = os.path.join(skeet_dir, skeet_file)
-            skeet_root, ext = os.path.splitext(skeet_file)
-            skeet_parts = skeet_root.split("_")
-
-            ## Not a file we want to work with
-            if not skeet_parts[0].isdigit():
-                print()
-                continue
-
-            game_pk = skeet_parts[0]
-            play_id = skeet_parts[1]
-            print(f"⚾ Game = {game_pk}, Play ID = {play_id}")
+        for i, pending_play in enumerate(ready_plays):
+            game_pk = pending_play["game_pk"]
+            play_id = pending_play["play_id"]
+            full_skeet_filename = os.path.join(skeet_dir, f"{game_pk}_{play_id}_desc.txt")
 
-            if skeet_parts[1] == "clean":
-                ## We don't skeet out games where there are no HBP events.
-                print(f"  😞 Nobody got hit during this game. Skipping.\n")
-                os.remove(full_skeet_filename)
-                continue
-            elif skeet_parts[1] == "analyze":
-                print(f"  😒 Current file is analysis information. Skipping.\n")
-                continue
-
-            ## Now check if it's already been skeeted. If so, remove all files.
-            if dbmgr.has_been_skeeted(mode, play_id, verbose):
-                print(f"  🤨 This event has already been skeeted!\n")
-                sk.cleanup_after_skeet(mode, int(game_pk), play_id, verbose)
-                continue
+            print(f"⚾ Game = {game_pk}, Play ID = {play_id}")
+            play_status = {
+                flag: pending_play[flag] == 1
+                for flag in ["downloaded", "analyzed", "skeeted"]
+            }
 
             ## At this point, let's start building the skeet(s).
             ## 1. Get skeet text.
@@ -215,43 +233,44 @@ def main(num_posts: Optional[int] = 1) -> int:
 
             ## 2. Get video.
             video_filepath = os.path.join(video_dir, f"{game_pk}_{play_id}.mp4")
-            if not dbmgr.has_been_downloaded(
-                mode, play_id, verbose
-            ) and not os.path.exists(video_filepath):
+            video_exists = os.path.exists(video_filepath)
+            if not play_status["downloaded"] and not video_exists:
                 ## Don't add a video!
                 video_filepath = None
                 print(f"  ⛔ No event video associated with this HBP!")
-            elif not dbmgr.has_been_downloaded(
-                mode, play_id, verbose
-            ) and os.path.exists(video_filepath):
+            elif not play_status["downloaded"] and video_exists:
                 ## File exists but hasn't been marked as downloaded!
-                dbmgr.set_download_flag(play_id)
+                dbmgr.set_download_flag(mode, play_id, verbose)
                 print(
                     f"  🤨 Event video has been downloaded but not marked so in the database."
                 )
-            elif dbmgr.has_been_downloaded(
-                mode, play_id, verbose
-            ) and not os.path.exists(video_filepath):
+            elif play_status["downloaded"] and not video_exists:
                 ## This is an error condition! File is missing.
-                video_filepath = None
                 print(f"❌ Video {video_filepath} is missing!")
-            elif dbmgr.has_been_downloaded(mode, play_id, verbose) and os.path.exists(
-                video_filepath
-            ):
+                video_filepath = None
+            elif play_status["downloaded"] and video_exists:
                 ## File has been marked as downloaded and does exist.
                 pass
 
+            ## Bluesky would only turn it down after we'd sent the whole thing.
+            if video_filepath and not vid.fits_upload_limit(video_filepath):
+                print(f"  🐘 Video {video_filepath} is over the upload limit. Skipping it.")
+                video_filepath = None
+
             if video_filepath:
                 print(f"🎥 Video file:     {video_filepath}")
 
             ## 3. Get analysis plots and build plots data structures.
             plots = []
             plot_alts = []
-            if mode == "hbp" and dbmgr.has_been_analyzed(mode, play_id, verbose):
-                season = dbmgr.get_season_year(mode, play_id, verbose)
-                current_play = dbmgr.get_event_play_data(mode, play_id, verbose)
-                pitcher_info = bb.get_mlb_player_details(current_play[0][3], verbose)
-                batter_info = bb.get_mlb_player_details(current_play[0][4], verbose)
+            if mode == "hbp" and play_status["analyzed"]:
+                season = pending_play["game_date"].split("-")[0]
+                pitcher_info = bb.get_cached_mlb_player_details(
+                    pending_play["pitcher_id"], verbose
+                )
+                batter_info = bb.get_cached_mlb_player_details(
+                    pending_play["batter_id"], verbose
+                )
 
                 season_plot_filename = os.path.join(
                     plot_dir, f"{game_pk}_{play_id}_{season}.png"
@@ -340,8 +359,6 @@ def main(num_posts: Optional[int] = 1) -> int:
 
             print()
             skeet_counter = skeet_counter + 1
-            if skeet_counter >= num_posts:
-                break
 
         print()
         end_time = time.time()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+## -------------------------------------------------------------------------- ##
+## Shared pytest setup
+## The modules read config/settings.ini relative to the project root when
+## they're imported, same as run_multiball.sh runs them, so the tests do too.
+## Each test that touches disk gets its own bsky_data under tmp_path.
+## -------------------------------------------------------------------------- ##
+
+import os
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_ROOT)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.multiball.libmb import constants as const
+from src.multiball.libmb.sqlitemgr import close_shared_managers
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Points every mode's database and directories at tmp_path."""
+    for mode in const.MODE_EVENTS:
+        mode_paths = getattr(const, f"{mode.upper()}_PATHS")
+        mode_table = getattr(const, f"{mode.upper()}_TABLE")
+        mode_root = tmp_path / mode
+        for key, value in list(mode_paths.items()):
+            if key == "root":
+                monkeypatch.setitem(mode_paths, key, str(mode_root))
+            else:
+                monkeypatch.setitem(
+                    mode_paths, key, str(mode_root / os.path.basename(value))
+                )
+        monkeypatch.setitem(
+            mode_table,
+            "filename",
+            str(mode_root / os.path.basename(mode_table["filename"])),
+        )
+        os.makedirs(mode_paths["video_dir_fullpath"])
+
+    monkeypatch.setattr(const, "VIDEO_STORE_DIR", str(tmp_path / "video_store"))
+    monkeypatch.setattr(const, "PLOT_CACHE_DIR", str(tmp_path / "plot_cache"))
+    yield tmp_path
+    close_shared_managers()
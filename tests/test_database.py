@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+from src.multiball.libmb import func_database as dbmgr
+
+
+def make_row(play_id, game_pk, analyzed=0, skeeted=0):
+    #fmt: off
+    return {
+        "play_id"   : play_id,
+        "game_pk"   : game_pk,
+        "game_date" : "2025-05-01",
+        "pitcher_id": 1,
+        "batter_id" : 2,
+        "end_speed" : 90.0,
+        "x_pos"     : 0.0,
+        "z_pos"     : 2.5,
+        "downloaded": 1,
+        "analyzed"  : analyzed,
+        "skeeted"   : skeeted,
+    }
+    #fmt: on
+
+
+def test_bulk_insert_rows_skips_existing_play_ids(data_dir):
+    dbmgr.create_database("hbp")
+    assert dbmgr.bulk_insert_rows("hbp", [make_row("a", 1), make_row("b", 1)]) == 2
+    assert dbmgr.bulk_insert_rows("hbp", [make_row("a", 1), make_row("c", 2)]) == 1
+
+
+def test_work_queue_is_ordered_and_counted(data_dir):
+    dbmgr.create_database("hbp")
+    dbmgr.bulk_insert_rows(
+        "hbp",
+        [
+            make_row("b", 2),
+            make_row("a", 2),
+            make_row("z", 1),
+            make_row("done", 1, analyzed=1),
+            make_row("gone", 1, skeeted=1),
+        ],
+    )
+
+    queue = dbmgr.get_work_queue("hbp", dbmgr.ANALYZE_QUEUE_WHERE)
+    assert [(row["game_pk"], row["play_id"]) for row in queue] == [
+        (1, "z"),
+        (2, "a"),
+        (2, "b"),
+    ]
+    assert dbmgr.count_work_queue("hbp", dbmgr.ANALYZE_QUEUE_WHERE) == 3
+    assert dbmgr.count_work_queue("hbp", dbmgr.SKEET_QUEUE_WHERE) == 4
+
+
+def test_work_queue_pages_past_the_last_key(data_dir):
+    dbmgr.create_database("hbp")
+    dbmgr.bulk_insert_rows("hbp", [make_row("m", 1), make_row("n", 1), make_row("c", 2)])
+
+    page = dbmgr.get_work_queue("hbp", dbmgr.ANALYZE_QUEUE_WHERE, 2, after=(1, "m"))
+    assert [row["play_id"] for row in page] == ["n", "c"]
+    assert [row["game_pk"] for row in page] == [1, 2]
+
+
+def test_iter_work_queue_visits_every_play_once(data_dir):
+    dbmgr.create_database("hbp")
+    rows = [make_row(f"p{i:02}", i // 3) for i in range(10)]
+    dbmgr.bulk_insert_rows("hbp", rows)
+
+    seen = []
+    for play in dbmgr.iter_work_queue("hbp", dbmgr.ANALYZE_QUEUE_WHERE, batch_size=3):
+        seen.append(play["play_id"])
+        ## Plays leaving the queue mid-walk mustn't shift the pages.
+        if len(seen) % 2 == 0:
+            dbmgr.set_analyzed_flag("hbp", play["play_id"])
+
+    assert seen == [row["play_id"] for row in rows]
+
+
+def test_get_stored_game_pks_tells_imported_games_apart(data_dir):
+    dbmgr.create_database("hbp")
+    dbmgr.bulk_insert_rows(
+        "hbp",
+        [
+            make_row("7-12-3", 7),
+            make_row("0d3c1f7e-5a4b-4c2d-9e8f-123456789abc", 8),
+            ## Not a stand-in for this game, just shaped like one.
+            make_row("7-1-1", 9),
+        ],
+    )
+
+    assert dbmgr.get_stored_game_pks("hbp", [7, 8, 9, 10]) == {7, 8, 9}
+    assert dbmgr.get_stored_game_pks("hbp", [7, 8, 9, 10], imported_only=True) == {7}
+    assert dbmgr.get_stored_game_pks("hbp", []) == set()
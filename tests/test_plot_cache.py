@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import os
+
+import numpy as np
+
+from src.multiball.libmb import func_plot as plotter
+
+
+def make_job(**overrides):
+    #fmt: off
+    job = {
+        "plot_data"          : np.array([[0.1, 2.0, 88.6], [-0.4, 3.1, 91.2]]),
+        "current_index"      : 1,
+        "current_speed_label": "91.2 mph",
+        "strike_zone_corners": [(-0.7, 1.5), (0.7, 1.5), (0.7, 3.5), (-0.7, 3.5)],
+        "title"              : "Every HBP in 2025",
+        "season"             : "2025",
+        "plot_fullpath"      : "bsky_data/hbp/plots/1_a_2025.png",
+    }
+    #fmt: on
+    job.update(overrides)
+    return job
+
+
+def test_cache_key_ignores_output_path():
+    assert plotter.build_plot_cache_key(make_job()) == plotter.build_plot_cache_key(
+        make_job(plot_fullpath="bsky_data/hbp/plots/2_b_2025.png")
+    )
+
+
+def test_cache_key_changes_with_what_gets_drawn():
+    cache_key = plotter.build_plot_cache_key(make_job())
+    assert cache_key != plotter.build_plot_cache_key(make_job(current_index=0))
+    assert cache_key != plotter.build_plot_cache_key(make_job(title="Someone"))
+    assert cache_key != plotter.build_plot_cache_key(
+        make_job(plot_data=np.array([[0.1, 2.0, 88.6], [-0.4, 3.1, 91.3]]))
+    )
+
+
+def test_evict_plot_cache_drops_least_recently_used(data_dir):
+    os.makedirs(plotter.const.PLOT_CACHE_DIR)
+    for i, name in enumerate(["old", "mid", "new"]):
+        cached_path = os.path.join(plotter.const.PLOT_CACHE_DIR, f"{name}.png")
+        with open(cached_path, "wb") as file:
+            file.write(b"\0" * 100)
+        os.utime(cached_path, (1000 + i, 1000 + i))
+
+    assert plotter.evict_plot_cache(250) == 1
+    assert sorted(os.listdir(plotter.const.PLOT_CACHE_DIR)) == ["mid.png", "new.png"]
+    assert plotter.evict_plot_cache(1000) == 0
+
+
+def test_cache_write_errors_dont_fail_the_plot(data_dir, monkeypatch):
+    def render(**job):
+        return True
+
+    def store(*args):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(plotter, "plot_cache_max_bytes", 1000)
+    monkeypatch.setattr(plotter, "render_hbp_plot", render)
+    monkeypatch.setattr(plotter, "store_cached_plot", store)
+    assert plotter.run_hbp_plot_job(make_job())
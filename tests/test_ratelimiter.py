@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from src.multiball.libmb import ratelimiter
+from src.multiball.libmb.ratelimiter import TokenBucket
+
+
+class FakeClock:
+    """Stands in for time.monotonic() and time.sleep()."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now = self.now + seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(ratelimiter.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(ratelimiter.time, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def test_zero_rate_never_waits(clock):
+    bucket = TokenBucket(0)
+    assert all(bucket.acquire() == 0.0 for _ in range(100))
+    assert clock.now == 100.0
+
+
+def test_bursts_up_to_capacity_then_waits(clock):
+    bucket = TokenBucket(2.0, capacity=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(100.5)
+
+
+def test_tokens_pile_up_no_higher_than_capacity(clock):
+    bucket = TokenBucket(1.0, capacity=2)
+    bucket.acquire(2)
+    clock.sleep(60)
+    assert bucket.acquire(2) == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.multiball.libmb import func_statcast as sc
+
+
+def make_export():
+    #fmt: off
+    return pd.DataFrame({
+        "game_pk"      : [1, 1, 1, 2],
+        "game_date"    : ["2024-04-01"] * 4,
+        "pitcher"      : [10, 10, 11, 12],
+        "batter"       : [20, 21, 22, 23],
+        "events"       : [None, "hit_by_pitch", "triple", "single"],
+        "at_bat_number": [1, 1, 2, 5],
+        "pitch_number" : [1, 2, 4, 1],
+        "extra"        : ["x"] * 4,
+    })
+    #fmt: on
+
+
+def test_filter_statcast_events_keeps_mode_events():
+    events = sc.filter_statcast_events(make_export(), ["hbp", "triples"])
+    assert list(events["event"]) == ["Hit By Pitch", "Triple"]
+    assert list(events["mode"]) == ["hbp", "triples"]
+
+
+def test_add_play_ids_builds_stand_ins():
+    events = sc.add_play_ids(make_export())
+    assert list(events["play_id"]) == ["1-1-1", "1-1-2", "1-2-4", "2-5-1"]
+
+
+def test_add_play_ids_keeps_savant_ids():
+    export = make_export()
+    export["play_id"] = ["uuid-a", None, "uuid-c", None]
+    events = sc.add_play_ids(export)
+    assert list(events["play_id"]) == ["uuid-a", "1-1-2", "uuid-c", "2-5-1"]
+
+
+def test_compute_end_speed_matches_the_trajectory():
+    #fmt: off
+    events = pd.DataFrame({
+        "vx0": [0.0], "vy0": [-130.0], "vz0": [0.0],
+        "ax" : [0.0], "ay" : [28.0],   "az" : [0.0],
+    })
+    #fmt: on
+    vy_f = math.sqrt(130.0**2 - 2.0 * 28.0 * (sc.STATCAST_Y0 - sc.STATCAST_PLATE_Y))
+    expected = round(vy_f * sc.FT_PER_SEC_TO_MPH, 1)
+    assert sc.compute_end_speed(events).iloc[0] == pytest.approx(expected)
+
+
+def test_compute_end_speed_without_trajectory_is_nan():
+    end_speed = sc.compute_end_speed(pd.DataFrame({"vx0": [1.0]}))
+    assert np.isnan(end_speed.iloc[0])
+
+
+def test_read_statcast_export_chunks_csv(tmp_path):
+    csv_path = tmp_path / "export.csv"
+    make_export().to_csv(csv_path, index=False)
+
+    chunks = list(sc.read_statcast_export(str(csv_path), 3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert "extra" not in chunks[0].columns
+
+
+def test_read_statcast_export_chunks_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "export.parquet"
+    pd.concat([make_export()] * 3).to_parquet(parquet_path, row_group_size=5)
+
+    chunks = list(sc.read_statcast_export(str(parquet_path), 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4]
+    assert "extra" not in chunks[0].columns
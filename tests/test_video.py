@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+import os
+
+from src.multiball.libmb import func_baseball as bb
+from src.multiball.libmb import func_database as dbmgr
+
+
+def make_mp4(moov_size=100):
+    """A tiny file with the top-level box layout of an MP4: ftyp, then moov."""
+    ftyp = (16).to_bytes(4, "big") + b"ftyp" + b"isom" + b"\0" * 4
+    moov = moov_size.to_bytes(4, "big") + b"moov" + b"\0" * (moov_size - 8)
+    return ftyp + moov
+
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+## -------------------------------------------------------------------------- ##
+## is_complete_mp4()
+## -------------------------------------------------------------------------- ##
+
+
+def test_is_complete_mp4_accepts_whole_file(tmp_path):
+    video_path = str(tmp_path / "whole.mp4")
+    write_file(video_path, make_mp4())
+    assert bb.is_complete_mp4(video_path)
+
+
+def test_is_complete_mp4_rejects_truncated_file(tmp_path):
+    video_path = str(tmp_path / "short.mp4")
+    write_file(video_path, make_mp4()[:60])
+    assert not bb.is_complete_mp4(video_path)
+
+
+def test_is_complete_mp4_needs_moov(tmp_path):
+    video_path = str(tmp_path / "no_moov.mp4")
+    write_file(video_path, make_mp4()[:16])
+    assert not bb.is_complete_mp4(video_path)
+
+
+def test_is_complete_mp4_reads_64_bit_sizes(tmp_path):
+    video_path = str(tmp_path / "large.mp4")
+    mdat = (1).to_bytes(4, "big") + b"mdat" + (24).to_bytes(8, "big") + b"\0" * 8
+    write_file(video_path, make_mp4() + mdat)
+    assert bb.is_complete_mp4(video_path)
+
+
+## -------------------------------------------------------------------------- ##
+## find_partial_videos()
+## -------------------------------------------------------------------------- ##
+
+
+def test_find_partial_videos_retires_truncated_store_copy(data_dir):
+    write_file(bb.get_shared_video_path("A"), make_mp4()[:60])
+    bb.link_shared_video("hbp", 1, "A")
+
+    assert bb.find_partial_videos("hbp") == [(1, "A")]
+    shared_video_path = bb.get_shared_video_path("A")
+    assert not os.path.exists(shared_video_path)
+    assert os.path.exists(shared_video_path + ".part")
+    assert not os.path.exists(bb.get_video_path("hbp", 1, "A"))
+
+
+def test_find_partial_videos_relinks_complete_store_copy(data_dir):
+    write_file(bb.get_shared_video_path("B"), make_mp4())
+    write_file(bb.get_video_path("hbp", 2, "B") + ".part", b"partial")
+
+    assert bb.find_partial_videos("hbp") == []
+    video_file_path = bb.get_video_path("hbp", 2, "B")
+    assert os.path.samefile(video_file_path, bb.get_shared_video_path("B"))
+    assert not os.path.exists(video_file_path + ".part")
+    assert not os.path.exists(bb.get_shared_video_path("B") + ".part")
+
+
+def test_find_partial_videos_checks_store_mp4s(data_dir):
+    dbmgr.create_database("hbp")
+    dbmgr.bulk_insert_rows(
+        "hbp",
+        [
+            {
+                "play_id": "C",
+                "game_pk": 3,
+                "game_date": "2025-05-01",
+                "pitcher_id": 1,
+                "batter_id": 2,
+            }
+        ],
+    )
+    write_file(bb.get_shared_video_path("C"), make_mp4()[:60])
+    ## Another mode's bad download isn't this mode's to fix.
+    write_file(bb.get_shared_video_path("D"), make_mp4()[:60])
+
+    assert bb.find_partial_videos("hbp") == [(3, "C")]
+    assert os.path.exists(bb.get_shared_video_path("C") + ".part")
+    assert os.path.exists(bb.get_shared_video_path("D"))
+
+
+def test_find_partial_videos_skips_badly_named_files(data_dir):
+    video_dir = bb.get_video_dir("hbp")
+    write_file(os.path.join(video_dir, "nounderscore.mp4"), b"junk")
+    write_file(os.path.join(video_dir, "abc_def.mp4.part"), b"junk")
+
+    assert bb.find_partial_videos("hbp") == []
+    assert sorted(os.listdir(video_dir)) == ["abc_def.mp4.part", "nounderscore.mp4"]
+
+
+def test_find_partial_videos_dry_run_leaves_files_alone(data_dir):
+    write_file(bb.get_shared_video_path("A"), make_mp4()[:60])
+    bb.link_shared_video("hbp", 1, "A")
+    write_file(bb.get_shared_video_path("B"), make_mp4())
+    write_file(bb.get_video_path("hbp", 2, "B") + ".part", b"partial")
+    before = sorted(os.listdir(bb.get_video_dir("hbp")))
+
+    assert bb.find_partial_videos("hbp", dry_run=True) == [(1, "A")]
+    assert sorted(os.listdir(bb.get_video_dir("hbp"))) == before
+    assert os.path.exists(bb.get_shared_video_path("A"))
+
+
+## -------------------------------------------------------------------------- ##
+## Shared video store
+## -------------------------------------------------------------------------- ##
+
+
+def test_retire_shared_video_never_keeps_both(data_dir):
+    shared_video_path = bb.get_shared_video_path("E")
+    write_file(shared_video_path, b"bad")
+    write_file(shared_video_path + ".part", b"prefix")
+
+    bb.retire_shared_video("E")
+    assert not os.path.exists(shared_video_path)
+    with open(shared_video_path + ".part", "rb") as file:
+        assert file.read() == b"prefix"
+
+
+def test_relink_shared_video_follows_replaced_copy(data_dir):
+    shared_video_path = bb.get_shared_video_path("F")
+    write_file(shared_video_path, b"big" * 10)
+    bb.link_shared_video("hbp", 6, "F")
+    bb.link_shared_video("derp", 6, "F")
+    old_stat = os.stat(shared_video_path)
+
+    ## What a transcode does to the shared copy.
+    write_file(shared_video_path + ".new", b"small")
+    os.replace(shared_video_path + ".new", shared_video_path)
+
+    assert sorted(bb.relink_shared_video(6, "F", old_stat)) == ["derp", "hbp"]
+    for mode in ["derp", "hbp"]:
+        assert os.path.samefile(bb.get_video_path(mode, 6, "F"), shared_video_path)